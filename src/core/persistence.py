@@ -24,7 +24,7 @@ from datetime import datetime
 from src.utils.logger import get_logger
 from src.utils import (
     build_column_list, normalize_to_list,
-    ensure_directory, save_json, load_json,
+    ensure_directory, save_json_many, load_json,
     log_file_operation, log_data_shape
 )
 from src.core.context import GabedaContext
@@ -190,9 +190,8 @@ def save_context_state(
 
         metadata['dataset_dtypes'][dataset_name] = dtype_info
 
-    # Save metadata JSON
+    # Metadata JSON is written with config/history below
     metadata_path = state_dir / 'context_metadata.json'
-    save_json(metadata, metadata_path, logger=logger)
 
     # 3. Save configuration
     config_path = state_dir / 'config.json'
@@ -205,14 +204,17 @@ def save_context_state(
         else:
             serializable_cfg[key] = str(value)
 
-    with open(config_path, 'w') as f:
-        json.dump(serializable_cfg, f, indent=2)
-    logger.debug(f"Saved config: {config_path}")
-
     # 4. Save execution history
     history_path = state_dir / 'execution_history.json'
-    with open(history_path, 'w') as f:
-        json.dump(ctx.history, f, indent=2)
+
+    # Write config + history (and metadata above) as one batch; save_json_many
+    # serializes with stdlib json, so NaN stays NaN and non-JSON values raise
+    save_json_many([
+        (metadata_path, metadata),
+        (config_path, serializable_cfg),
+        (history_path, ctx.history),
+    ], logger=logger)
+    logger.debug(f"Saved config: {config_path}")
     logger.debug(f"Saved execution history: {history_path}")
 
     logger.info(f"✓ Context state saved successfully")
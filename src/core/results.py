@@ -65,6 +65,36 @@ class OperationResult:
     warnings: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def failure(cls, error: str, metadata: Optional[Dict[str, Any]] = None) -> 'OperationResult':
+        """
+        Build a failed result with its error already populated.
+
+        Args:
+            error: Error message
+            metadata: Optional metadata dict (used as-is, not copied)
+
+        Returns:
+            OperationResult with success=False and errors=[error]
+        """
+        return cls(success=False, errors=[error], metadata=metadata if metadata is not None else {})
+
+    @classmethod
+    def ok(cls, data: Optional[Any] = None) -> 'OperationResult':
+        """
+        Build a successful result.
+
+        Always returns a new instance: results are mutable (add_error,
+        add_warning), so a shared success object is not safe to hand out.
+
+        Args:
+            data: Optional result data
+
+        Returns:
+            OperationResult with success=True
+        """
+        return cls(success=True, data=data)
+
     def add_error(self, error: str) -> None:
         """Add error and mark as failed"""
         self.errors.append(error)
@@ -8,9 +8,11 @@ Single Responsibility: Calculate feature values ONLY
 - Does NOT orchestrate execution flow
 """
 
+import dis
 import numpy as np
 import pandas as pd
-from typing import Callable, List, Any
+from functools import lru_cache
+from typing import Callable, List, Any, Optional
 from collections import Counter
 from src.utils.logger import get_logger
 from src.core import constants
@@ -55,6 +57,28 @@ FEATURE_FUNCTION_GLOBALS = {
 }
 
 
+# Bookkeeping opcodes that don't affect what a function returns
+_NO_OP_INSTRUCTIONS = frozenset({'RESUME', 'NOP', 'CACHE', 'COPY_FREE_VARS', 'MAKE_CELL'})
+
+
+@lru_cache(maxsize=1024)
+def _passthrough_position(code) -> Optional[int]:
+    """
+    Position of the argument a function returns unchanged, or None
+
+    Matches bodies that are exactly `return <positional arg>` (e.g. the
+    `in_quantity` style input features), keyed by code object so features
+    re-compiled from the same source share one entry.
+    """
+    ops = [ins for ins in dis.get_instructions(code) if ins.opname not in _NO_OP_INSTRUCTIONS]
+    if len(ops) != 2 or not ops[0].opname.startswith('LOAD_FAST') or ops[1].opname != 'RETURN_VALUE':
+        return None
+
+    positional = code.co_varnames[:code.co_argcount]
+    name = ops[0].argval
+    return positional.index(name) if name in positional else None
+
+
 class FeatureCalculator:
     """
     Calculates feature values.
@@ -124,10 +148,20 @@ class FeatureCalculator:
             numpy array with one value per row
 
         CRITICAL: Uses np.vectorize to apply function row-by-row
+        (pass-through features that just return one argument copy it instead)
         """
         logger.info(f"Calculating FILTER: {feature_name} with {len(args_data)} args")
         logger.debug(f"  Args shapes: {[np.array(a).shape for a in args_data]}")
 
+        # Pass-through: same values np.vectorize would produce, without a
+        # Python call per row
+        code = getattr(func, '__code__', None)
+        position = _passthrough_position(code) if code is not None else None
+        if position is not None and position < len(args_data):
+            result = np.array(np.broadcast_arrays(*args_data)[position])
+            logger.debug(f"  Pass-through of arg {position}, result shape: {result.shape}")
+            return result
+
         # Inject required globals (for compiled functions from feature_store)
         func = self.inject_globals_into_function(func)
 
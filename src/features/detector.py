@@ -6,12 +6,38 @@ Single Responsibility: Detect feature types ONLY
 - Does NOT store features, resolve dependencies, or execute features
 """
 
-from typing import Callable, Union
-from inspect import getsource
+from functools import lru_cache
+from typing import Callable, Optional, Tuple, Union
+from inspect import getsource, unwrap
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Source lookups and keyword scans are memoized at module level, so fresh
+# detector instances (one per model/test run) reuse earlier results.
+_CACHE_MAX_SIZE = 1024
+
+
+@lru_cache(maxsize=_CACHE_MAX_SIZE)
+def _code_source(filename: str, code) -> Optional[str]:
+    """Source text for a code object, or None if unavailable (keyed by code so
+    closures re-created from the same definition share one entry)
+
+    The file is part of the key: code equality ignores co_filename and
+    comments, and the #agg/#gby markers live in comments.
+    """
+    try:
+        return getsource(code)
+    except (OSError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=_CACHE_MAX_SIZE)
+def _has_keyword(feature_text: str, keywords: Tuple[str, ...]) -> bool:
+    """Case-insensitive check for any of the (lowercased) keywords"""
+    feature_text_lower = feature_text.lower()
+    return any(keyword in feature_text_lower for keyword in keywords)
+
 
 class FeatureTypeDetector:
     """
@@ -71,22 +97,27 @@ class FeatureTypeDetector:
         """
         # Convert callable to source code string
         if callable(feature_def):
-            try:
-                feature_text = getsource(feature_def)
-            except (OSError, TypeError):
+            # getsource follows __wrapped__, so key on the unwrapped code
+            code = getattr(unwrap(feature_def), '__code__', None)
+            if code is not None:
+                feature_text = _code_source(code.co_filename, code)
+            else:
+                try:
+                    feature_text = getsource(feature_def)
+                except (OSError, TypeError):
+                    feature_text = None
+
+            if feature_text is None:
                 # If source not available, assume no aggregation
                 logger.warning(f"Could not get source for {feature_def}, assuming no aggregation")
                 return False
         else:
             feature_text = str(feature_def)
 
-        # Case-insensitive search
-        feature_text_lower = feature_text.lower()
-
-        # Check for any aggregation keyword
-        has_aggregation = any(
-            keyword.lower() in feature_text_lower
-            for keyword in self.AGGREGATION_KEYWORDS
+        # Check for any aggregation keyword (case-insensitive)
+        has_aggregation = _has_keyword(
+            feature_text,
+            tuple(keyword.lower() for keyword in self.AGGREGATION_KEYWORDS)
         )
 
         if has_aggregation:
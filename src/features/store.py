@@ -10,14 +10,15 @@ Single Responsibility: Store and retrieve features ONLY
 
 import json
 import inspect
+import os
 import numpy as np
 import pandas as pd
 from collections import Counter
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 from pathlib import Path
 from src.utils.logger import get_logger
 from src.utils import (
-    ensure_directory, save_json, load_json,
+    ensure_directory, save_json, save_json_many, load_json,
     log_file_operation, log_operation_complete, log_count_summary
 )
 from src.core import constants
@@ -128,8 +129,7 @@ class FeatureStore:
         if auto_save:
             target = f"model '{model_name}'" if model_name else "'common' (shared features)"
             logger.info(f"Auto-saving {len(features)} features for {target}")
-            for name, feature_def in features.items():
-                self.save_to_filesystem(name, feature_def, model_name)
+            self.save_many_to_filesystem(features, model_name)
 
     def store_feature(self, name: str, feature_def: Any, model: Optional[str] = None) -> None:
         """
@@ -206,17 +206,89 @@ class FeatureStore:
             ValueError: If storage_type is not 'local'
             RuntimeError: If unable to extract function source code
         """
+        self._check_local_storage('save_to_filesystem')
+
+        feature_file, source_code, metadata_file, metadata = self._prepare_feature_files(
+            feature_name, feature_def, model_name
+        )
+
+        # Save feature code
+        ensure_directory(feature_file.parent, logger=logger)
+        with open(feature_file, 'w', encoding='utf-8') as f:
+            f.write(source_code)
+
+        # Save metadata
+        save_json(metadata, metadata_file, logger=logger, skip_parent_check=True)
+
+        location = f"common/{feature_name}" if not model_name else f"{model_name}/{feature_name}"
+        logger.info(f"Saved feature '{feature_name}' to {self.base_path}/{location}")
+
+    def save_many_to_filesystem(
+        self,
+        features: Dict[str, Any],
+        model_name: Optional[str] = None
+    ) -> None:
+        """
+        Save several features to the filesystem in one batch.
+
+        Same directory structure as save_to_filesystem. Every feature is
+        serialized before anything is written, so a feature whose source
+        can't be extracted fails the batch without leaving partial output,
+        and all metadata.json files go through a single save_json_many call.
+
+        Args:
+            features: Dict of feature_name -> function or dict with 'udf' and 'args'
+            model_name: Model name for organizing features. If None, saves to 'common' folder.
+
+        Raises:
+            ValueError: If storage_type is not 'local'
+            RuntimeError: If unable to extract function source code
+        """
+        self._check_local_storage('save_many_to_filesystem')
+
+        prepared = [
+            self._prepare_feature_files(name, feature_def, model_name)
+            for name, feature_def in features.items()
+        ]
+
+        for feature_file, source_code, _, _ in prepared:
+            ensure_directory(feature_file.parent, logger=logger)
+            with open(feature_file, 'w', encoding='utf-8') as f:
+                f.write(source_code)
+
+        save_json_many(
+            [(metadata_file, metadata) for _, _, metadata_file, metadata in prepared],
+            logger=logger
+        )
+
+        target_folder = model_name if model_name else self.common_folder
+        logger.info(f"Saved {len(prepared)} features to {self.base_path}/{target_folder}")
+
+    def _check_local_storage(self, method: str) -> None:
+        """Raise ValueError unless the store is configured for local storage."""
         if self.storage_type != 'local':
             raise ValueError(
-                f"save_to_filesystem only supports 'local' storage type, got '{self.storage_type}'. "
+                f"{method} only supports 'local' storage type, got '{self.storage_type}'. "
                 "For remote storage, implement a separate save method."
             )
 
+    def _prepare_feature_files(
+        self,
+        feature_name: str,
+        feature_def: Any,
+        model_name: Optional[str] = None
+    ) -> Tuple[Path, str, Path, Dict[str, Any]]:
+        """
+        Resolve a feature's file paths, source code and metadata (nothing is written).
+
+        Returns:
+            (feature_file, source_code, metadata_file, metadata)
+        """
         # Determine target folder (model-specific or common)
         target_folder = model_name if model_name else self.common_folder
 
         # Build directory structure
-        feature_dir = ensure_directory(Path(self.base_path) / target_folder / feature_name, logger=logger)
+        feature_dir = Path(self.base_path) / target_folder / feature_name
         feature_file = feature_dir / f"{feature_name}.py"
         metadata_file = feature_dir / "metadata.json"
 
@@ -263,11 +335,7 @@ class FeatureStore:
                 f"Feature '{feature_name}' must be a callable or dict with 'udf', got {type(feature_def)}"
             )
 
-        # Save feature code
-        with open(feature_file, 'w', encoding='utf-8') as f:
-            f.write(source_code)
-
-        # Save metadata
+        # Feature metadata
         metadata = {
             'feature_name': feature_name,
             'model_name': model_name if model_name else self.common_folder,
@@ -277,10 +345,7 @@ class FeatureStore:
             'base_path': self.base_path
         }
 
-        save_json(metadata, metadata_file, logger=logger)
-
-        location = f"common/{feature_name}" if not model_name else f"{model_name}/{feature_name}"
-        logger.info(f"Saved feature '{feature_name}' to {self.base_path}/{location}")
+        return feature_file, source_code, metadata_file, metadata
 
     def load_from_filesystem(self, model: str, feature: str, base_path: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -325,23 +390,11 @@ class FeatureStore:
             else:
                 logger.info(f"Loading feature '{feature}' from common folder (shared feature)")
 
-        # Read feature function code
-        if not feature_file.exists():
-            raise FileNotFoundError(f"Feature file not found: {feature_file}")
-
-        with open(feature_file, 'rb') as f:
-            udf_code = f.read().decode('utf-8')
-
         # Read metadata
         if not metadata_file.exists():
             raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
 
-        metadata = load_json(metadata_file, logger=logger)
-
-        feature_def = {
-            'udf': udf_code,
-            'args': metadata.get('args', [])
-        }
+        feature_def = self._read_feature_files(feature_file, metadata_file)
 
         # Store it with model context
         self.store_feature(feature, feature_def, model=model)
@@ -349,6 +402,18 @@ class FeatureStore:
 
         return feature_def
 
+    def _read_feature_files(self, feature_file: Path, metadata_file: Path) -> Dict[str, Any]:
+        """Read a saved feature's code and metadata into a {'udf', 'args'} definition."""
+        with open(feature_file, 'rb') as f:
+            udf_code = f.read().decode('utf-8')
+
+        metadata = load_json(metadata_file, logger=logger)
+
+        return {
+            'udf': udf_code,
+            'args': metadata.get('args', [])
+        }
+
     def get_feature_index(self, model: str, base_path: Optional[str] = None) -> list:
         """
         Get list of available features for a model from filesystem.
@@ -376,12 +441,11 @@ class FeatureStore:
             self.feature_index[model] = []
             return []
 
-        # Get subdirectories (each is a feature)
+        # Get subdirectories (each is a feature); scandir entries know their
+        # type without an extra stat per entry
         try:
-            feature_names = [
-                d.name for d in model_path.iterdir()
-                if d.is_dir()
-            ]
+            with os.scandir(model_path) as entries:
+                feature_names = [entry.name for entry in entries if entry.is_dir()]
             self.feature_index[model] = feature_names
             log_count_summary(logger, f"features in model '{model}'", len(feature_names),
                             items=feature_names)
@@ -416,11 +480,18 @@ class FeatureStore:
             logger.info("No common features found")
             return 0
 
-        # Load each common feature
+        # Load each common feature straight from its folder (the index already
+        # found it, so skip load_from_filesystem's lookup and existence checks)
+        common_path = Path(base_path) / self.common_folder
         loaded_count = 0
         for feature_name in common_features:
             try:
-                self.load_from_filesystem(self.common_folder, feature_name, base_path)
+                feat_path = common_path / feature_name
+                feature_def = self._read_feature_files(
+                    feat_path / f"{feature_name}.py", feat_path / "metadata.json"
+                )
+                self.store_feature(feature_name, feature_def, model=self.common_folder)
+                logger.info(f"Loaded feature '{feature_name}' from model '{self.common_folder}'")
                 loaded_count += 1
             except Exception as e:
                 logger.warning(f"Failed to load common feature '{feature_name}': {e}")
@@ -471,7 +542,7 @@ class FeatureStore:
         if 'ext_cols' in model_config:
             master_cfg['ext_cols'] = model_config['ext_cols']
 
-        save_json(master_cfg, master_cfg_file, logger=logger)
+        save_json(master_cfg, master_cfg_file, logger=logger, skip_parent_check=True)
         logger.info(f"Saved master_cfg.json for model '{model_name}'")
 
     def load_master_config(
@@ -7,7 +7,7 @@ Single Responsibility: Load data from various sources ONLY
 """
 
 import pandas as pd
-from typing import Union
+from typing import Optional, Sequence, Union
 from pathlib import Path
 from src.utils.logger import get_logger
 from src.utils import log_file_operation, log_data_shape
@@ -58,18 +58,31 @@ class DataLoader:
         else:
             raise ValueError(f"Unsupported file type: {source_path.suffix}")
 
-    def load_csv(self, path: Union[str, Path]) -> pd.DataFrame:
+    def load_csv(
+        self,
+        path: Union[str, Path],
+        usecols: Optional[Sequence[str]] = None,
+        nrows: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Load CSV file.
 
         Args:
             path: Path to CSV file
+            usecols: Optional subset of columns to read; other columns are
+                skipped by the parser instead of loaded and dropped later.
+                Names missing from the file are ignored, so required-column
+                validation can still report them.
+            nrows: Optional number of rows to read from the top of the file
+                (for samples; the rest of the file is never parsed)
 
         Returns:
             DataFrame with CSV data
         """
         logger.info(f"Loading CSV from: {path}")
-        df = pd.read_csv(path)
+        if usecols is not None:
+            usecols = set(usecols).__contains__
+        df = pd.read_csv(path, usecols=usecols, nrows=nrows)
         log_data_shape(logger, str(path), df, action='Loaded')
         return df
 
@@ -307,13 +307,11 @@ class DataValidator:
         """
         warnings = []
         cols_to_check = check_cols or df.columns.tolist()
+        present_cols = [col for col in cols_to_check if col in df.columns]
 
-        # Check for missing values
-        for col in cols_to_check:
-            if col not in df.columns:
-                continue
-
-            missing_count = df[col].isna().sum()
+        # Check for missing values (one isna pass over all checked columns)
+        missing_counts = df[present_cols].isna().sum()
+        for col, missing_count in missing_counts.items():
             if missing_count > 0:
                 missing_pct = (missing_count / len(df)) * 100
                 warning_msg = f"Column '{col}' has {missing_count} ({missing_pct:.1f}%) missing values"
@@ -2,7 +2,7 @@
 Utilities package for GabeDA Analytics.
 """
 
-from src.utils.logger import setup_logging, get_logger, get_current_level
+from src.utils.logger import setup_logging, get_logger, get_current_level, install_async_logging
 from src.utils.dict_utils import (
     safe_get,
     normalize_to_list,
@@ -20,10 +20,14 @@ from src.utils.file_utils import (
     path_exists,
     find_matching_dirs,
     save_json,
+    save_json_many,
     load_json,
+    load_json_key,
+    peek_json_valid,
     safe_file_operation,
     get_file_size,
     normalize_path,
+    invalidate_path_cache,
 )
 from src.utils.column_utils import (
     select_columns_safe,
@@ -47,6 +51,8 @@ from src.utils.log_utils import (
     log_count_summary,
     log_model_execution,
     log_progress,
+    snapshot_levels,
+    operation_scope,
     STATUS_SUCCESS,
     STATUS_WARNING,
     STATUS_ERROR,
@@ -62,6 +68,9 @@ from src.utils.validation_utils import (
 )
 from src.utils.error_utils import (
     safe_execute,
+    safe_execute_1arg,
+    make_safe,
+    SafeExecutor,
     error_context,
     create_error_result,
     handle_file_error,
@@ -75,6 +84,7 @@ __all__ = [
     'setup_logging',
     'get_logger',
     'get_current_level',
+    'install_async_logging',
     # Dictionary utilities
     'safe_get',
     'normalize_to_list',
@@ -91,10 +101,14 @@ __all__ = [
     'path_exists',
     'find_matching_dirs',
     'save_json',
+    'save_json_many',
     'load_json',
+    'load_json_key',
+    'peek_json_valid',
     'safe_file_operation',
     'get_file_size',
     'normalize_path',
+    'invalidate_path_cache',
     # Column utilities
     'select_columns_safe',
     'filter_columns',
@@ -116,6 +130,8 @@ __all__ = [
     'log_count_summary',
     'log_model_execution',
     'log_progress',
+    'snapshot_levels',
+    'operation_scope',
     'STATUS_SUCCESS',
     'STATUS_WARNING',
     'STATUS_ERROR',
@@ -129,6 +145,9 @@ __all__ = [
     'validate_all',
     # Error utilities
     'safe_execute',
+    'safe_execute_1arg',
+    'make_safe',
+    'SafeExecutor',
     'error_context',
     'create_error_result',
     'handle_file_error',
@@ -74,11 +74,17 @@ def select_columns_safe(df: pd.DataFrame,
         df_to_save = select_columns_safe(df, cols_to_save, missing_ok=False)
     """
     if missing_ok:
-        # Select only available columns
-        available = [col for col in columns if col in df.columns]
-        missing = [col for col in columns if col not in df.columns]
+        # Select only available columns (single pass; missing only tracked for logging)
+        col_set = set(df.columns)
+        available = []
+        missing = []
+        for col in columns:
+            if col in col_set:
+                available.append(col)
+            elif logger:
+                missing.append(col)
 
-        if missing and logger:
+        if missing:
             logger.warning(f"Columns not found (skipped): {missing}")
 
         return df[available].copy() if available else pd.DataFrame()
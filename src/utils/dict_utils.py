@@ -26,6 +26,12 @@ Does NOT:
 from typing import Dict, Any, List, Optional, Union
 import logging
 
+# Sentinel distinguishing "key absent" from "key present with value None"
+_MISSING = object()
+
+# Above this combined size, copy()+update() allocates less than a {**a, **b} splat
+_SPLAT_MERGE_MAX_KEYS = 1024
+
 
 def safe_get(d: Dict, key: str, default: Any = None,
              logger: Optional[logging.Logger] = None,
@@ -52,10 +58,14 @@ def safe_get(d: Dict, key: str, default: Any = None,
         >>> safe_get(config, 'missing', warn_missing=True, logger=my_logger)
         # Logs warning and returns None
     """
-    value = d.get(key, default)
+    if not warn_missing:
+        return d.get(key, default)
 
-    if value is None and warn_missing and logger:
-        logger.warning(f"Key '{key}' not found in dictionary, using default: {default}")
+    value = d.get(key, _MISSING)
+    if value is _MISSING:
+        if logger:
+            logger.warning(f"Key '{key}' not found in dictionary, using default: {default}")
+        return default
 
     return value
 
@@ -142,6 +152,9 @@ def merge_dicts(base: Dict, updates: Dict, mutate: bool = False) -> Dict:
     if mutate:
         base.update(updates)
         return base
+    elif len(base) + len(updates) < _SPLAT_MERGE_MAX_KEYS:
+        # Single dict construction - faster for typical (small) config merges
+        return {**base, **updates}
     else:
         result = base.copy()
         result.update(updates)
@@ -25,11 +25,35 @@ Does NOT:
 """
 
 from typing import Callable, Any, Optional, Dict
-from contextlib import contextmanager
 import logging
 from src.core.results import OperationResult
 
 
+# Returned by _try_int_fast_path when the input needs the full int() parser
+_NO_FAST_PATH = object()
+
+
+def _try_int_fast_path(s: str, default: Any) -> Any:
+    """
+    Parse a plain decimal string without raising.
+
+    Returns int(s) for '[ws][sign]digits[ws]', default for strings int() is
+    certain to reject, and _NO_FAST_PATH for anything else (e.g. '1_000').
+    """
+    body = s.strip()
+    if body[:1] in ('-', '+'):
+        body = body[1:]
+    if body.isdecimal():
+        try:
+            return int(s)
+        except ValueError:
+            # e.g. more digits than sys.get_int_max_str_digits() allows
+            return default
+    if '_' in body:
+        return _NO_FAST_PATH
+    return default
+
+
 def safe_execute(func: Callable,
                 *args,
                 default: Any = None,
@@ -65,21 +89,128 @@ def safe_execute(func: Callable,
         return default
 
 
-@contextmanager
-def error_context(operation: str,
+def safe_execute_1arg(func: Callable,
+                     arg: Any,
+                     default: Any = None,
+                     logger: Optional[logging.Logger] = None,
+                     context: str = "") -> Any:
+    """
+    Single-argument variant of safe_execute.
+
+    Avoids building the *args tuple and **kwargs dict on every call, which
+    dominates the cost when wrapping cheap callables like int or float.
+
+    Args:
+        func: Function to execute with one positional argument
+        arg: The argument
+        default: Default value to return on error
+        logger: Optional logger for error messages
+        context: Context description for error messages
+
+    Returns:
+        Function result or default value on error
+
+    Examples:
+        >>> safe_execute_1arg(int, '123', 0)
+        123
+        >>> safe_execute_1arg(int, 'abc', 0)
+        0
+    """
+    try:
+        return func(arg)
+    except Exception as e:
+        if logger:
+            logger.error(f"{context}: {e}" if context else str(e))
+        return default
+
+
+def make_safe(func: Callable,
+              default: Any = None,
+              logger: Optional[logging.Logger] = None,
+              context: str = "") -> Callable:
+    """
+    Pre-bind safe_execute options to a function for reuse in loops.
+
+    Args:
+        func: Function to wrap
+        default: Default value to return on error
+        logger: Optional logger for error messages
+        context: Context description for error messages
+
+    Returns:
+        Callable with func's signature that returns default instead of raising
+
+    Examples:
+        >>> parse_qty = make_safe(int, default=0, logger=logger, context='Parsing quantity')
+        >>> quantities = [parse_qty(v) for v in raw_values]
+    """
+    def _safe(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if logger:
+                logger.error(f"{context}: {e}" if context else str(e))
+            return default
+
+    return _safe
+
+
+class SafeExecutor:
+    """
+    Reusable safe_execute with logger/context/default bound once.
+
+    Args:
+        logger: Optional logger for error messages
+        context: Context description for error messages
+        default: Default value to return on error
+
+    Examples:
+        >>> run = SafeExecutor(logger=logger, context='Parsing rows', default=None)
+        >>> parsed = [run(parse_row, row) for row in rows]
+        >>> quantities = [run.call_one(int, v) for v in raw_quantities]
+    """
+
+    __slots__ = ('logger', 'context', 'default')
+
+    def __init__(self,
                  logger: Optional[logging.Logger] = None,
-                 raise_on_error: bool = True):
+                 context: str = "",
+                 default: Any = None):
+        self.logger = logger
+        self.context = context
+        self.default = default
+
+    def __call__(self, func: Callable, *args, **kwargs) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            return self._handle(e)
+
+    def call_one(self, func: Callable, arg: Any) -> Any:
+        """Single-argument call without *args/**kwargs packing."""
+        try:
+            return func(arg)
+        except Exception as e:
+            return self._handle(e)
+
+    def _handle(self, error: Exception) -> Any:
+        if self.logger:
+            self.logger.error(f"{self.context}: {error}" if self.context else str(error))
+        return self.default
+
+
+class ErrorContext:
     """
     Context manager for consistent error handling.
 
+    Implemented as a class rather than @contextmanager to avoid allocating a
+    generator and wrapper object on every with-block entry.
+
     Args:
         operation: Operation description
         logger: Optional logger
         raise_on_error: If True, re-raise errors; if False, suppress
 
-    Yields:
-        None
-
     Examples:
         >>> with error_context('Loading data', logger=logger):
         ...     df = pd.read_csv('data.csv')
@@ -94,14 +225,33 @@ def error_context(operation: str,
         with error_context('Optional operation', logger=logger, raise_on_error=False):
             optional_operation()
     """
-    try:
-        yield
-    except Exception as e:
-        error_msg = f"Error in {operation}: {e}"
-        if logger:
-            logger.error(error_msg)
-        if raise_on_error:
-            raise
+
+    __slots__ = ('operation', 'logger', 'raise_on_error')
+
+    def __init__(self,
+                 operation: str,
+                 logger: Optional[logging.Logger] = None,
+                 raise_on_error: bool = True):
+        self.operation = operation
+        self.logger = logger
+        self.raise_on_error = raise_on_error
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # Only Exception subclasses are handled; KeyboardInterrupt etc. propagate
+        if exc_type is None or not issubclass(exc_type, Exception):
+            return False
+
+        if self.logger:
+            self.logger.error(f"Error in {self.operation}: {exc}")
+
+        return not self.raise_on_error
+
+
+# Function-style name kept for existing call sites
+error_context = ErrorContext
 
 
 def create_error_result(error: Exception,
@@ -126,14 +276,8 @@ def create_error_result(error: Exception,
         >>> result.success  # False
         >>> result.errors  # ['Data loading failed: [error]']
     """
-    result = OperationResult(success=False)
-    result.add_error(f"{operation} failed: {str(error)}")
-
-    if context:
-        result.metadata.update(context)
-        result.metadata['error_type'] = type(error).__name__
-
-    return result
+    metadata = {**context, 'error_type': type(error).__name__} if context else None
+    return OperationResult.failure(f"{operation} failed: {error}", metadata)
 
 
 def handle_file_error(error: Exception,
@@ -156,9 +300,8 @@ def handle_file_error(error: Exception,
         ... except Exception as e:
         ...     handle_file_error(e, 'missing.txt', 'read', logger)
     """
-    error_msg = f"Failed to {operation} file '{path}': {error}"
     if logger:
-        logger.error(error_msg)
+        logger.error("Failed to %s file '%s': %s", operation, path, error)
 
 
 def handle_data_error(error: Exception,
@@ -179,11 +322,15 @@ def handle_data_error(error: Exception,
         ...     df = process_data(raw_data)
         ... except Exception as e:
         ...     handle_data_error(e, 'Processing raw data', logger)
+
+    Note:
+        When many data errors are logged per batch, attach a
+        logging.handlers.QueueHandler to the logger (with a QueueListener
+        draining to the real handlers) so this call only enqueues the record.
     """
-    error_msg = f"Data error in {context}: {error}"
     if logger:
-        logger.error(error_msg)
-        logger.error(f"Error type: {type(error).__name__}")
+        # Single record (one pass through the handler chain) with lazy formatting
+        logger.error("Data error in %s: %s (type=%s)", context, error, type(error).__name__)
 
     if raise_after_log:
         raise
@@ -191,7 +338,9 @@ def handle_data_error(error: Exception,
 
 def try_or_none(func: Callable, *args, **kwargs) -> Optional[Any]:
     """
-    Execute function, return None on any error (silent).
+    Execute function, return None on error (silent).
+
+    KeyboardInterrupt/SystemExit are not swallowed.
 
     Args:
         func: Function to execute
@@ -207,15 +356,23 @@ def try_or_none(func: Callable, *args, **kwargs) -> Optional[Any]:
         >>> result = try_or_none(int, 'abc')
         >>> result  # None (no error logged)
     """
+    # LBYL fast path: int('abc') would raise and be caught, which is slow
+    if func is int and len(args) == 1 and not kwargs and type(args[0]) is str:
+        result = _try_int_fast_path(args[0], None)
+        if result is not _NO_FAST_PATH:
+            return result
+
     try:
         return func(*args, **kwargs)
-    except:
+    except Exception:
         return None
 
 
 def try_or_default(func: Callable, default: Any, *args, **kwargs) -> Any:
     """
-    Execute function, return default on any error (silent).
+    Execute function, return default on error (silent).
+
+    KeyboardInterrupt/SystemExit are not swallowed.
 
     Args:
         func: Function to execute
@@ -232,16 +389,26 @@ def try_or_default(func: Callable, default: Any, *args, **kwargs) -> Any:
         >>> result = try_or_default(int, 0, 'abc')
         >>> result  # 0
     """
+    # LBYL fast path: int('abc') would raise and be caught, which is slow
+    if func is int and len(args) == 1 and not kwargs and type(args[0]) is str:
+        result = _try_int_fast_path(args[0], default)
+        if result is not _NO_FAST_PATH:
+            return result
+
     try:
         return func(*args, **kwargs)
-    except:
+    except Exception:
         return default
 
 
 # Module-level exports
 __all__ = [
     'safe_execute',
+    'safe_execute_1arg',
+    'make_safe',
+    'SafeExecutor',
     'error_context',
+    'ErrorContext',
     'create_error_result',
     'handle_file_error',
     'handle_data_error',
@@ -27,10 +27,171 @@ Does NOT:
 - Validate data schemas (use validators)
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, Dict, Any, List, Optional, Callable
+from typing import Union, Dict, Any, List, Optional, Callable, Tuple
+import errno
+import fnmatch
 import json
 import logging
+import mmap
+import os
+import re
+import stat
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional (read-side speedup only) - fall back to stdlib json
+    orjson = None
+
+# Integers outside the 64-bit range have 19+ digits; orjson would load them as floats
+_WIDE_DIGIT_RUN = re.compile(rb'\d{19}')
+
+# Short-lived stat cache for repeated path_exists checks. Opt-in (set
+# AYNI_ENABLE_PATH_CACHE=1): only positive results are cached, and
+# ensure_path_exists/ensure_directory always hit the filesystem.
+_PATH_CACHE_ENABLED = os.environ.get('AYNI_ENABLE_PATH_CACHE', '').lower() in ('1', 'true', 'yes')
+_PATH_CACHE_MAX_SIZE = 1024
+_PATH_CACHE_TTL = 0.5  # seconds
+
+# Shared miss-path messages (see _not_found_error)
+_FILE_NOT_FOUND = "File not found"
+_DIR_NOT_FOUND = "Directory not found"
+_JSON_NOT_FOUND = "JSON file not found"
+
+# save_json_many writes batches of at least this size from a thread pool
+_PARALLEL_WRITE_MIN_ITEMS = 3
+_PARALLEL_WRITE_MAX_WORKERS = 8
+
+# O_BINARY prevents newline translation on Windows (0 elsewhere)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+_stat_cache: 'OrderedDict[str, Tuple[bool, bool, bool, float]]' = OrderedDict()
+_stat_cache_lock = threading.Lock()
+
+
+def _as_str(path: Union[str, Path]) -> str:
+    """Return path as a string without constructing a Path object."""
+    return path if isinstance(path, str) else os.fspath(path)
+
+
+@lru_cache(maxsize=512)
+def _to_path_cached(path_str: str) -> Path:
+    """Parse a path string once; Path objects are immutable so sharing is safe."""
+    return Path(path_str)
+
+
+def _as_path(path: Union[str, Path]) -> Path:
+    """Return path as a Path, reusing parsed Path objects for repeated strings."""
+    return _to_path_cached(path) if isinstance(path, str) else path
+
+
+def _stat_path(path_str: str) -> Tuple[bool, bool, bool]:
+    """Return (exists, is_file, is_dir) for path straight from the filesystem."""
+    try:
+        st_mode = os.stat(path_str).st_mode
+        return (True, stat.S_ISREG(st_mode), stat.S_ISDIR(st_mode))
+    except (OSError, ValueError):
+        return (False, False, False)
+
+
+def _cached_stat(path_str: str, ttl: float = _PATH_CACHE_TTL) -> Tuple[bool, bool, bool]:
+    """
+    Return (exists, is_file, is_dir) for path, reusing hits younger than ttl.
+
+    Misses are never cached, so a path created after a failed check is seen
+    immediately. Only used for read-only checks (path_exists).
+    """
+    if not _PATH_CACHE_ENABLED:
+        return _stat_path(path_str)
+
+    now = time.monotonic()
+    with _stat_cache_lock:
+        entry = _stat_cache.get(path_str)
+        if entry is not None and now - entry[3] < ttl:
+            _stat_cache.move_to_end(path_str)
+            return entry[:3]
+
+    result = _stat_path(path_str)
+
+    if result[0]:
+        with _stat_cache_lock:
+            _stat_cache[path_str] = result + (now,)
+            _stat_cache.move_to_end(path_str)
+            if len(_stat_cache) > _PATH_CACHE_MAX_SIZE:
+                _stat_cache.popitem(last=False)
+
+    return result
+
+
+def invalidate_path_cache(path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Drop cached existence results for a path (or all paths).
+
+    Args:
+        path: Path to invalidate; if None, clear the whole cache
+
+    Examples:
+        >>> external_tool_writes(output_file)
+        >>> invalidate_path_cache(output_file)
+        >>> path_exists(output_file)
+        True
+    """
+    with _stat_cache_lock:
+        if path is None:
+            _stat_cache.clear()
+        else:
+            _stat_cache.pop(_as_str(path), None)
+
+
+def _not_found_error(message: str, path_str: str,
+                     logger: Optional[logging.Logger] = None) -> FileNotFoundError:
+    """Log and build a FileNotFoundError carrying errno/filename (str: '[Errno 2] message: path')."""
+    if logger:
+        logger.error("%s: %s", message, path_str)
+    return FileNotFoundError(errno.ENOENT, message, path_str)
+
+
+def _write_bytes(path_str: str, buf: bytes) -> None:
+    """Write bytes straight to a file descriptor, bypassing the buffered io layer."""
+    fd = os.open(path_str, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _orjson_loads(buf: Union[bytes, memoryview]) -> Any:
+    """
+    Parse JSON bytes with orjson, returning exactly what json.loads would.
+
+    orjson reads integers outside the 64-bit range as floats, so input with
+    a 19+ digit run goes to stdlib json, as does anything orjson rejects.
+    """
+    if _WIDE_DIGIT_RUN.search(buf):
+        return json.loads(bytes(buf))
+    try:
+        return orjson.loads(buf)
+    except orjson.JSONDecodeError:
+        # stdlib json accepts NaN/Infinity (written by json.dump); orjson does not
+        return json.loads(bytes(buf))
+
+
+def _orjson_loads_mmap(path_str: str) -> Any:
+    """Parse a JSON file with orjson directly from a read-only memory map."""
+    with open(path_str, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            return _orjson_loads(view)
+        finally:
+            # Views must be released before the map can close
+            view.release()
 
 
 def ensure_path_exists(path: Union[str, Path],
@@ -68,18 +229,12 @@ def ensure_path_exists(path: Union[str, Path],
         # loaders.py:50
         source_path = ensure_path_exists(source, is_file=True)
     """
-    path_obj = Path(path) if isinstance(path, str) else path
-
-    if not path_obj.exists():
-        item_type = "file" if is_file else "directory"
-        error_msg = f"{item_type.capitalize()} not found: {path_obj}"
-
-        if logger:
-            logger.error(error_msg)
+    path_str = _as_str(path)
 
-        raise FileNotFoundError(error_msg)
+    if not _stat_path(path_str)[0]:
+        raise _not_found_error(_FILE_NOT_FOUND if is_file else _DIR_NOT_FOUND, path_str, logger)
 
-    return path_obj
+    return _as_path(path)
 
 
 def ensure_directory(path: Union[str, Path],
@@ -99,7 +254,7 @@ def ensure_directory(path: Union[str, Path],
         Path object (created or existing directory)
 
     Raises:
-        FileExistsError: If exist_ok=False and directory exists
+        FileExistsError: If exist_ok=False and directory exists, or path is a file
 
     Examples:
         >>> ensure_directory('/path/to/output')
@@ -117,15 +272,16 @@ def ensure_directory(path: Union[str, Path],
         # store.py:162
         feature_dir = ensure_directory(base_path / model / feature_name)
     """
-    path_obj = Path(path) if isinstance(path, str) else path
+    path_obj = _as_path(path)
 
-    if not path_obj.exists():
-        path_obj.mkdir(parents=parents, exist_ok=exist_ok)
+    # Happy path: directory already exists
+    if exist_ok and _stat_path(_as_str(path_obj))[2]:
+        return path_obj
 
-        if logger:
-            logger.debug(f"Created directory: {path_obj}")
-    elif logger:
-        logger.debug(f"Directory already exists: {path_obj}")
+    path_obj.mkdir(parents=parents, exist_ok=exist_ok)
+
+    if logger and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Created directory: %s", path_obj)
 
     return path_obj
 
@@ -152,17 +308,14 @@ def path_exists(path: Union[str, Path],
         >>> path_exists('/missing/file.csv')
         False
     """
-    path_obj = Path(path) if isinstance(path, str) else path
-
-    if not path_obj.exists():
-        return False
+    exists, is_regular_file, is_dir = _cached_stat(_as_str(path))
 
     if is_file is None:
-        return True
+        return exists
     elif is_file:
-        return path_obj.is_file()
+        return is_regular_file
     else:
-        return path_obj.is_dir()
+        return is_dir
 
 
 def find_matching_dirs(base_dir: Union[str, Path],
@@ -185,36 +338,70 @@ def find_matching_dirs(base_dir: Union[str, Path],
         >>> find_matching_dirs('/features', 'common')
         [Path('/features/common')]
     """
-    base_path = Path(base_dir) if isinstance(base_dir, str) else base_dir
+    base_path = _as_path(base_dir)
 
-    if not base_path.exists():
+    exists, _, is_dir = _stat_path(str(base_path))
+    if not exists:
         if logger:
             logger.warning(f"Base directory does not exist: {base_path}")
         return []
+    if not is_dir:
+        # A file has no children (Path.glob gives []); os.scandir would raise
+        if logger:
+            logger.warning(f"Base directory is not a directory: {base_path}")
+        return []
 
-    matching = [p for p in base_path.glob(pattern) if p.is_dir()]
-    matching.sort()
+    if '/' in pattern or os.sep in pattern:
+        # Multi-component patterns need full glob semantics
+        matching = sorted(p for p in base_path.glob(pattern) if p.is_dir())
+    else:
+        # DirEntry.is_dir() uses the cached d_type, avoiding a stat per entry
+        with os.scandir(base_path) as entries:
+            names = [e.name for e in entries if fnmatch.fnmatch(e.name, pattern) and e.is_dir()]
+        names.sort()
+        matching = [base_path / name for name in names]
 
-    if logger:
-        logger.debug(f"Found {len(matching)} directories matching '{pattern}' in {base_path}")
+    if logger and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Found %d directories matching '%s' in %s", len(matching), pattern, base_path)
 
     return matching
 
 
+def _serialize_json(data: Any, indent: Optional[int], encoding: str) -> bytes:
+    """
+    Serialize data to encoded JSON bytes; TypeError for unserializable data propagates.
+
+    Always stdlib json, so the bytes written never depend on optional
+    packages (orjson writes NaN as null and serializes Enum and UUID
+    values that json rejects, with no option to refuse them).
+    """
+    return json.dumps(data, indent=indent).encode(encoding)
+
+
+def _save_json_fast(data: Any, path_str: str, indent: Optional[int], encoding: str) -> None:
+    """Serialize and write JSON; TypeError for unserializable data propagates unchanged."""
+    _write_bytes(path_str, _serialize_json(data, indent, encoding))
+
+
 def save_json(data: Dict[str, Any],
              path: Union[str, Path],
              indent: int = 2,
              encoding: str = 'utf-8',
-             logger: Optional[logging.Logger] = None) -> None:
+             logger: Optional[logging.Logger] = None,
+             skip_parent_check: bool = False) -> None:
     """
     Save dictionary as JSON file with error handling.
 
+    Serialized with stdlib json and written straight to the file descriptor.
+
     Args:
         data: Dictionary to save
         path: Output file path
         indent: JSON indentation (default: 2)
         encoding: File encoding (default: 'utf-8')
         logger: Optional logger for info/error messages
+        skip_parent_check: If True, assume the parent directory exists (caller
+            already ran ensure_directory) and skip the existence check
 
     Raises:
         IOError: If file cannot be written
@@ -231,46 +418,112 @@ def save_json(data: Dict[str, Any],
         # persistence.py:204-205
         save_json(metadata, state_dir / 'metadata.json')
 
-        # store.py:224-225
-        save_json(feature_metadata, metadata_file)
+        # store.py:224-225 - feature_dir was just created by ensure_directory
+        save_json(feature_metadata, metadata_file, skip_parent_check=True)
     """
-    path_obj = Path(path) if isinstance(path, str) else path
+    path_str = _as_str(path)
 
     try:
-        # Ensure parent directory exists
-        if not path_obj.parent.exists():
-            path_obj.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists (one stat when it already does)
+        if not skip_parent_check:
+            parent_dir = os.path.dirname(path_str)
+            if parent_dir and not os.path.exists(parent_dir):
+                os.makedirs(parent_dir, exist_ok=True)
 
-        with open(path_obj, 'w', encoding=encoding) as f:
-            json.dump(data, f, indent=indent)
+        _save_json_fast(data, path_str, indent, encoding)
+        invalidate_path_cache(path_str)
 
-        if logger:
-            logger.debug(f"Saved JSON to: {path_obj}")
+        if logger and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Saved JSON to: %s", path_str)
 
     except (IOError, OSError) as e:
-        error_msg = f"Failed to save JSON to {path_obj}: {e}"
+        error_msg = f"Failed to save JSON to {path_str}: {e}"
         if logger:
             logger.error(error_msg)
         raise IOError(error_msg) from e
-    except TypeError as e:
-        error_msg = f"Data is not JSON-serializable: {e}"
+
+
+def save_json_many(items: List[Tuple[Union[str, Path], Dict[str, Any]]],
+                   indent: int = 2,
+                   encoding: str = 'utf-8',
+                   logger: Optional[logging.Logger] = None) -> None:
+    """
+    Save several dictionaries as JSON files in one batch.
+
+    All payloads are serialized up front, each distinct parent directory is
+    created once, and batches of 3+ files are written from a small thread
+    pool (file writes release the GIL).
+
+    Args:
+        items: List of (path, data) pairs
+        indent: JSON indentation (default: 2)
+        encoding: File encoding (default: 'utf-8')
+        logger: Optional logger for info/error messages
+
+    Raises:
+        IOError: If any file cannot be written
+        TypeError: If any payload is not JSON-serializable (nothing is written)
+
+    Examples:
+        >>> save_json_many([
+        ...     (state_dir / 'config.json', config),
+        ...     (state_dir / 'execution_history.json', history),
+        ... ])
+
+    Use Cases:
+        # Replace: for path, data in outputs: save_json(data, path)
+        save_json_many(outputs, logger=logger)
+    """
+    if not items:
+        return
+
+    payloads = [(_as_str(path), _serialize_json(data, indent, encoding)) for path, data in items]
+
+    try:
+        for parent_dir in {os.path.dirname(path_str) for path_str, _ in payloads}:
+            if parent_dir:
+                os.makedirs(parent_dir, exist_ok=True)
+
+        if len(payloads) < _PARALLEL_WRITE_MIN_ITEMS:
+            for path_str, buf in payloads:
+                _write_bytes(path_str, buf)
+        else:
+            workers = min(_PARALLEL_WRITE_MAX_WORKERS, len(payloads))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() surfaces the first write error
+                list(pool.map(lambda item: _write_bytes(*item), payloads))
+
+    except (IOError, OSError) as e:
+        error_msg = f"Failed to save JSON batch ({len(payloads)} files): {e}"
         if logger:
             logger.error(error_msg)
-        raise TypeError(error_msg) from e
+        raise IOError(error_msg) from e
+
+    for path_str, _ in payloads:
+        invalidate_path_cache(path_str)
+
+    if logger and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Saved %d JSON files", len(payloads))
 
 
 def load_json(path: Union[str, Path],
              encoding: str = 'utf-8',
              default: Optional[Dict] = None,
-             logger: Optional[logging.Logger] = None) -> Dict[str, Any]:
+             logger: Optional[logging.Logger] = None,
+             mmap_threshold_bytes: int = 1024 * 1024) -> Dict[str, Any]:
     """
     Load JSON file with error handling.
 
+    Parses UTF-8 files with orjson when installed, falling back to stdlib json
+    wherever orjson would differ; the result always equals json.load's.
+
     Args:
         path: JSON file path
         encoding: File encoding (default: 'utf-8')
         default: Default value if file not found (if None, raises error)
         logger: Optional logger for info/error messages
+        mmap_threshold_bytes: Files larger than this are parsed from a memory
+            map instead of being read into memory first (orjson only)
 
     Returns:
         Loaded dictionary
@@ -297,40 +550,107 @@ def load_json(path: Union[str, Path],
         # store.py:284-285
         feature_meta = load_json(metadata_file)
     """
-    path_obj = Path(path) if isinstance(path, str) else path
+    path_str = _as_str(path)
 
-    if not path_obj.exists():
+    if not os.path.exists(path_str):
         if default is not None:
-            if logger:
-                logger.debug(f"JSON file not found, using default: {path_obj}")
+            if logger and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("JSON file not found, using default: %s", path_str)
             return default
         else:
-            error_msg = f"JSON file not found: {path_obj}"
-            if logger:
-                logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
+            raise _not_found_error(_JSON_NOT_FOUND, path_str, logger)
 
     try:
-        with open(path_obj, 'r', encoding=encoding) as f:
-            data = json.load(f)
+        if orjson is not None and encoding.lower() in ('utf-8', 'utf8'):
+            if os.path.getsize(path_str) > mmap_threshold_bytes:
+                data = _orjson_loads_mmap(path_str)
+            else:
+                with open(path_str, 'rb') as f:
+                    data = _orjson_loads(f.read())
+        else:
+            with open(path_str, 'r', encoding=encoding) as f:
+                data = json.load(f)
 
-        if logger:
-            logger.debug(f"Loaded JSON from: {path_obj}")
+        if logger and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded JSON from: %s", path_str)
 
         return data
 
     except json.JSONDecodeError as e:
-        error_msg = f"Invalid JSON in {path_obj}: {e}"
+        # Re-raise the original error (keeps .doc/.pos without copying the document)
         if logger:
-            logger.error(error_msg)
-        raise json.JSONDecodeError(error_msg, e.doc, e.pos) from e
+            logger.error("Invalid JSON in %s: %s", path_str, e)
+        e.add_note(f"While loading JSON from {path_str}")
+        raise
     except (IOError, OSError) as e:
-        error_msg = f"Failed to load JSON from {path_obj}: {e}"
+        error_msg = f"Failed to load JSON from {path_str}: {e}"
         if logger:
             logger.error(error_msg)
         raise IOError(error_msg) from e
 
 
+def load_json_key(path: Union[str, Path],
+                  key: str,
+                  default: Any = None,
+                  logger: Optional[logging.Logger] = None) -> Any:
+    """
+    Load a single top-level value from a JSON file.
+
+    Prefer this over load_json(path)['field'] when only one field is needed:
+    the parsed document is discarded immediately and a missing file or key
+    returns the default instead of raising.
+
+    Args:
+        path: JSON file path (UTF-8)
+        key: Top-level key to return
+        default: Value returned if the file or key is missing
+        logger: Optional logger for error messages
+
+    Returns:
+        Value for key, or default
+
+    Raises:
+        json.JSONDecodeError: If file is not valid JSON
+
+    Examples:
+        >>> load_json_key(state_dir / 'context_metadata.json', 'run_id')
+        'run_20250101_120000'
+        >>> load_json_key('missing.json', 'run_id', default='unknown')
+        'unknown'
+    """
+    data = load_json(path, default={}, logger=logger)
+    return data.get(key, default) if isinstance(data, dict) else default
+
+
+def peek_json_valid(path: Union[str, Path]) -> bool:
+    """
+    Check whether a file exists and contains valid JSON, without raising.
+
+    Args:
+        path: JSON file path (UTF-8)
+
+    Returns:
+        True if the file can be parsed as JSON, False otherwise
+
+    Examples:
+        >>> peek_json_valid(state_dir / 'context_metadata.json')
+        True
+        >>> peek_json_valid('truncated.json')
+        False
+    """
+    try:
+        with open(_as_str(path), 'rb') as f:
+            buf = f.read()
+        if orjson is not None:
+            _orjson_loads(buf)
+        else:
+            json.loads(buf)
+        return True
+    except (OSError, ValueError):
+        # json.JSONDecodeError (and orjson's) subclass ValueError
+        return False
+
+
 def safe_file_operation(operation: Callable,
                        path: Union[str, Path],
                        logger: Optional[logging.Logger] = None,
@@ -357,7 +677,7 @@ def safe_file_operation(operation: Callable,
         >>> lines = safe_file_operation(read_lines, 'file.txt', operation_name='read')
         >>> # If fails, logs: "Failed to read file file.txt: [error]"
     """
-    path_obj = Path(path) if isinstance(path, str) else path
+    path_obj = _as_path(path)
 
     try:
         return operation(path_obj, **kwargs)
@@ -387,16 +707,21 @@ def get_file_size(path: Union[str, Path],
         >>> get_file_size('data.csv')
         1024567
     """
-    path_obj = ensure_path_exists(path, is_file=True, logger=logger)
-    return path_obj.stat().st_size
+    ensure_path_exists(path, is_file=True, logger=logger)
+    return os.stat(_as_str(path)).st_size
 
 
-def normalize_path(path: Union[str, Path]) -> Path:
+def normalize_path(path: Union[str, Path],
+                   resolve_symlinks: bool = False) -> Path:
     """
     Normalize path to absolute Path object.
 
+    Absolute paths are normalized lexically (no filesystem access) unless
+    resolve_symlinks=True. Relative paths are resolved against the cwd.
+
     Args:
         path: Path to normalize (string or Path)
+        resolve_symlinks: If True, always resolve via Path.resolve() (follows symlinks)
 
     Returns:
         Absolute Path object
@@ -406,9 +731,15 @@ def normalize_path(path: Union[str, Path]) -> Path:
         Path('/absolute/path/to/data/file.csv')
         >>> normalize_path(Path('data/file.csv'))
         Path('/absolute/path/to/data/file.csv')
+        >>> normalize_path('/data/./raw/../file.csv')
+        Path('/data/file.csv')
     """
-    path_obj = Path(path) if isinstance(path, str) else path
-    return path_obj.resolve()
+    path_str = _as_str(path)
+
+    if not resolve_symlinks and os.path.isabs(path_str):
+        return Path(os.path.normpath(path_str))
+
+    return _as_path(path).resolve()
 
 
 # Module-level exports
@@ -418,8 +749,12 @@ __all__ = [
     'path_exists',
     'find_matching_dirs',
     'save_json',
+    'save_json_many',
     'load_json',
+    'load_json_key',
+    'peek_json_valid',
     'safe_file_operation',
     'get_file_size',
     'normalize_path',
+    'invalidate_path_cache',
 ]
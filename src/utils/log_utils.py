@@ -22,12 +22,17 @@ Usage:
     # Data shape logging
     log_data_shape(logger, 'input_data', df, action='Loaded')
 
+    # Hot loops: gate at the call site so suppressed calls skip the helper entirely
+    if logger.isEnabledFor(logging.DEBUG):
+        log_feature_execution(logger, name, 'filter', args_count=n)
+
 Does NOT:
 - Create loggers (use logger.py get_logger)
 - Configure logging (use logger.py setup_logging)
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
+from contextlib import contextmanager
 import logging
 import pandas as pd
 
@@ -38,6 +43,80 @@ STATUS_WARNING = '[WARN]'
 STATUS_ERROR = '[FAIL]'
 STATUS_INFO = '[INFO]'
 
+# status -> (symbol, default level); static, so looked up instead of if/elif per call
+_STATUS_MAP = {
+    'success': (STATUS_SUCCESS, logging.INFO),
+    'warning': (STATUS_WARNING, logging.WARNING),
+    'error': (STATUS_ERROR, logging.ERROR),
+    'info': (STATUS_INFO, logging.INFO),
+}
+_STATUS_DEFAULT = (STATUS_INFO, logging.INFO)
+
+# File operations: successes default to DEBUG, unknown statuses are treated as errors
+_FILE_STATUS_MAP = {
+    'success': (STATUS_SUCCESS, logging.DEBUG),
+    'warning': (STATUS_WARNING, logging.WARNING),
+}
+_FILE_STATUS_DEFAULT = (STATUS_ERROR, logging.ERROR)
+
+
+class _LazyJoin:
+    """Defers sep.join() of items to record formatting time (via %s)"""
+
+    __slots__ = ('_items', '_empty', '_sep')
+
+    def __init__(self, items, empty: str = '', sep: str = ', '):
+        self._items = items
+        self._empty = empty
+        self._sep = sep
+
+    def __str__(self) -> str:
+        return self._sep.join(map(str, self._items)) if self._items else self._empty
+
+
+# Line separators for grouped multi-line records (each line keeps its symbol)
+_ERROR_LINE_SEP = '\n' + STATUS_ERROR + ' '
+_WARNING_LINE_SEP = '\n' + STATUS_WARNING + ' '
+
+
+class _LazyContext:
+    """Defers 'k=v, ...' rendering of a context dict to record formatting time"""
+
+    __slots__ = ('_context',)
+
+    def __init__(self, context: Dict[str, Any]):
+        self._context = context
+
+    def __str__(self) -> str:
+        return ', '.join(f"{k}={v}" for k, v in self._context.items())
+
+
+_STANDARD_LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+
+
+def snapshot_levels(logger: logging.Logger) -> frozenset:
+    """
+    Capture which standard levels are enabled for a logger.
+
+    Take the snapshot once before a hot loop and test membership inside it,
+    instead of calling into the logging module on every iteration. The
+    snapshot does not follow later level changes; take a new one after
+    reconfiguring logging.
+
+    Args:
+        logger: Logger instance
+
+    Returns:
+        frozenset of enabled level ints (subset of DEBUG..CRITICAL)
+
+    Examples:
+        >>> levels = snapshot_levels(logger)
+        >>> for name, deps in resolved.items():
+        ...     if logging.DEBUG in levels:
+        ...         log_dependency_chain(logger, name, deps)
+    """
+    return frozenset(level for level in _STANDARD_LEVELS if logger.isEnabledFor(level))
+
 
 def log_operation_start(logger: logging.Logger,
                         operation: str,
@@ -58,13 +137,13 @@ def log_operation_start(logger: logging.Logger,
         >>> log_operation_start(logger, 'Processing model', model_name='model1')
         # Logs: "Processing model... (model_name=model1)"
     """
+    if not logger.isEnabledFor(level):
+        return
+
     if context:
-        context_str = ', '.join(f"{k}={v}" for k, v in context.items())
-        message = f"{operation}... ({context_str})"
+        logger.log(level, "%s... (%s)", operation, _LazyContext(context))
     else:
-        message = f"{operation}..."
-
-    logger.log(level, message)
+        logger.log(level, "%s...", operation)
 
 
 def log_operation_complete(logger: logging.Logger,
@@ -96,29 +175,68 @@ def log_operation_complete(logger: logging.Logger,
         log_operation_complete(logger, 'Excel file saved', status='success', path=output_path)
     """
     # Determine status symbol and level
-    if status == 'success':
-        symbol = STATUS_SUCCESS
-        default_level = logging.INFO
-    elif status == 'warning':
-        symbol = STATUS_WARNING
-        default_level = logging.WARNING
-    elif status == 'error':
-        symbol = STATUS_ERROR
-        default_level = logging.ERROR
-    else:  # info
-        symbol = STATUS_INFO
-        default_level = logging.INFO
+    symbol, default_level = _STATUS_MAP.get(status, _STATUS_DEFAULT)
 
     level = level if level is not None else default_level
 
+    if not logger.isEnabledFor(level):
+        return
+
     # Build message
     if context:
-        context_str = ', '.join(f"{k}={v}" for k, v in context.items())
-        message = f"{symbol} {operation} complete ({context_str})"
+        logger.log(level, "%s %s complete (%s)", symbol, operation, _LazyContext(context))
     else:
-        message = f"{symbol} {operation} complete"
+        logger.log(level, "%s %s complete", symbol, operation)
 
-    logger.log(level, message)
+
+@contextmanager
+def operation_scope(logger: logging.Logger,
+                    operation: str,
+                    level: int = logging.INFO,
+                    **context) -> Iterator[None]:
+    """
+    Log operation start and completion around a block, sharing one context.
+
+    The context is bound once and rendered lazily by both records, instead
+    of being joined separately by log_operation_start and
+    log_operation_complete. If the block raises, a failure record is logged
+    at ERROR and the exception propagates.
+
+    Args:
+        logger: Logger instance
+        operation: Operation name/description
+        level: Logging level for the start and success records (default: INFO)
+        **context: Additional context to log (key=value pairs)
+
+    Examples:
+        >>> with operation_scope(logger, 'Loading data', file_path=path):
+        ...     df = load(path)
+        # Logs: "Loading data... (file_path=/data/input.csv)"
+        #       "[OK] Loading data complete (file_path=/data/input.csv)"
+    """
+    context_arg = _LazyContext(context) if context else None
+
+    if logger.isEnabledFor(level):
+        if context_arg is not None:
+            logger.log(level, "%s... (%s)", operation, context_arg)
+        else:
+            logger.log(level, "%s...", operation)
+
+    try:
+        yield
+    except BaseException:
+        if logger.isEnabledFor(logging.ERROR):
+            if context_arg is not None:
+                logger.error("%s %s failed (%s)", STATUS_ERROR, operation, context_arg)
+            else:
+                logger.error("%s %s failed", STATUS_ERROR, operation)
+        raise
+
+    if logger.isEnabledFor(level):
+        if context_arg is not None:
+            logger.log(level, "%s %s complete (%s)", STATUS_SUCCESS, operation, context_arg)
+        else:
+            logger.log(level, "%s %s complete", STATUS_SUCCESS, operation)
 
 
 def log_validation_result(logger: logging.Logger,
@@ -143,6 +261,10 @@ def log_validation_result(logger: logging.Logger,
         # Logs: "[FAIL] Data quality validation failed"
         #       "[FAIL] Missing values in col1"
 
+    Note:
+        All errors are emitted as a single multi-line ERROR record, and all
+        warnings as a single WARNING record, so handlers run once per group.
+
     Use Cases:
         # validators.py:192 - Replace: logger.info(f"✓ All required columns present: {required}")
         log_validation_result(logger, True, f'All required columns present: {required}')
@@ -151,19 +273,18 @@ def log_validation_result(logger: logging.Logger,
         log_validation_result(logger, False, 'Required columns', errors=[error_msg])
     """
     if is_valid:
-        logger.info(f"{STATUS_SUCCESS} {context} validation passed")
-    else:
-        logger.error(f"{STATUS_ERROR} {context} validation failed")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s %s validation passed", STATUS_SUCCESS, context)
+    elif logger.isEnabledFor(logging.ERROR):
+        logger.error("%s %s validation failed", STATUS_ERROR, context)
 
-    # Log errors
-    if errors:
-        for error in errors:
-            logger.error(f"{STATUS_ERROR} {error}")
+    # Log errors (one multi-line record rather than one record per error)
+    if errors and logger.isEnabledFor(logging.ERROR):
+        logger.error("%s %s", STATUS_ERROR, _LazyJoin(errors, sep=_ERROR_LINE_SEP))
 
-    # Log warnings
-    if warnings:
-        for warning in warnings:
-            logger.warning(f"{STATUS_WARNING} {warning}")
+    # Log warnings (one multi-line record rather than one record per warning)
+    if warnings and logger.isEnabledFor(logging.WARNING):
+        logger.warning("%s %s", STATUS_WARNING, _LazyJoin(warnings, sep=_WARNING_LINE_SEP))
 
 
 def log_data_shape(logger: logging.Logger,
@@ -194,10 +315,11 @@ def log_data_shape(logger: logging.Logger,
         # persistence.py:97 - Replace: logger.debug(f"Filtered {dataset_name} (analytical model): {len(df.columns)} → {len(cols_to_save)} columns")
         log_data_shape(logger, dataset_name, df_filtered, action='Filtered', level=logging.DEBUG)
     """
-    rows = len(df)
-    cols = len(df.columns)
-    message = f"{action} {name}: {rows} rows, {cols} columns"
-    logger.log(level, message)
+    if not logger.isEnabledFor(level):
+        return
+
+    rows, cols = df.shape
+    logger.log(level, "%s %s: %d rows, %d columns", action, name, rows, cols)
 
 
 def log_missing_column(logger: logging.Logger,
@@ -215,8 +337,8 @@ def log_missing_column(logger: logging.Logger,
 
     Examples:
         >>> log_missing_column(logger, 'missing_col', available=['col1', 'col2'])
-        # Logs: "[FAIL] Column 'missing_col' not found"
-        #       "[FAIL]   Available columns: ['col1', 'col2']"
+        # Logs (one record): "[FAIL] Column 'missing_col' not found"
+        #                    "[FAIL]   Available columns: ['col1', 'col2']"
         >>> log_missing_column(logger, 'optional_col', severity='warning')
         # Logs: "[WARN] Column 'optional_col' not found"
 
@@ -224,13 +346,17 @@ def log_missing_column(logger: logging.Logger,
         # validators.py:184-185 - Replace multi-line error logging
         log_missing_column(logger, col, available=df.columns.tolist())
     """
+    if not logger.isEnabledFor(logging.ERROR if severity == 'error' else logging.WARNING):
+        return
+
     symbol = STATUS_ERROR if severity == 'error' else STATUS_WARNING
     log_func = logger.error if severity == 'error' else logger.warning
 
-    log_func(f"{symbol} Column '{col}' not found")
-
     if available:
-        log_func(f"{symbol}   Available columns: {available}")
+        log_func("%s Column '%s' not found\n%s   Available columns: %s",
+                 symbol, col, symbol, available)
+    else:
+        log_func("%s Column '%s' not found", symbol, col)
 
 
 def log_dependency_chain(logger: logging.Logger,
@@ -252,8 +378,10 @@ def log_dependency_chain(logger: logging.Logger,
         >>> log_dependency_chain(logger, 'basic_feature', [])
         # Logs: "Resolved basic_feature -> []"
     """
-    deps_str = ', '.join(deps) if deps else 'no dependencies'
-    logger.log(level, f"Resolved {feature} -> [{deps_str}]")
+    if not logger.isEnabledFor(level):
+        return
+
+    logger.log(level, "Resolved %s -> [%s]", feature, _LazyJoin(deps, 'no dependencies'))
 
 
 def log_feature_execution(logger: logging.Logger,
@@ -277,12 +405,13 @@ def log_feature_execution(logger: logging.Logger,
         >>> log_feature_execution(logger, 'total_revenue', 'attribute')
         # Logs: "Executing attribute 'total_revenue'"
     """
+    if not logger.isEnabledFor(level):
+        return
+
     if args_count is not None:
-        message = f"Executing {feature_type} '{feature_name}' ({args_count} args)"
+        logger.log(level, "Executing %s '%s' (%d args)", feature_type, feature_name, args_count)
     else:
-        message = f"Executing {feature_type} '{feature_name}'"
-
-    logger.log(level, message)
+        logger.log(level, "Executing %s '%s'", feature_type, feature_name)
 
 
 def log_file_operation(logger: logging.Logger,
@@ -314,20 +443,14 @@ def log_file_operation(logger: logging.Logger,
         log_file_operation(logger, 'Loaded JSON', path_obj, status='success', level=logging.DEBUG)
     """
     # Determine status symbol and level
-    if status == 'success':
-        symbol = STATUS_SUCCESS
-        default_level = logging.DEBUG
-    elif status == 'warning':
-        symbol = STATUS_WARNING
-        default_level = logging.WARNING
-    else:  # error
-        symbol = STATUS_ERROR
-        default_level = logging.ERROR
+    symbol, default_level = _FILE_STATUS_MAP.get(status, _FILE_STATUS_DEFAULT)
 
     level = level if level is not None else default_level
 
-    message = f"{symbol} {operation}: {path}"
-    logger.log(level, message)
+    if not logger.isEnabledFor(level):
+        return
+
+    logger.log(level, "%s %s: %s", symbol, operation, path)
 
 
 def log_count_summary(logger: logging.Logger,
@@ -360,15 +483,20 @@ def log_count_summary(logger: logging.Logger,
         # synthetic.py:125 - Replace: logger.info(f"Found {len(feature_index)} synthetic features...")
         log_count_summary(logger, 'synthetic features in feature store', len(feature_index))
     """
-    message = f"Found {count} {description}"
+    if not logger.isEnabledFor(level):
+        return
 
-    if items:
-        if len(items) <= max_items:
-            message += f": {items}"
-        else:
-            message += f": {items[:max_items]} ... ({len(items) - max_items} more)"
+    if not items:
+        logger.log(level, "Found %s %s", count, description)
+        return
 
-    logger.log(level, message)
+    n_items = len(items)
+    if n_items <= max_items:
+        # Common case: no slice, and the list repr is deferred to the handler
+        logger.log(level, "Found %s %s: %r", count, description, items)
+    else:
+        logger.log(level, "Found %s %s: %r ... (%d more)",
+                   count, description, items[:max_items], n_items - max_items)
 
 
 def log_model_execution(logger: logging.Logger,
@@ -393,17 +521,21 @@ def log_model_execution(logger: logging.Logger,
         >>> log_model_execution(logger, 'model1', action='Completed')
         # Logs: "===== Completed Model: model1 ====="
     """
-    logger.log(level, f"===== {action} Model: {model_name} =====")
+    if not logger.isEnabledFor(level):
+        return
+
+    logger.log(level, "===== %s Model: %s =====", action, model_name)
 
     if input_dataset:
-        logger.log(level, f"Input dataset: {input_dataset}")
+        logger.log(level, "Input dataset: %s", input_dataset)
 
 
 def log_progress(logger: logging.Logger,
                 current: int,
                 total: int,
                 item_name: str = 'item',
-                level: int = logging.INFO) -> None:
+                level: int = logging.INFO,
+                sample_every: int = 1) -> None:
     """
     Log progress (current/total).
 
@@ -413,21 +545,32 @@ def log_progress(logger: logging.Logger,
         total: Total count
         item_name: Name of items being processed
         level: Logging level (default: INFO)
+        sample_every: Only log every Nth item; the final item (current == total)
+            is always logged (default: 1, log every call)
 
     Examples:
         >>> log_progress(logger, 5, 10, item_name='model')
         # Logs: "Processing model 5/10"
         >>> log_progress(logger, 100, 100, item_name='row')
         # Logs: "Processing row 100/100"
+        >>> for i in range(1, 1001):
+        ...     log_progress(logger, i, 1000, item_name='row', sample_every=100)
+        # Logs 10 lines: "Processing row 100/1000" ... "Processing row 1000/1000"
     """
-    message = f"Processing {item_name} {current}/{total}"
-    logger.log(level, message)
+    if sample_every > 1 and current % sample_every and current != total:
+        return
+
+    if not logger.isEnabledFor(level):
+        return
+
+    logger.log(level, "Processing %s %s/%s", item_name, current, total)
 
 
 # Module-level exports
 __all__ = [
     'log_operation_start',
     'log_operation_complete',
+    'operation_scope',
     'log_validation_result',
     'log_data_shape',
     'log_missing_column',
@@ -437,6 +580,7 @@ __all__ = [
     'log_count_summary',
     'log_model_execution',
     'log_progress',
+    'snapshot_levels',
     # Status constants
     'STATUS_SUCCESS',
     'STATUS_WARNING',
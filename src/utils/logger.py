@@ -4,7 +4,9 @@ Supports log levels: DEBUG, INFO, WARNING, ERROR, CRITICAL
 """
 
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional, Dict
 
@@ -122,3 +124,77 @@ def get_current_level() -> str:
     if _LOG_LEVEL is None:
         return 'INFO'
     return logging.getLevelName(_LOG_LEVEL)
+
+
+class _BlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that waits for room instead of erroring when the queue is full"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put(record)
+
+
+class _RestoringQueueListener(logging.handlers.QueueListener):
+    """QueueListener that puts the logger's original handlers back when stopped"""
+
+    def __init__(self, logger: logging.Logger, queue_handler: logging.handlers.QueueHandler,
+                 *handlers, respect_handler_level: bool = False):
+        super().__init__(queue_handler.queue, *handlers, respect_handler_level=respect_handler_level)
+        self.logger = logger
+        self.queue_handler = queue_handler
+        self.running = False
+
+    def start(self) -> None:
+        super().start()
+        self.running = True
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self.running = False
+
+        # Swap the queue handler for the original handlers in one assignment,
+        # so every record goes either to the queue or straight to the handlers
+        handlers = [h for h in self.logger.handlers if h is not self.queue_handler]
+        self.logger.handlers = handlers + list(self.handlers)
+
+        # Let the listener drain what is queued, leaving room for the stop sentinel
+        self.queue.join()
+        super().stop()
+
+
+def install_async_logging(logger: Optional[logging.Logger] = None,
+                          maxsize: int = 10000) -> logging.handlers.QueueListener:
+    """
+    Move a logger's handler I/O onto a background thread
+
+    Replaces the logger's handlers with a single QueueHandler and starts a
+    QueueListener that feeds the original handlers (file, console, ...).
+    The caller still merges the message with its args (and renders any
+    traceback) when the record is enqueued; the original handlers' formatters
+    and the write() run on the listener thread.
+
+    Args:
+        logger: Logger to rewire (default: root logger, as set up by setup_logging)
+        maxsize: Maximum queued records; callers block when it is full
+
+    Returns:
+        The started QueueListener. listener.stop() flushes pending records and
+        puts the original handlers back on the logger, so logging keeps
+        working afterwards, e.g. atexit.register(listener.stop).
+
+    Example:
+        setup_logging('DEBUG', config)
+        listener = install_async_logging()
+        atexit.register(listener.stop)
+    """
+    target = logger if logger is not None else logging.getLogger()
+    handlers = list(target.handlers)
+
+    queue_handler = _BlockingQueueHandler(queue.Queue(maxsize=maxsize))
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(queue_handler)
+
+    listener = _RestoringQueueListener(target, queue_handler, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -23,12 +23,33 @@ Does NOT:
 - Load/save data (use loaders)
 """
 
+from itertools import chain
 from typing import List, Dict, Any, Optional
 import pandas as pd
 import logging
 from src.core.results import OperationResult
 
 
+# Stand-in for logger=None: every level is disabled, so calls return at the
+# level check and validators need no per-call "if logger" branches
+_NULL_LOGGER = logging.getLogger('ayni.null')
+_NULL_LOGGER.addHandler(logging.NullHandler())
+_NULL_LOGGER.setLevel(logging.CRITICAL + 1)
+_NULL_LOGGER.propagate = False
+
+
+class _LazyColumns:
+    """Defers list(...) + repr of columns/keys until a handler formats the record"""
+
+    __slots__ = ('_cols',)
+
+    def __init__(self, cols):
+        self._cols = cols
+
+    def __str__(self) -> str:
+        return repr(list(self._cols))
+
+
 def validate_dataframe(df: pd.DataFrame,
                       min_rows: int = 0,
                       max_rows: Optional[int] = None,
@@ -52,25 +73,30 @@ def validate_dataframe(df: pd.DataFrame,
         >>> if not result.success:
         ...     print(result.errors)
     """
+    if logger is None:
+        logger = _NULL_LOGGER
+
     result = OperationResult(success=True)
+    n_rows = df.shape[0]
 
     # Check row count
-    if len(df) < min_rows:
-        result.add_error(f"DataFrame has {len(df)} rows, minimum required: {min_rows}")
+    if n_rows < min_rows:
+        result.add_error(f"DataFrame has {n_rows} rows, minimum required: {min_rows}")
 
-    if max_rows is not None and len(df) > max_rows:
-        result.add_error(f"DataFrame has {len(df)} rows, maximum allowed: {max_rows}")
+    if max_rows is not None and n_rows > max_rows:
+        result.add_error(f"DataFrame has {n_rows} rows, maximum allowed: {max_rows}")
 
     # Check required columns
     if required_cols:
-        missing = [col for col in required_cols if col not in df.columns]
+        # Hash lookups against a plain set instead of Index.__contains__ per column
+        cols_set = set(df.columns)
+        missing = [col for col in required_cols if col not in cols_set]
         if missing:
             result.add_error(f"Missing required columns: {missing}")
-            if logger:
-                logger.error(f"Available columns: {df.columns.tolist()}")
+            logger.error("Available columns: %s", _LazyColumns(df.columns))
 
-    if not result.success and logger:
-        logger.error(f"DataFrame validation failed with {len(result.errors)} errors")
+    if not result.success:
+        logger.error("DataFrame validation failed with %d errors", len(result.errors))
 
     return result
 
@@ -96,15 +122,15 @@ def validate_required_keys(d: Dict,
         >>> if not result.success:
         ...     print(result.errors)
     """
-    result = OperationResult(success=True)
+    if logger is None:
+        logger = _NULL_LOGGER
 
     missing = [key for key in required_keys if key not in d]
-    if missing:
-        result.add_error(f"{context_name} missing required keys: {missing}")
-        if logger:
-            logger.error(f"Available keys: {list(d.keys())}")
+    if not missing:
+        return OperationResult.ok()
 
-    return result
+    logger.error("Available keys: %s", _LazyColumns(d.keys()))
+    return OperationResult.failure(f"{context_name} missing required keys: {missing}")
 
 
 def validate_mutually_exclusive(values: Dict[str, Any],
@@ -128,6 +154,9 @@ def validate_mutually_exclusive(values: Dict[str, Any],
         ... )
         >>> result.success  # True (only mode_a is set)
     """
+    if logger is None:
+        logger = _NULL_LOGGER
+
     result = OperationResult(success=True)
 
     # Count how many are set (not None)
@@ -138,8 +167,8 @@ def validate_mutually_exclusive(values: Dict[str, Any],
     elif len(set_fields) > 1:
         result.add_error(f"Only one of {field_names} can be set, but got: {set_fields}")
 
-    if not result.success and logger:
-        logger.error(f"Mutual exclusivity validation failed: {result.errors[0]}")
+    if not result.success:
+        logger.error("Mutual exclusivity validation failed: %s", result.errors[0])
 
     return result
 
@@ -166,17 +195,21 @@ def validate_value_range(value: Any,
         >>> result = validate_value_range(5, min_value=1, max_value=10, field_name='count')
         >>> result.success  # True
     """
-    result = OperationResult(success=True)
+    if logger is None:
+        logger = _NULL_LOGGER
 
-    if min_value is not None and value < min_value:
-        result.add_error(f"{field_name} ({value}) is below minimum ({min_value})")
+    below = min_value is not None and value < min_value
+    above = max_value is not None and value > max_value
+    if not (below or above):
+        return OperationResult.ok()
 
-    if max_value is not None and value > max_value:
+    result = OperationResult(success=True)
+    if below:
+        result.add_error(f"{field_name} ({value}) is below minimum ({min_value})")
+    if above:
         result.add_error(f"{field_name} ({value}) is above maximum ({max_value})")
 
-    if not result.success and logger:
-        logger.error(result.errors[0])
-
+    logger.error("%s", result.errors[0])
     return result
 
 
@@ -198,14 +231,14 @@ def validate_list_not_empty(lst: List,
         >>> result = validate_list_not_empty([], list_name='features')
         >>> result.success  # False
     """
-    result = OperationResult(success=True)
+    if logger is None:
+        logger = _NULL_LOGGER
 
-    if not lst or len(lst) == 0:
-        result.add_error(f"{list_name} cannot be empty")
-        if logger:
-            logger.error(f"{list_name} is empty")
+    if lst:
+        return OperationResult.ok()
 
-    return result
+    logger.error("%s is empty", list_name)
+    return OperationResult.failure(f"{list_name} cannot be empty")
 
 
 def validate_all(validations: List[OperationResult],
@@ -227,16 +260,18 @@ def validate_all(validations: List[OperationResult],
         >>> if not combined.success:
         ...     print(combined.errors)
     """
-    result = OperationResult(success=True)
+    if logger is None:
+        logger = _NULL_LOGGER
+
+    failed = [v for v in validations if not v.success]
+    result = OperationResult(success=not failed)
 
-    for validation in validations:
-        if not validation.success:
-            result.success = False
-            result.errors.extend(validation.errors)
-        result.warnings.extend(validation.warnings)
+    # One bulk extend per list; chain walks the per-result lists in C
+    result.errors.extend(chain.from_iterable(v.errors for v in failed))
+    result.warnings.extend(chain.from_iterable(v.warnings for v in validations))
 
-    if not result.success and logger:
-        logger.error(f"Combined validation failed with {len(result.errors)} errors")
+    if failed:
+        logger.error("Combined validation failed with %d errors", len(result.errors))
 
     return result
 
@@ -0,0 +1,66 @@
+"""
+Shared base_case.csv loader for the test case generators
+
+base_case.csv defines, per input column:
+- optional: 0 = required, 1 = optional
+- inferable: 1 = can be calculated from other columns
+- case base: the sample value written into generated test cases
+
+The parsed result is memoized per (path, mtime), so a driver that runs several
+generators in one process parses the file once, and editing the file
+invalidates the cache.
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+
+import pandas as pd
+
+
+class BaseCase(NamedTuple):
+    """Parsed base_case.csv (tuples so the cached instance can't be mutated)"""
+    columns: Tuple[str, ...]
+    optional: Tuple[int, ...]
+    inferable: Tuple[int, ...]
+    required_cols: Tuple[str, ...]
+    optional_cols: Tuple[str, ...]
+    inferable_cols: Tuple[str, ...]
+    values: Dict[str, str]
+
+
+def read_base_case(filepath) -> BaseCase:
+    """Load base_case.csv, reusing the parsed result while the file is unchanged"""
+    path = os.path.abspath(filepath)
+    return _parse_base_case(path, os.path.getmtime(path))
+
+
+@lru_cache(maxsize=1)
+def _parse_base_case(path: str, mtime: float) -> BaseCase:
+    df = pd.read_csv(path)
+
+    # Keep only column rows (drop blanks and the 'case base' label row)
+    df = df.dropna(subset=['col'])
+    df = df[df['col'] != 'case base']
+
+    # Cast the flag columns once; role masks are boolean Series
+    optional = df['optional'].astype(int)
+    inferable = df['inferable'].astype(int)
+    is_required = optional == 0
+    is_inferable = inferable == 1
+
+    col = df['col']
+    columns = col.tolist()
+
+    # Blank cells are written as empty fields, so resolve NaN once here
+    values = dict(zip(columns, df['case base'].fillna('')))
+
+    return BaseCase(
+        columns=tuple(columns),
+        optional=tuple(optional.tolist()),
+        inferable=tuple(inferable.tolist()),
+        required_cols=tuple(col[is_required].tolist()),
+        optional_cols=tuple(col[~is_required].tolist()),
+        inferable_cols=tuple(col[is_inferable].tolist()),
+        values=values,
+    )
@@ -0,0 +1,81 @@
+"""
+Inference rules shared by the test case generators
+
+Every rule table maps a target column to its inference paths, always as a
+list of paths (each path a list of input columns). A target is inferable when
+ANY path has all of its columns present; an empty path means the column can
+be derived through business logic alone, so it is always inferable.
+
+The two tables are intentionally different:
+- COMBINATION_RULES: used by generate_test_cases.py to decide which columns
+  may be omitted from a combination (one path per target)
+- LUCKY_RULES: used by generate_lucky_test_cases.py to find what a minimal
+  input can infer (several margin paths, stricter discount/commission rules)
+"""
+
+from typing import Dict, FrozenSet, List, Tuple
+
+# Which columns can be calculated from which other columns
+COMBINATION_RULES: Dict[str, List[List[str]]] = {
+    'in_cost_total': [['in_cost_unit', 'in_quantity']],
+    'in_price_total': [['in_price_unit', 'in_quantity']],
+    'in_cost_unit': [['in_cost_total', 'in_quantity']],
+    'in_price_unit': [['in_price_total', 'in_quantity']],
+    'in_discount_total': [[]],  # Can be inferred from price differences
+    'in_commission_total': [[]],  # Can be inferred from business rules
+    'in_margin': [['in_price_unit', 'in_cost_unit', 'in_quantity', 'in_price_total', 'in_cost_total']],
+}
+
+# What columns can be calculated from what inputs
+LUCKY_RULES: Dict[str, List[List[str]]] = {
+    # Basic calculations
+    'in_price_unit': [['in_price_total', 'in_quantity']],
+    'in_cost_unit': [['in_cost_total', 'in_quantity']],
+    'in_cost_total': [['in_cost_unit', 'in_quantity']],
+
+    # Margin calculations (multiple paths)
+    'in_margin': [
+        ['in_price_total', 'in_cost_total'],  # Simple margin
+        ['in_price_unit', 'in_cost_unit', 'in_quantity'],  # From units
+        ['in_price_total', 'in_cost_total', 'in_discount_total', 'in_commission_total'],  # Full
+    ],
+
+    # Discount (requires additional rate column not in base case)
+    'in_discount_total': [
+        ['in_price_unit', 'in_quantity', 'in_price_total'],  # From gross/net difference
+    ],
+
+    # Commission (requires rate column not in base case)
+    'in_commission_total': [
+        ['in_price_total'],  # Needs commission_rate (not standard)
+    ],
+}
+
+
+def rule_columns(rules: Dict[str, List[List[str]]]) -> List[str]:
+    """All input columns referenced by a rule table (first-seen order)"""
+    return list(dict.fromkeys(col for paths in rules.values() for path in paths for col in path))
+
+
+def frozen_paths(rules: Dict[str, List[List[str]]]) -> Dict[str, Tuple[FrozenSet[str], ...]]:
+    """Rule table with each path as a frozenset, for subset tests"""
+    return {target: tuple(frozenset(path) for path in paths) for target, paths in rules.items()}
+
+
+def rule_masks(rules: Dict[str, List[List[str]]], col_bit: Dict[str, int]) -> Dict[str, Tuple[int, ...]]:
+    """
+    Rule table with each path as a bitmask over col_bit
+
+    A path is satisfied by a column mask `present` when
+    `path_mask & present == path_mask`; an empty path has mask 0.
+    """
+    masks = {}
+    for target, paths in rules.items():
+        path_masks = []
+        for path in paths:
+            mask = 0
+            for col in path:
+                mask |= col_bit[col]
+            path_masks.append(mask)
+        masks[target] = tuple(path_masks)
+    return masks
@@ -12,48 +12,63 @@ Test scenarios generated:
 5. Edge cases (specific optional column combinations)
 """
 
-import pandas as pd
+import csv
+import io
+import os
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+from _base_case_loader import read_base_case
+
+# Column groups added on top of the required columns by the key test cases
+PRICING_COLS = ('in_price_unit', 'in_price_total', 'in_quantity')
+COSTING_COLS = ('in_cost_unit', 'in_cost_total', 'in_quantity')
+FINANCIAL_COLS = ('in_quantity', 'in_cost_unit', 'in_cost_total', 'in_price_unit',
+                  'in_price_total', 'in_discount_total', 'in_commission_total', 'in_margin')
+TOTALS_ONLY_COLS = ('in_quantity', 'in_cost_total', 'in_price_total')
+UNITS_ONLY_COLS = ('in_quantity', 'in_cost_unit', 'in_price_unit')
+METADATA_COLS = ('in_category', 'in_stock', 'in_unit_type')
+CUSTOMER_COLS = ('in_customer_id', 'in_trans_type')
+
 
 def load_base_case(filepath: str):
     """Load base_case.csv and parse column metadata"""
-    df = pd.read_csv(filepath)
+    base_case = read_base_case(filepath)
 
-    required_cols = []
-    optional_cols = []
-    inferable_cols = []
-    values = {}
+    return (list(base_case.required_cols), list(base_case.optional_cols),
+            list(base_case.inferable_cols), dict(base_case.values))
 
-    for _, row in df.iterrows():
-        if pd.notna(row['col']) and row['col'] != 'case base':
-            col_name = row['col']
-            values[col_name] = row['case base']
 
-            if int(row['optional']) == 0:
-                required_cols.append(col_name)
-            else:
-                optional_cols.append(col_name)
+def with_columns(required_cols: List[str], extra_cols, known_cols: set) -> List[str]:
+    """Required columns followed by the known extra columns not already required"""
+    required_set = set(required_cols)
+    return required_cols + [col for col in extra_cols if col in known_cols and col not in required_set]
 
-            if int(row['inferable']) == 1:
-                inferable_cols.append(col_name)
 
-    return required_cols, optional_cols, inferable_cols, values
+def create_test_case(case_name: str, columns: List[str], description: str) -> Tuple[str, List[str], str]:
+    """Describe a single test case CSV file (written by generate_csv_files)"""
+    return f"{case_name}.csv", columns, description
 
 
-def create_test_case(output_dir: Path, case_name: str, columns: List[str], values: Dict[str, str], description: str):
-    """Create a single test case CSV file"""
-    data = {col: [values[col]] for col in columns}
-    df = pd.DataFrame(data)
+def generate_csv_files(output_dir: Path, test_cases: List[Tuple[str, List[str], str]], values: Dict[str, str]):
+    """Write the test case CSVs, rendering each column signature once"""
+    cases_by_columns: Dict[Tuple[str, ...], List[str]] = {}
+    for filename, columns, _ in test_cases:
+        cases_by_columns.setdefault(tuple(columns), []).append(filename)
 
-    filename = f"{case_name}.csv"
-    filepath = output_dir / filename
+    for columns, filenames in cases_by_columns.items():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator=os.linesep)
+        writer.writerow(columns)
+        writer.writerow([values[col] for col in columns])
+        text = buffer.getvalue()
 
-    df.to_csv(filepath, index=False)
-    print(f"[OK] {filename} - {description}")
-    print(f"     Columns ({len(columns)}): {', '.join(columns)}\n")
+        for filename in filenames:
+            (output_dir / filename).write_text(text, encoding='utf-8', newline='')
 
-    return filename, columns, description
+    for filename, columns, description in test_cases:
+        print(f"[OK] {filename} - {description}")
+        print(f"     Columns ({len(columns)}): {', '.join(columns)}\n")
 
 
 def main():
@@ -74,24 +89,21 @@ def main():
     print(f"\nGenerating key test cases...\n")
 
     output_dir = base_path.parent
+    known_cols = set(required_cols) | set(optional_cols)
     test_cases = []
 
     # Test Case 1: Minimal - Required columns only
     test_cases.append(create_test_case(
-        output_dir,
         "tc_01_minimal_required",
         required_cols,
-        values,
         "Minimal case - only required columns"
     ))
 
     # Test Case 2: Complete - All columns
     all_cols = required_cols + optional_cols
     test_cases.append(create_test_case(
-        output_dir,
         "tc_02_complete_all",
         all_cols,
-        values,
         "Complete case - all columns present"
     ))
 
@@ -100,109 +112,64 @@ def main():
     if 'in_quantity' in optional_cols:
         typical_cols.append('in_quantity')
     test_cases.append(create_test_case(
-        output_dir,
         "tc_03_typical_with_quantity",
         typical_cols,
-        values,
         "Typical case - required + quantity"
     ))
 
     # Test Case 4: Pricing info - Required + price columns
-    pricing_cols = required_cols.copy()
-    for col in ['in_price_unit', 'in_price_total', 'in_quantity']:
-        if col in optional_cols or col in required_cols:
-            if col not in pricing_cols:
-                pricing_cols.append(col)
+    pricing_cols = with_columns(required_cols, PRICING_COLS, known_cols)
     test_cases.append(create_test_case(
-        output_dir,
         "tc_04_with_pricing",
         pricing_cols,
-        values,
         "Pricing case - includes price information"
     ))
 
     # Test Case 5: Costing info - Required + cost columns
-    costing_cols = required_cols.copy()
-    for col in ['in_cost_unit', 'in_cost_total', 'in_quantity']:
-        if col in optional_cols or col in required_cols:
-            if col not in costing_cols:
-                costing_cols.append(col)
+    costing_cols = with_columns(required_cols, COSTING_COLS, known_cols)
     test_cases.append(create_test_case(
-        output_dir,
         "tc_05_with_costing",
         costing_cols,
-        values,
         "Costing case - includes cost information"
     ))
 
     # Test Case 6: Full financial - Required + all financial columns
-    financial_cols = required_cols.copy()
-    for col in ['in_quantity', 'in_cost_unit', 'in_cost_total', 'in_price_unit',
-                'in_price_total', 'in_discount_total', 'in_commission_total', 'in_margin']:
-        if col in optional_cols or col in required_cols:
-            if col not in financial_cols:
-                financial_cols.append(col)
+    financial_cols = with_columns(required_cols, FINANCIAL_COLS, known_cols)
     test_cases.append(create_test_case(
-        output_dir,
         "tc_06_full_financial",
         financial_cols,
-        values,
         "Full financial case - all monetary columns"
     ))
 
     # Test Case 7: Missing inferable (unit prices) - Has totals and quantity, missing units
-    missing_units_cols = required_cols.copy()
-    for col in ['in_quantity', 'in_cost_total', 'in_price_total']:
-        if col in optional_cols or col in required_cols:
-            if col not in missing_units_cols:
-                missing_units_cols.append(col)
+    missing_units_cols = with_columns(required_cols, TOTALS_ONLY_COLS, known_cols)
     test_cases.append(create_test_case(
-        output_dir,
         "tc_07_infer_unit_prices",
         missing_units_cols,
-        values,
         "Inference test - has totals, missing unit prices (inferable)"
     ))
 
     # Test Case 8: Missing inferable (totals) - Has units and quantity, missing totals
-    missing_totals_cols = required_cols.copy()
-    for col in ['in_quantity', 'in_cost_unit', 'in_price_unit']:
-        if col in optional_cols or col in required_cols:
-            if col not in missing_totals_cols:
-                missing_totals_cols.append(col)
+    missing_totals_cols = with_columns(required_cols, UNITS_ONLY_COLS, known_cols)
     test_cases.append(create_test_case(
-        output_dir,
         "tc_08_infer_totals",
         missing_totals_cols,
-        values,
         "Inference test - has units, missing totals (inferable)"
     ))
 
     # Test Case 9: With metadata - Required + category, stock, unit_type
-    metadata_cols = required_cols.copy()
-    for col in ['in_category', 'in_stock', 'in_unit_type']:
-        if col in optional_cols or col in required_cols:
-            if col not in metadata_cols:
-                metadata_cols.append(col)
+    metadata_cols = with_columns(required_cols, METADATA_COLS, known_cols)
     test_cases.append(create_test_case(
-        output_dir,
         "tc_09_with_metadata",
         metadata_cols,
-        values,
         "Metadata case - includes product categorization"
     ))
 
     # Test Case 10: With customer info - Required + customer_id, trans_type
-    customer_cols = required_cols.copy()
-    for col in ['in_customer_id', 'in_trans_type']:
-        if col in optional_cols or col in required_cols:
-            if col not in customer_cols:
-                customer_cols.append(col)
+    customer_cols = with_columns(required_cols, CUSTOMER_COLS, known_cols)
     test_cases.append(create_test_case(
-        output_dir,
         "tc_10_with_customer",
         customer_cols,
-        values,
         "Customer case - includes customer tracking"
     ))
 
@@ -211,24 +178,25 @@ def main():
     if 'in_quantity' not in min_qty_cols:
         min_qty_cols.append('in_quantity')
     test_cases.append(create_test_case(
-        output_dir,
         "tc_11_minimal_plus_qty",
         min_qty_cols,
-        values,
         "Simple case - required + quantity only"
     ))
 
+    generate_csv_files(output_dir, test_cases, values)
+
     # Generate summary
+    summary_lines = ["Key Test Cases Summary", "=" * 80, "", f"Total test cases: {len(test_cases)}", ""]
+    for filename, columns, description in test_cases:
+        summary_lines += [
+            filename,
+            f"  Description: {description}",
+            f"  Columns ({len(columns)}): {', '.join(columns)}",
+            "",
+        ]
+
     summary_file = output_dir / "key_test_cases_summary.txt"
-    with open(summary_file, 'w') as f:
-        f.write("Key Test Cases Summary\n")
-        f.write("=" * 80 + "\n\n")
-        f.write(f"Total test cases: {len(test_cases)}\n\n")
-
-        for filename, columns, description in test_cases:
-            f.write(f"{filename}\n")
-            f.write(f"  Description: {description}\n")
-            f.write(f"  Columns ({len(columns)}): {', '.join(columns)}\n\n")
+    summary_file.write_text("\n".join(summary_lines) + "\n")
 
     print(f"[OK] Generated {len(test_cases)} key test case files")
     print(f"[OK] Summary written to {summary_file}")
@@ -14,77 +14,44 @@ Based on base_case.csv inference relationships:
                      in_commission_total, in_margin
 """
 
-import pandas as pd
+import csv
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-
-# Define inference rules: what columns can be calculated from what inputs
-INFERENCE_RULES = {
-    # Basic calculations
-    'in_price_unit': ['in_price_total', 'in_quantity'],
-    'in_cost_unit': ['in_cost_total', 'in_quantity'],
-    'in_cost_total': ['in_cost_unit', 'in_quantity'],
-
-    # Margin calculations (multiple paths)
-    'in_margin': [
-        ['in_price_total', 'in_cost_total'],  # Simple margin
-        ['in_price_unit', 'in_cost_unit', 'in_quantity'],  # From units
-        ['in_price_total', 'in_cost_total', 'in_discount_total', 'in_commission_total'],  # Full
-    ],
-
-    # Discount (requires additional rate column not in base case)
-    'in_discount_total': [
-        ['in_price_unit', 'in_quantity', 'in_price_total'],  # From gross/net difference
-    ],
-
-    # Commission (requires rate column not in base case)
-    'in_commission_total': [
-        ['in_price_total'],  # Needs commission_rate (not standard)
-    ],
-}
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from _base_case_loader import read_base_case
+from _inference_rules import LUCKY_RULES, frozen_paths
+
+# What columns can be calculated from what inputs (see _inference_rules.py)
+INFERENCE_RULES = LUCKY_RULES
 
 
 def load_base_case(filepath: str) -> Tuple[List[str], List[str], Dict[str, str]]:
     """Load base_case.csv and parse column metadata"""
-    df = pd.read_csv(filepath)
+    base_case = read_base_case(filepath)
 
-    required_cols = []
-    inferable_cols = []
-    values = {}
+    return list(base_case.required_cols), list(base_case.inferable_cols), dict(base_case.values)
 
-    for _, row in df.iterrows():
-        if pd.notna(row['col']) and row['col'] != 'case base':
-            col_name = row['col']
-            values[col_name] = row['case base']
 
-            # Check if required (optional=0)
-            if int(row['optional']) == 0:
-                required_cols.append(col_name)
+# Each target's inference paths as frozensets
+INFERENCE_RULES_FROZEN = frozen_paths(INFERENCE_RULES)
 
-            # Check if inferable (inferable=1)
-            if int(row['inferable']) == 1:
-                inferable_cols.append(col_name)
+# Column -> targets with an inference path that uses it
+INFERENCE_DEPENDENTS: Dict[str, Set[str]] = {}
+for _target, _paths in INFERENCE_RULES_FROZEN.items():
+    for _col in frozenset().union(*_paths):
+        INFERENCE_DEPENDENTS.setdefault(_col, set()).add(_target)
 
-    return required_cols, inferable_cols, values
 
-
-def can_infer_column(target_col: str, available_cols: Set[str]) -> bool:
-    """Check if a column can be inferred from available columns"""
-    if target_col not in INFERENCE_RULES:
+@lru_cache(maxsize=None)
+def can_infer_column(target_col: str, available_cols: FrozenSet[str]) -> bool:
+    """Check if a column can be inferred from available columns (ANY path satisfied)"""
+    paths = INFERENCE_RULES_FROZEN.get(target_col)
+    if paths is None:
         return False
 
-    rules = INFERENCE_RULES[target_col]
-
-    # If rules is a list of lists (multiple inference paths)
-    if isinstance(rules[0], list):
-        # Check if ANY path is satisfied
-        for rule_set in rules:
-            if all(col in available_cols for col in rule_set):
-                return True
-        return False
-    else:
-        # Single rule set
-        return all(col in available_cols for col in rules)
+    return any(rule <= available_cols for rule in paths)
 
 
 def get_inferable_columns(available_cols: Set[str], max_iterations: int = 10) -> Set[str]:
@@ -101,21 +68,30 @@ def get_inferable_columns(available_cols: Set[str], max_iterations: int = 10) ->
     inferable = set()
     current_available = available_cols.copy()
 
-    for _ in range(max_iterations):
-        newly_inferable = set()
+    # Targets not yet available or inferred; nothing to do once it is empty
+    remaining = INFERENCE_RULES.keys() - current_available
 
-        for target_col in INFERENCE_RULES.keys():
-            if target_col in current_available or target_col in inferable:
-                continue
+    # Targets to (re)check this round: all remaining at first, then only those
+    # whose inputs gained a column last round (an unsatisfied rule stays
+    # unsatisfied until one of its columns appears)
+    candidates = remaining
 
-            if can_infer_column(target_col, current_available):
-                newly_inferable.add(target_col)
+    for _ in range(max_iterations):
+        if not candidates:
+            break
+
+        available_key = frozenset(current_available)
+        newly_inferable = {target_col for target_col in candidates
+                           if can_infer_column(target_col, available_key)}
 
         if not newly_inferable:
             break
 
         inferable.update(newly_inferable)
         current_available.update(newly_inferable)
+        remaining = remaining - newly_inferable
+        candidates = {target for col in newly_inferable
+                      for target in INFERENCE_DEPENDENTS.get(col, ())} & remaining
 
     return inferable
 
@@ -135,7 +111,7 @@ def generate_lucky_cases(required_cols: List[str], inferable_cols: List[str], va
         'name': 'lucky_01_cost_total',
         'description': 'Minimal with cost_total - can infer price_unit, cost_unit, margin',
         'columns': case1_cols,
-        'can_infer': sorted(case1_inferable),
+        'can_infer': case1_inferable,
         'inference_count': len(case1_inferable)
     })
 
@@ -149,7 +125,7 @@ def generate_lucky_cases(required_cols: List[str], inferable_cols: List[str], va
         'name': 'lucky_02_cost_unit',
         'description': 'Minimal with cost_unit - can infer price_unit, cost_total, margin',
         'columns': case2_cols,
-        'can_infer': sorted(case2_inferable),
+        'can_infer': case2_inferable,
         'inference_count': len(case2_inferable)
     })
 
@@ -163,7 +139,7 @@ def generate_lucky_cases(required_cols: List[str], inferable_cols: List[str], va
         'name': 'lucky_03_price_unit',
         'description': 'Has price_unit (redundant with price_total) - limited inference',
         'columns': case3_cols,
-        'can_infer': sorted(case3_inferable),
+        'can_infer': case3_inferable,
         'inference_count': len(case3_inferable)
     })
 
@@ -177,7 +153,7 @@ def generate_lucky_cases(required_cols: List[str], inferable_cols: List[str], va
         'name': 'lucky_04_cost_discount',
         'description': 'With cost_total and discount - can calculate net margin',
         'columns': case4_cols,
-        'can_infer': sorted(case4_inferable),
+        'can_infer': case4_inferable,
         'inference_count': len(case4_inferable)
     })
 
@@ -191,7 +167,7 @@ def generate_lucky_cases(required_cols: List[str], inferable_cols: List[str], va
         'name': 'lucky_05_cost_commission',
         'description': 'With cost_total and commission - can calculate margin with commission',
         'columns': case5_cols,
-        'can_infer': sorted(case5_inferable),
+        'can_infer': case5_inferable,
         'inference_count': len(case5_inferable)
     })
 
@@ -205,7 +181,7 @@ def generate_lucky_cases(required_cols: List[str], inferable_cols: List[str], va
         'name': 'lucky_06_full_margin',
         'description': 'Complete margin calculation - price, cost, discount, commission',
         'columns': case6_cols,
-        'can_infer': sorted(case6_inferable),
+        'can_infer': case6_inferable,
         'inference_count': len(case6_inferable)
     })
 
@@ -219,13 +195,25 @@ def generate_lucky_cases(required_cols: List[str], inferable_cols: List[str], va
         'name': 'lucky_07_dual_units',
         'description': 'Both unit prices - can calculate totals and margin',
         'columns': case7_cols,
-        'can_infer': sorted(case7_inferable),
+        'can_infer': case7_inferable,
         'inference_count': len(case7_inferable)
     })
 
     return lucky_cases
 
 
+def write_single_row_csv(filepath: Path, columns: List[str], values: Dict[str, str]):
+    """Write a header + one value row CSV (values as returned by load_base_case)"""
+    # A case may list an already-required column again; write each column once
+    columns = list(dict.fromkeys(columns))
+    # Build the row first so a missing value cannot leave a half-written file
+    row = [values[col] for col in columns]
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(columns)
+        writer.writerow(row)
+
+
 def generate_csv_files(base_path: Path, lucky_cases: List[Dict], values: Dict[str, str]):
     """Generate CSV files for each lucky case"""
 
@@ -234,38 +222,44 @@ def generate_csv_files(base_path: Path, lucky_cases: List[Dict], values: Dict[st
 
     print(f"Generating {len(lucky_cases)} lucky test case files...\n")
 
-    for case in lucky_cases:
-        # Create single-row dataframe with selected columns
-        data = {col: [values[col]] for col in case['columns']}
-        df = pd.DataFrame(data)
+    # Write CSVs and collect the summary lines in the same pass
+    summary_lines = [
+        "Lucky Test Cases Summary",
+        "=" * 80,
+        "",
+        "These test cases demonstrate MINIMAL input with MAXIMUM inference potential.",
+        "",
+    ]
 
+    for case in lucky_cases:
         # Generate filename
         filename = f"{case['name']}.csv"
         filepath = output_dir / filename
 
-        # Save to CSV
-        df.to_csv(filepath, index=False)
+        # Save single-row CSV with selected columns (each column once)
+        columns = list(dict.fromkeys(case['columns']))
+        write_single_row_csv(filepath, columns, values)
+
+        input_str = f"Input columns ({len(columns)}): {', '.join(columns)}"
+        infer_str = f"Can infer ({case['inference_count']}): {', '.join(sorted(case['can_infer'])) if case['can_infer'] else 'None'}"
 
         # Print summary
         print(f"[OK] {filename}")
         print(f"     {case['description']}")
-        print(f"     Input columns ({len(case['columns'])}): {', '.join(case['columns'])}")
-        print(f"     Can infer ({case['inference_count']}): {', '.join(case['can_infer']) if case['can_infer'] else 'None'}")
+        print(f"     {input_str}")
+        print(f"     {infer_str}")
         print()
 
-    # Generate summary file
+        summary_lines += [
+            filename,
+            f"  Description: {case['description']}",
+            f"  {input_str}",
+            f"  {infer_str}",
+            "",
+        ]
+
     summary_file = output_dir / "lucky_test_cases_summary.txt"
-    with open(summary_file, 'w') as f:
-        f.write("Lucky Test Cases Summary\n")
-        f.write("=" * 80 + "\n\n")
-        f.write("These test cases demonstrate MINIMAL input with MAXIMUM inference potential.\n\n")
-
-        for case in lucky_cases:
-            f.write(f"{case['name']}.csv\n")
-            f.write(f"  Description: {case['description']}\n")
-            f.write(f"  Input columns ({len(case['columns'])}): {', '.join(case['columns'])}\n")
-            f.write(f"  Can infer ({case['inference_count']}): {', '.join(case['can_infer']) if case['can_infer'] else 'None'}\n")
-            f.write(f"\n")
+    summary_file.write_text("\n".join(summary_lines) + "\n")
 
     print(f"[OK] Generated {len(lucky_cases)} lucky test case files")
     print(f"[OK] Summary written to {summary_file}")
@@ -15,97 +15,118 @@ Output: Multiple CSV files in the same directory, one per valid combination
 """
 
 import pandas as pd
+import csv
 import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Dict
 
-# Define inference rules: which columns can be calculated from which other columns
-INFERENCE_RULES = {
-    'in_cost_total': ['in_cost_unit', 'in_quantity'],
-    'in_price_total': ['in_price_unit', 'in_quantity'],
-    'in_cost_unit': ['in_cost_total', 'in_quantity'],
-    'in_price_unit': ['in_price_total', 'in_quantity'],
-    'in_discount_total': [],  # Can be inferred from price differences
-    'in_commission_total': [],  # Can be inferred from business rules
-    'in_margin': ['in_price_unit', 'in_cost_unit', 'in_quantity', 'in_price_total', 'in_cost_total'],
-}
+from _base_case_loader import read_base_case
+from _inference_rules import COMBINATION_RULES, frozen_paths, rule_columns, rule_masks
+
+# Which columns can be calculated from which other columns (see _inference_rules.py)
+INFERENCE_RULES = COMBINATION_RULES
+INFERENCE_PATHS = frozen_paths(INFERENCE_RULES)
 
 
 def load_base_case(filepath: str) -> Tuple[pd.DataFrame, Dict[str, str]]:
     """Load base_case.csv and parse column metadata"""
-    df = pd.read_csv(filepath)
-
-    # Extract column metadata
-    metadata = []
-    values = {}
+    base_case = read_base_case(filepath)
 
-    for _, row in df.iterrows():
-        if pd.notna(row['col']) and row['col'] != 'case base':
-            col_name = row['col']
-            metadata.append({
-                'column': col_name,
-                'optional': int(row['optional']),
-                'inferable': int(row['inferable'])
-            })
-            values[col_name] = row['case base']
+    metadata = pd.DataFrame({
+        'column': list(base_case.columns),
+        'optional': list(base_case.optional),
+        'inferable': list(base_case.inferable),
+    })
 
-    return pd.DataFrame(metadata), values
+    return metadata, dict(base_case.values)
 
 
 def is_column_inferable(column: str, present_columns: List[str]) -> bool:
     """Check if a column can be inferred from the present columns"""
-    if column not in INFERENCE_RULES:
+    paths = INFERENCE_PATHS.get(column)
+    if paths is None:
         return False
 
-    required_cols = INFERENCE_RULES[column]
-    if not required_cols:
-        # Can be inferred through complex logic
-        return True
+    # Any path whose columns are all present (an empty path always is)
+    present = frozenset(present_columns)
+    return any(path <= present for path in paths)
+
 
-    # Check if all required columns for inference are present
-    return all(col in present_columns for col in required_cols)
+def columns_mask(columns, col_bit: Dict[str, int]) -> int:
+    """OR together the bits of the given columns"""
+    mask = 0
+    for col in columns:
+        mask |= col_bit[col]
+    return mask
 
 
 def generate_valid_combinations(metadata_df: pd.DataFrame) -> List[List[str]]:
-    """Generate all valid combinations of columns"""
+    """
+    Generate all valid combinations of columns (each distinct set once)
+
+    A combination is required columns + any subset of optional columns, minus
+    any inferable required columns that can be calculated from what remains.
+    Dropping an inferable *optional* column gives the same set as not picking
+    it, so only inferable required columns need a keep/drop choice; this keeps
+    the enumeration at 2^|optional| * 2^|inferable required| with no repeats.
+    """
 
     # Separate columns by type
     required_cols = metadata_df[metadata_df['optional'] == 0]['column'].tolist()
     optional_cols = metadata_df[metadata_df['optional'] == 1]['column'].tolist()
-    inferable_cols = metadata_df[metadata_df['inferable'] == 1]['column'].tolist()
+    inferable_set = set(metadata_df[metadata_df['inferable'] == 1]['column'])
+
+    # Required columns that may still be omitted when they can be inferred
+    removable_required = [col for col in required_cols if col in inferable_set]
+
+    # One bit per column name, so "rule columns all present" is a single AND
+    universe = dict.fromkeys(required_cols + optional_cols + rule_columns(INFERENCE_RULES))
+    col_bit = {name: 1 << i for i, name in enumerate(universe)}
+    path_masks = rule_masks(INFERENCE_RULES, col_bit)
+    required_mask = columns_mask(required_cols, col_bit)
 
     valid_combinations = []
+    seen = set()  # guards against repeats when base_case.csv lists a column twice
 
     # Generate all subsets of optional columns (2^n combinations)
     for r in range(len(optional_cols) + 1):
         for optional_subset in itertools.combinations(optional_cols, r):
-            optional_subset = list(optional_subset)
-
             # Start with required columns + selected optional columns
-            base_cols = required_cols + optional_subset
+            base_cols = required_cols + list(optional_subset)
+            base_mask = required_mask | columns_mask(optional_subset, col_bit)
 
-            # For inferable columns, generate all valid combinations
-            # An inferable column can be omitted if it can be calculated from present columns
-            inferable_in_base = [col for col in base_cols if col in inferable_cols]
-
-            # Generate power set of inferable columns that are currently in base
-            for inf_r in range(len(inferable_in_base) + 1):
-                for inferable_to_remove in itertools.combinations(inferable_in_base, inf_r):
-                    candidate_cols = [col for col in base_cols if col not in inferable_to_remove]
+            for inf_r in range(len(removable_required) + 1):
+                for inferable_to_remove in itertools.combinations(removable_required, inf_r):
+                    candidate_mask = base_mask & ~columns_mask(inferable_to_remove, col_bit)
 
                     # Validate: removed inferable columns must be calculable
-                    valid = True
-                    for removed_col in inferable_to_remove:
-                        if not is_column_inferable(removed_col, candidate_cols):
-                            valid = False
-                            break
-
-                    if valid and candidate_cols not in valid_combinations:
-                        valid_combinations.append(sorted(candidate_cols))
+                    # (same rule as is_column_inferable, on bitmasks)
+                    if all(any(mask & candidate_mask == mask for mask in path_masks.get(col, ()))
+                           for col in inferable_to_remove):
+                        candidate_cols = [col for col in base_cols if col not in inferable_to_remove]
+                        combination = sorted(candidate_cols)
+                        key = tuple(combination)
+                        if key not in seen:
+                            seen.add(key)
+                            valid_combinations.append(combination)
 
     return valid_combinations
 
 
+def write_single_row_csv(filepath: Path, columns: List[str], values: Dict[str, str]):
+    """Write a header + one value row CSV (values as returned by load_base_case)"""
+    # A case may list an already-required column again; write each column once
+    columns = list(dict.fromkeys(columns))
+    # Build the row first so a missing value cannot leave a half-written file
+    row = [values[col] for col in columns]
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(columns)
+        writer.writerow(row)
+
+
 def generate_test_case_files(base_path: Path, combinations: List[List[str]], values: Dict[str, str]):
     """Generate CSV files for each valid combination"""
 
@@ -114,33 +135,33 @@ def generate_test_case_files(base_path: Path, combinations: List[List[str]], val
 
     print(f"Generating {len(combinations)} test case files...\n")
 
-    for idx, cols in enumerate(combinations, start=1):
-        # Create a single-row dataframe with selected columns
-        data = {col: [values[col]] for col in cols}
-        df = pd.DataFrame(data)
-
+    def write_one(item):
+        idx, cols = item
         # Generate filename
         filename = f"test_case_{idx:03d}.csv"
         filepath = output_dir / filename
 
-        # Save to CSV
-        df.to_csv(filepath, index=False)
+        # Save single-row CSV with selected columns
+        write_single_row_csv(filepath, cols, values)
+        return filename
+
+    # Files are independent and values is read-only, so write them concurrently;
+    # map() keeps input order, so the summary prints in order afterwards
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        filenames = list(executor.map(write_one, enumerate(combinations, start=1)))
 
-        # Print summary
+    # Print each file and collect the summary lines in the same pass
+    summary_lines = ["Test Case Summary", "=" * 80, ""]
+
+    for filename, cols in zip(filenames, combinations):
         col_list = ', '.join(cols)
         print(f"[OK] {filename}: {len(cols)} columns - {col_list}")
+        summary_lines += [f"{filename} ({len(cols)} columns):", f"  {col_list}", ""]
 
-    print(f"\n[OK] Generated {len(combinations)} test case files in {output_dir}")
-
-    # Generate summary file
     summary_file = output_dir / "test_cases_summary.txt"
-    with open(summary_file, 'w') as f:
-        f.write("Test Case Summary\n")
-        f.write("=" * 80 + "\n\n")
-        for idx, cols in enumerate(combinations, start=1):
-            f.write(f"test_case_{idx:03d}.csv ({len(cols)} columns):\n")
-            f.write(f"  {', '.join(cols)}\n\n")
+    summary_file.write_text("\n".join(summary_lines) + "\n")
 
+    print(f"\n[OK] Generated {len(combinations)} test case files in {output_dir}")
     print(f"[OK] Summary written to {summary_file}")
 
 
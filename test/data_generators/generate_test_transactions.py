@@ -27,12 +27,79 @@ Schema: 17 columns (all from base_case.csv)
 This data is designed to test aggregation models described in /docs/specs/model/*.md
 """
 
+import io
+import os
 import pandas as pd
 import numpy as np
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
-import random
+from typing import Iterator
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    # pyarrow is optional - only needed for save_to_parquet
+    pa = pq = None
+
+# Days generated per batch; bounds peak memory when streaming to CSV
+DEFAULT_CHUNK_DAYS = 30
+
+
+def _compute_amounts(
+    base_price: np.ndarray,
+    base_cost: np.ndarray,
+    quantity: np.ndarray,
+    price_variance: np.ndarray,
+    cost_variance: np.ndarray,
+    has_discount: np.ndarray,
+    discount_rate: np.ndarray,
+    commission_rate: np.ndarray,
+):
+    """
+    Compute the money columns from the random draws, rounded to cents
+
+    The draw arrays are consumed: they are reused as output buffers, so the
+    whole computation allocates only the two totals and the margin.
+
+    Returns:
+        (unit_price, unit_cost, price_total, cost_total,
+         discount_total, commission_total, margin)
+    """
+    # Unit price/cost with variance
+    unit_price = price_variance
+    unit_price += 1
+    unit_price *= base_price
+    unit_cost = cost_variance
+    unit_cost += 1
+    unit_cost *= base_cost
+
+    # Total price (BASE COLUMN - most important) and total cost
+    price_total = unit_price * quantity
+    cost_total = unit_cost * quantity
+
+    # Discount only where drawn
+    discount_total = discount_rate
+    discount_total *= price_total
+    discount_total[~has_discount] = 0.0
+
+    commission_total = commission_rate
+    commission_total *= price_total
+
+    # Margin (price - cost - commission - discount)
+    margin = price_total - discount_total
+    margin -= cost_total
+    margin -= commission_total
+
+    # Round to cents once all derived values are computed
+    for amounts in (unit_price, unit_cost, price_total, cost_total,
+                    discount_total, commission_total, margin):
+        np.round(amounts, 2, out=amounts)
+
+    return unit_price, unit_cost, price_total, cost_total, discount_total, commission_total, margin
 
 
 class TestTransactionGenerator:
@@ -52,16 +119,44 @@ class TestTransactionGenerator:
             num_days: Number of days to generate
             seed: Random seed for reproducibility
         """
+        # Setup test data (shared by every run of this instance)
+        self._setup_test_data()
+
+        self.configure(start_date, num_days, seed)
+
+    def configure(self, start_date: str, num_days: int, seed: int) -> 'TestTransactionGenerator':
+        """
+        Set the date range and seed for the next run
+
+        Products, customers and lookup arrays are kept, so one instance can
+        generate several datasets.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            num_days: Number of days to generate
+            seed: Random seed for reproducibility
+
+        Returns:
+            self, for chaining
+
+        Example:
+            >>> gen = TestTransactionGenerator()
+            >>> gen.configure("2025-09-01", 60, seed=200).save_to_csv("test_transactions_60days.csv")
+        """
         self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
         self.num_days = num_days
         self.seed = seed
 
-        # Set random seed
-        np.random.seed(seed)
-        random.seed(seed)
+        # Single seeded generator for every random draw
+        self.rng = np.random.default_rng(seed)
 
-        # Setup test data
-        self._setup_test_data()
+        # Day-of-week activity for the configured range
+        self._daily_multipliers = np.array([
+            self._get_daily_pattern(self.start_date + timedelta(days=day_offset))
+            for day_offset in range(self.num_days)
+        ])
+
+        return self
 
     def _setup_test_data(self):
         """Setup simplified test products, customers, categories"""
@@ -83,11 +178,30 @@ class TestTransactionGenerator:
         # Customers (15 simple customers)
         self.customers = [f'client{i}' for i in range(1, 16)]
 
-        # Transaction types
+        # Transaction types (95% sales, 4% returns, 1% exchange)
         self.transaction_types = ['sale', 'return', 'exchange']
+        self._trans_type_cum_probs = np.array([0.95, 0.99])
 
-        # Unit types
+        # Unit types (weighted towards 'unit')
         self.unit_types = ['unit', 'box', 'pack', 'kg']
+        self._unit_type_cum_probs = np.array([0.6, 0.8, 0.95])
+
+        # Quantity buckets [low, high): 60% 1-3 units, 25% 4-7 units, 15% 8-20 units
+        self._quantity_cum_probs = np.array([0.6, 0.85])
+        self._quantity_low = np.array([1, 4, 8])
+        self._quantity_high = np.array([4, 8, 21])
+
+        # Product attributes as arrays, indexed by product position
+        self._product_ids = [p['id'] for p in self.products]
+        self._descriptions = [p['description'] for p in self.products]
+        self._categories = list(dict.fromkeys(p['category'] for p in self.products))
+        self._category_codes = np.array([self._categories.index(p['category']) for p in self.products])
+        self._base_prices = np.array([p['base_price'] for p in self.products])
+        self._base_costs = np.array([p['base_cost'] for p in self.products])
+
+        # Hourly activity is the same every day, so compute it once
+        weights = np.array([self._get_hourly_pattern(h) for h in range(24)], dtype=np.float64)
+        self._hourly_weights = weights / weights.sum()
 
     def _get_hourly_pattern(self, hour: int) -> float:
         """Get transaction probability multiplier for given hour"""
@@ -126,197 +240,288 @@ class TestTransactionGenerator:
         else:  # Sunday
             return 0.7
 
-    def generate_transactions(self) -> pd.DataFrame:
+    def generate_transactions(self, chunk_days: int = DEFAULT_CHUNK_DAYS) -> pd.DataFrame:
         """
         Generate complete transaction data for configured date range
 
+        Args:
+            chunk_days: Days generated per batch (same batching as save_to_csv,
+                so both produce the same rows for a given seed)
+
         Returns:
             DataFrame with all 17 columns from synthetic schema
         """
-        transactions = []
-        transaction_counter = 1
-
-        # Generate transactions for each day
-        for day_offset in range(self.num_days):
-            current_date = self.start_date + timedelta(days=day_offset)
-            daily_multiplier = self._get_daily_pattern(current_date)
-
-            # Base transactions per day: 10-30 depending on pattern
-            base_daily_transactions = int(np.random.poisson(18 * daily_multiplier))
+        return pd.concat(self.iter_transaction_chunks(chunk_days), ignore_index=True)
 
-            # Generate transactions throughout the day
-            for _ in range(base_daily_transactions):
-                # Select random hour weighted by pattern
-                hour = np.random.choice(24, p=self._get_hourly_weights())
-                minute = np.random.randint(0, 60)
-                second = np.random.randint(0, 60)
-
-                timestamp = current_date.replace(hour=hour, minute=minute, second=second)
+    def iter_transaction_chunks(self, chunk_days: int = DEFAULT_CHUNK_DAYS) -> Iterator[pd.DataFrame]:
+        """
+        Generate transactions in consecutive day ranges, in chronological order
 
-                # Generate transaction
-                transaction = self._generate_single_transaction(
-                    timestamp,
-                    transaction_counter
-                )
-                transactions.append(transaction)
-                transaction_counter += 1
+        Args:
+            chunk_days: Number of days per yielded DataFrame
 
-        # Create DataFrame
-        df = pd.DataFrame(transactions)
+        Yields:
+            DataFrame with all 17 columns for the next chunk_days days
+        """
+        next_trans_num = 1
+        for day_start in range(0, self.num_days, chunk_days):
+            day_stop = min(day_start + chunk_days, self.num_days)
+            chunk = self._generate_days(day_start, day_stop, next_trans_num)
+            next_trans_num += len(chunk)
+            yield chunk
+
+    def _generate_days(self, day_start: int, day_stop: int, first_trans_num: int) -> pd.DataFrame:
+        """
+        Generate all transactions for day offsets [day_start, day_stop)
 
-        # Sort by date
-        df = df.sort_values('in_dt').reset_index(drop=True)
+        All random fields are drawn as whole arrays (one call per field), so
+        the cost is a handful of NumPy calls rather than ~10 per transaction.
+        """
+        # Base transactions per day: 10-30 depending on pattern
+        daily_counts = self.rng.poisson(18 * self._daily_multipliers[day_start:day_stop])
+        total = int(daily_counts.sum())
+        day_idx = np.repeat(np.arange(day_start, day_stop), daily_counts)
+
+        # Time of day (hour weighted by pattern)
+        hour = self.rng.choice(24, size=total, p=self._get_hourly_weights())
+        minute = self.rng.integers(0, 60, size=total)
+        second = self.rng.integers(0, 60, size=total)
+
+        # Product and customer (indices into the lookup arrays)
+        product_idx = self.rng.integers(0, len(self.products), size=total)
+        customer_idx = self.rng.integers(0, len(self.customers), size=total)
+
+        # Transaction type
+        trans_type_idx = self._draw_codes(self._trans_type_cum_probs, total)
+
+        # Quantity (bucket, then uniform within the bucket)
+        bucket = self._draw_codes(self._quantity_cum_probs, total)
+        quantity = self.rng.integers(self._quantity_low[bucket], self._quantity_high[bucket])
+
+        # Unit type
+        unit_type_idx = self._draw_codes(self._unit_type_cum_probs, total)
+
+        # Pricing with variance (±10-15%), discount (25% of transactions),
+        # commission (varies 2-6%)
+        price_variance = self.rng.uniform(-0.12, 0.12, total)
+        cost_variance = self.rng.uniform(-0.08, 0.08, total)
+        has_discount = self.rng.random(total) < 0.25
+        discount_rate = self.rng.uniform(0.05, 0.25, total)
+        commission_rate = self.rng.uniform(0.02, 0.06, total)
+
+        (unit_price, unit_cost, price_total, cost_total,
+         discount_total, commission_total, margin) = _compute_amounts(
+            self._base_prices[product_idx], self._base_costs[product_idx], quantity,
+            price_variance, cost_variance, has_discount, discount_rate, commission_rate,
+        )
 
-        return df
+        # Stock level (simulate inventory)
+        stock = self.rng.integers(0, 150, size=total)
 
-    def _get_hourly_weights(self) -> np.ndarray:
-        """Get normalized probability weights for each hour"""
-        weights = np.array([self._get_hourly_pattern(h) for h in range(24)])
-        return weights / weights.sum()
+        # Chronological order by seconds since start_date (stable, so ties keep
+        # generation order); every column is put in this order before the build
+        offsets = day_idx * 86400 + hour * 3600 + minute * 60 + second
+        order = np.argsort(offsets, kind='stable')
 
-    def _generate_single_transaction(
-        self,
-        timestamp: datetime,
-        transaction_num: int
-    ) -> Dict:
-        """Generate a single complete transaction record"""
-
-        # Select product
-        product = random.choice(self.products)
-
-        # Select customer
-        customer_id = random.choice(self.customers)
-
-        # Transaction type (95% sales, 4% returns, 1% exchange)
-        trans_type_prob = np.random.random()
-        if trans_type_prob < 0.95:
-            trans_type = 'sale'
-        elif trans_type_prob < 0.99:
-            trans_type = 'return'
-        else:
-            trans_type = 'exchange'
+        # Format datetime in one pass
+        timestamps = pd.DatetimeIndex(np.datetime64(self.start_date, 's') + offsets[order].astype('timedelta64[s]'))
+        dt_strs = timestamps.strftime("%m/%d/%Y %H:%M")
 
-        # Quantity (most 1-5 units)
-        if np.random.random() < 0.6:
-            quantity = np.random.randint(1, 4)  # 1-3 units (60%)
-        elif np.random.random() < 0.85:
-            quantity = np.random.randint(4, 8)  # 4-7 units (25%)
-        else:
-            quantity = np.random.randint(8, 21)  # 8-20 units (15%)
-
-        # Unit type (weighted towards 'unit')
-        unit_type_prob = np.random.random()
-        if unit_type_prob < 0.6:
-            unit_type = 'unit'
-        elif unit_type_prob < 0.8:
-            unit_type = 'box'
-        elif unit_type_prob < 0.95:
-            unit_type = 'pack'
-        else:
-            unit_type = 'kg'
+        # Transaction IDs follow generation order (day by day), so a row's
+        # number is its pre-sort position offset by first_trans_num
+        # (np.char.zfill rejects empty input, so a range with no draws skips it)
+        trans_ids = (np.char.add('trans', np.char.zfill((order + first_trans_num).astype(str), 6))
+                     if total else np.array([], dtype=str))
 
-        # Pricing with variance (±10-15%)
-        price_variance = np.random.uniform(-0.12, 0.12)
-        unit_price = product['base_price'] * (1 + price_variance)
+        product_idx = product_idx[order]
 
-        cost_variance = np.random.uniform(-0.08, 0.08)
-        unit_cost = product['base_cost'] * (1 + cost_variance)
+        # Build complete transaction table (17 columns) in one call, taking the
+        # freshly generated arrays without copying them. Low-cardinality text
+        # columns are Categorical, built straight from the drawn index codes
+        df = pd.DataFrame({
+            # Required columns (optional=0)
+            'in_dt': dt_strs,
+            'in_trans_id': trans_ids,
+            'in_product_id': pd.Categorical.from_codes(product_idx, self._product_ids),
+            'in_quantity': quantity[order],
+            'in_price_total': price_total[order],  # BASE COLUMN
 
-        # Total price (BASE COLUMN - most important)
-        price_total = unit_price * quantity
+            # Optional columns (optional=1)
+            'in_trans_type': pd.Categorical.from_codes(trans_type_idx[order], self.transaction_types),
+            'in_customer_id': pd.Categorical.from_codes(customer_idx[order], self.customers),
+            'in_description': pd.Categorical.from_codes(product_idx, self._descriptions),
+            'in_category': pd.Categorical.from_codes(self._category_codes[product_idx], self._categories),
+            'in_unit_type': pd.Categorical.from_codes(unit_type_idx[order], self.unit_types),
+            'in_stock': stock[order],
 
-        # Total cost
-        cost_total = unit_cost * quantity
+            # Inferable columns (inferable=1)
+            'in_cost_unit': unit_cost[order],
+            'in_cost_total': cost_total[order],
+            'in_price_unit': unit_price[order],
+            'in_discount_total': discount_total[order],
+            'in_commission_total': commission_total[order],
+            'in_margin': margin[order],
+        }, copy=False)
 
-        # Discount (25% of transactions have discount)
-        has_discount = np.random.random() < 0.25
-        if has_discount:
-            discount_rate = np.random.uniform(0.05, 0.25)
-            discount_total = price_total * discount_rate
-        else:
-            discount_total = 0.0
+        return df
 
-        # Commission (varies 2-6%)
-        commission_rate = np.random.uniform(0.02, 0.06)
-        commission_total = price_total * commission_rate
+    def _draw_codes(self, cum_probs: np.ndarray, size: int) -> np.ndarray:
+        """
+        Draw category indices from cumulative probability thresholds
 
-        # Margin (price - cost - commission - discount)
-        margin = (price_total - discount_total) - cost_total - commission_total
+        One uniform per row; index i is chosen when it falls in
+        [cum_probs[i-1], cum_probs[i]), the last category taking the rest.
+        """
+        return np.searchsorted(cum_probs, self.rng.random(size), side='right')
 
-        # Stock level (simulate inventory)
-        stock = np.random.randint(0, 150)
+    def _get_hourly_weights(self) -> np.ndarray:
+        """Get normalized probability weights for each hour"""
+        return self._hourly_weights
 
-        # Transaction ID
-        trans_id = f'trans{transaction_num:06d}'
+    def save_to_csv(self, output_filename: str = None, chunk_days: int = DEFAULT_CHUNK_DAYS) -> str:
+        """
+        Generate and save transaction data to CSV
 
-        # Format datetime
-        dt_str = timestamp.strftime("%m/%d/%Y %H:%M")
+        Rows are written chunk by chunk, so only chunk_days of transactions
+        are held in memory; the summary uses running totals.
 
-        # Build complete transaction record (17 columns)
-        transaction = {
-            # Required columns (optional=0)
-            'in_dt': dt_str,
-            'in_trans_id': trans_id,
-            'in_product_id': product['id'],
-            'in_quantity': quantity,
-            'in_price_total': round(price_total, 2),  # BASE COLUMN
+        Args:
+            output_filename: Custom filename (optional)
+            chunk_days: Days generated and written per batch
 
-            # Optional columns (optional=1)
-            'in_trans_type': trans_type,
-            'in_customer_id': customer_id,
-            'in_description': product['description'],
-            'in_category': product['category'],
-            'in_unit_type': unit_type,
-            'in_stock': stock,
+        Returns:
+            Path to saved file
+        """
+        output_path = self._output_path(output_filename, 'csv')
+
+        num_rows = 0
+        first_dt = last_dt = None
+        products, customers = set(), set()
+        revenue = cost = margin = 0.0
+        trans_types = Counter()
+
+        # Save with standard UTF-8 encoding (header with the first chunk only,
+        # even when that chunk is empty)
+        header_written = False
+        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+            for chunk in self.iter_transaction_chunks(chunk_days):
+                chunk.to_csv(f, index=False, header=not header_written)
+                header_written = True
+                if chunk.empty:
+                    continue
+
+                num_rows += len(chunk)
+                if first_dt is None:
+                    first_dt = chunk['in_dt'].iloc[0]
+                last_dt = chunk['in_dt'].iloc[-1]
+                products.update(chunk['in_product_id'].unique())
+                customers.update(chunk['in_customer_id'].unique())
+                revenue += chunk['in_price_total'].sum()
+                cost += chunk['in_cost_total'].sum()
+                margin += chunk['in_margin'].sum()
+                trans_types.update({
+                    trans_type: int(count)
+                    for trans_type, count in chunk['in_trans_type'].value_counts().items() if count
+                })
+
+        print(f"[OK] Generated {num_rows} transactions")
+        print(f"[OK] Date range: {first_dt} to {last_dt}")
+        print(f"[OK] Products: {len(products)} unique")
+        print(f"[OK] Customers: {len(customers)} unique")
+        print(f"[OK] Saved to: {output_path}")
 
-            # Inferable columns (inferable=1)
-            'in_cost_unit': round(unit_cost, 2),
-            'in_cost_total': round(cost_total, 2),
-            'in_price_unit': round(unit_price, 2),
-            'in_discount_total': round(discount_total, 2),
-            'in_commission_total': round(commission_total, 2),
-            'in_margin': round(margin, 2),
-        }
+        # Print summary statistics
+        print(f"\n[STATS]")
+        print(f"  Total revenue: ${revenue:,.2f}")
+        print(f"  Total cost: ${cost:,.2f}")
+        print(f"  Total margin: ${margin:,.2f}")
+        print(f"  Avg transaction: ${revenue / num_rows if num_rows else 0.0:,.2f}")
+        print(f"  Transaction types: {dict(trans_types.most_common())}")
 
-        return transaction
+        return str(output_path)
 
-    def save_to_csv(self, output_filename: str = None) -> str:
+    def save_to_parquet(self, output_filename: str = None, chunk_days: int = DEFAULT_CHUNK_DAYS) -> str:
         """
-        Generate and save transaction data to CSV
+        Generate and save transaction data to Parquet (Snappy compressed)
+
+        Parquet keeps the column types (categoricals become dictionary
+        columns), is much smaller than CSV and loads faster in repeated
+        tests. Chunks are appended as row groups, as in save_to_csv.
 
         Args:
             output_filename: Custom filename (optional)
+            chunk_days: Days generated and written per batch
 
         Returns:
             Path to saved file
+
+        Raises:
+            ImportError: If pyarrow is not installed
         """
-        df = self.generate_transactions()
+        if pq is None:
+            raise ImportError("save_to_parquet requires pyarrow (pip install pyarrow)")
+
+        output_path = self._output_path(output_filename, 'parquet')
+
+        num_rows = 0
+        writer = None
+        try:
+            for chunk in self.iter_transaction_chunks(chunk_days):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema, compression='snappy')
+                writer.write_table(table)
+                num_rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        print(f"[OK] Generated {num_rows} transactions")
+        print(f"[OK] Saved to: {output_path}")
 
+        return str(output_path)
+
+    def _output_path(self, output_filename: str, extension: str) -> Path:
+        """Resolve the output file next to this script, auto-naming it if needed"""
         if output_filename is None:
             # Auto-generate filename
             start_str = self.start_date.strftime("%Y%m%d")
-            output_filename = f"test_transactions_{start_str}_{self.num_days}days.csv"
+            output_filename = f"test_transactions_{start_str}_{self.num_days}days.{extension}"
 
-        output_path = Path(__file__).parent / output_filename
+        return Path(__file__).parent / output_filename
 
-        # Save with standard UTF-8 encoding
-        df.to_csv(output_path, index=False, encoding='utf-8')
 
-        print(f"[OK] Generated {len(df)} transactions")
-        print(f"[OK] Date range: {df['in_dt'].iloc[0]} to {df['in_dt'].iloc[-1]}")
-        print(f"[OK] Products: {df['in_product_id'].nunique()} unique")
-        print(f"[OK] Customers: {df['in_customer_id'].nunique()} unique")
-        print(f"[OK] Saved to: {output_path}")
+# Example datasets written by main(): (title, start_date, num_days, seed, filename)
+EXAMPLES = [
+    # 7 days (one week) for quick testing
+    ("Example 1: One Week (7 days)", "2025-10-01", 7, 42, "quick_test_7days.csv"),
+    # 30 days (one month) for monthly aggregations
+    ("Example 2: One Month (30 days)", "2025-10-01", 30, 100, "test_transactions_30days.csv"),
+    # 60 days (two months) for month-over-month
+    ("Example 3: Two Months (60 days)", "2025-09-01", 60, 200, "test_transactions_60days.csv"),
+    # 90 days (quarter) for quarterly analysis
+    ("Example 4: One Quarter (90 days)", "2025-07-01", 90, 300, "test_transactions_90days.csv"),
+]
 
-        # Print summary statistics
-        print(f"\n[STATS]")
-        print(f"  Total revenue: ${df['in_price_total'].sum():,.2f}")
-        print(f"  Total cost: ${df['in_cost_total'].sum():,.2f}")
-        print(f"  Total margin: ${df['in_margin'].sum():,.2f}")
-        print(f"  Avg transaction: ${df['in_price_total'].mean():,.2f}")
-        print(f"  Transaction types: {dict(df['in_trans_type'].value_counts())}")
+# Per-process generator for _run_example (reused across examples in a worker)
+_process_generator = None
 
-        return str(output_path)
+
+def _run_example(example) -> str:
+    """Generate one example dataset in a worker process, returning its printed report"""
+    global _process_generator
+    if _process_generator is None:
+        _process_generator = TestTransactionGenerator()
+
+    title, start_date, num_days, seed, filename = example
+    report = io.StringIO()
+    with redirect_stdout(report):
+        print(title)
+        print("-" * 70)
+        _process_generator.configure(start_date, num_days, seed)
+        _process_generator.save_to_csv(filename)
+        print()
+    return report.getvalue()
 
 
 def main():
@@ -327,49 +532,12 @@ def main():
     print("="*70)
     print()
 
-    # Example 1: 7 days (one week) for quick testing
-    print("Example 1: One Week (7 days)")
-    print("-" * 70)
-    generator1 = TestTransactionGenerator(
-        start_date="2025-10-01",
-        num_days=7,
-        seed=42
-    )
-    generator1.save_to_csv("quick_test_7days.csv")
-    print()
-
-    # Example 2: 30 days (one month) for monthly aggregations
-    print("Example 2: One Month (30 days)")
-    print("-" * 70)
-    generator2 = TestTransactionGenerator(
-        start_date="2025-10-01",
-        num_days=30,
-        seed=100
-    )
-    generator2.save_to_csv("test_transactions_30days.csv")
-    print()
-
-    # Example 3: 60 days (two months) for month-over-month
-    print("Example 3: Two Months (60 days)")
-    print("-" * 70)
-    generator3 = TestTransactionGenerator(
-        start_date="2025-09-01",
-        num_days=60,
-        seed=200
-    )
-    generator3.save_to_csv("test_transactions_60days.csv")
-    print()
-
-    # Example 4: 90 days (quarter) for quarterly analysis
-    print("Example 4: One Quarter (90 days)")
-    print("-" * 70)
-    generator4 = TestTransactionGenerator(
-        start_date="2025-07-01",
-        num_days=90,
-        seed=300
-    )
-    generator4.save_to_csv("test_transactions_90days.csv")
-    print()
+    # Examples are independent: generate them in parallel (each seeded, so the
+    # output does not depend on scheduling) and print reports in order
+    max_workers = min(len(EXAMPLES), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for report in executor.map(_run_example, EXAMPLES):
+            print(report, end='')
 
     print("="*70)
     print("GENERATION COMPLETE")
@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures for the integration tests
+
+Components are stateless between tests, so each is built once per session
+instead of once per test. Logging is configured once, here, rather than at
+test-module import time.
+"""
+
+import os
+
+import pytest
+
+from src.utils.logger import setup_logging
+from src.preprocessing.loaders import DataLoader
+from src.preprocessing.validators import DataValidator
+from src.preprocessing.schema import SchemaProcessor
+from src.features.store import FeatureStore
+from src.features.detector import FeatureTypeDetector
+from src.execution.calculator import FeatureCalculator
+from src.execution.groupby import GroupByProcessor
+
+
+@pytest.fixture(scope='session', autouse=True)
+def configure_logging():
+    """
+    Configure logging (console + log file) once for the session
+
+    Under pytest-xdist each worker gets its own log file, so parallel
+    workers never write to the same path.
+    """
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    client = f'test_refactored_{worker}' if worker else 'test_refactored'
+    return setup_logging(log_level='INFO', config={'client': client})
+
+
+@pytest.fixture(scope='session')
+def loader():
+    return DataLoader()
+
+
+@pytest.fixture(scope='session')
+def validator():
+    return DataValidator()
+
+
+@pytest.fixture(scope='session')
+def schema_processor():
+    return SchemaProcessor()
+
+
+@pytest.fixture(scope='session')
+def store():
+    return FeatureStore()
+
+
+@pytest.fixture(scope='session')
+def detector():
+    return FeatureTypeDetector()
+
+
+@pytest.fixture(scope='session')
+def calculator():
+    return FeatureCalculator()
+
+
+@pytest.fixture(scope='session')
+def groupby_processor(calculator, detector):
+    return GroupByProcessor(calculator, detector)
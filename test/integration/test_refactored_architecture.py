@@ -5,7 +5,11 @@ This script tests the refactored code in src_new/ to ensure it works correctly.
 Run this before migrating from src/ to src_new/.
 
 Usage:
+    pytest test/integration/test_refactored_architecture.py -v
     python test_refactored_code.py
+
+Under pytest the components come from session-scoped fixtures in conftest.py;
+main() builds the same components once for a direct run.
 """
 
 import pandas as pd
@@ -29,197 +33,150 @@ from src.execution.executor import ModelExecutor
 from src.execution.orchestrator import ExecutionOrchestrator
 from src.export.excel import ExcelExporter
 
-# Setup logging with file output
 import os
-from datetime import datetime
-
-# Create logs directory
-logs_dir = 'logs'
-os.makedirs(logs_dir, exist_ok=True)
-
-# Create log file with timestamp
-timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-log_file_path = os.path.join(logs_dir, f'test_refactored_{timestamp}.log')
 
-# Setup logging to both console and file
-setup_logging(log_level='INFO', config={'client': 'test_refactored'})
+# No file/console setup at import time: logging (and the logs/ directory) is
+# configured by main() for a direct run, or by the conftest.py session fixture
 logger = get_logger(__name__)
 
-# Print file locations at the start
-print("=" * 60)
-print("FILE LOCATIONS")
-print("=" * 60)
-print(f"Log file: {os.path.abspath(log_file_path)}")
-print(f"Test outputs: {os.path.abspath('outputs/test')}")
-print("=" * 60 + "\n")
-
 def test_basic_imports():
     """Test 1: Verify all imports work"""
     logger.info("=" * 60)
     logger.info("TEST 1: Basic Imports")
     logger.info("=" * 60)
 
-    try:
-        # All imports already done above
-        logger.info("✓ All imports successful!")
-        return True
-    except Exception as e:
-        logger.error(f"✗ Import failed: {e}")
-        return False
+    # All imports already done above
+    logger.info("✓ All imports successful!")
 
-def test_preprocessing():
+def test_preprocessing(loader, validator, schema_processor):
     """Test 2: Test preprocessing pipeline"""
     logger.info("=" * 60)
     logger.info("TEST 2: Preprocessing Pipeline")
     logger.info("=" * 60)
 
-    try:
-        # Create sample data
-        data = pd.DataFrame({
-            'date': ['2024-01-01', '2024-01-02', '2024-01-03'],
-            'product': ['A', 'B', 'C'],
-            'amount': [100, 200, 300],
-            'quantity': [1, 2, 3]
-        })
-
-        # Test loader
-        loader = DataLoader()
-        df = loader.load_dataframe(data)
-        logger.info(f"✓ DataLoader: Loaded {len(df)} rows")
-
-        # Test validator
-        validator = DataValidator()
-        result = validator.validate_required_columns(df, ['date', 'product'])
-        logger.info(f"✓ DataValidator: Validation {'passed' if result.is_valid else 'failed'}")
-
-        # Test schema processor
-        schema_processor = SchemaProcessor()
-        config = {
-            'data_schema': {
-                'date': {'source_column': 'date', 'dtype': 'date'},
-                'product': {'source_column': 'product', 'dtype': 'str'},
-                'amount': {'source_column': 'amount', 'dtype': 'float'}
-            }
+    # Create sample data
+    data = pd.DataFrame({
+        'date': ['2024-01-01', '2024-01-02', '2024-01-03'],
+        'product': ['A', 'B', 'C'],
+        'amount': [100, 200, 300],
+        'quantity': [1, 2, 3]
+    })
+
+    # Test loader
+    df = loader.load_dataframe(data)
+    assert len(df) == 3
+    logger.info(f"✓ DataLoader: Loaded {len(df)} rows")
+
+    # Test validator
+    result = validator.validate_required_columns(df, ['date', 'product'])
+    assert result.is_valid
+    logger.info(f"✓ DataValidator: Validation {'passed' if result.is_valid else 'failed'}")
+
+    # Test schema processor
+    config = {
+        'data_schema': {
+            'date': {'source_column': 'date', 'dtype': 'date'},
+            'product': {'source_column': 'product', 'dtype': 'str'},
+            'amount': {'source_column': 'amount', 'dtype': 'float'}
         }
-        processed = schema_processor.process_schema(df, config)
-        logger.info(f"✓ SchemaProcessor: Processed {len(processed.available_cols)} columns")
-
-        return True
-    except Exception as e:
-        logger.error(f"✗ Preprocessing test failed: {e}", exc_info=True)
-        return False
+    }
+    processed = schema_processor.process_schema(df, config)
+    assert len(processed.available_cols) == 3
+    logger.info(f"✓ SchemaProcessor: Processed {len(processed.available_cols)} columns")
 
-def test_features():
+def test_features(store, detector):
     """Test 3: Test features package"""
     logger.info("=" * 60)
     logger.info("TEST 3: Features Package")
     logger.info("=" * 60)
 
-    try:
-        # Test feature store
-        store = FeatureStore()
-
-        # Create a simple feature function
-        def test_feature(col1, col2):
-            return col1 + col2
+    # Test feature store
+    # Create a simple feature function
+    def test_feature(col1, col2):
+        return col1 + col2
 
-        store.store_feature('test_feature', test_feature)
-        retrieved = store.get_feature('test_feature')
-        logger.info(f"✓ FeatureStore: Stored and retrieved feature")
+    store.store_feature('test_feature', test_feature)
+    retrieved = store.get_feature('test_feature')
+    assert retrieved is not None
+    logger.info(f"✓ FeatureStore: Stored and retrieved feature")
 
-        # Test detector
-        detector = FeatureTypeDetector()
+    # Test detector with aggregation
+    def agg_feature(values):
+        return np.sum(values)
 
-        # Test with aggregation
-        def agg_feature(values):
-            return np.sum(values)
+    is_agg = detector.is_aggregation(agg_feature)
+    assert is_agg
+    logger.info(f"✓ FeatureTypeDetector: Detected aggregation={is_agg}")
 
-        is_agg = detector.is_aggregation(agg_feature)
-        logger.info(f"✓ FeatureTypeDetector: Detected aggregation={is_agg}")
-
-        # Test analyzer
-        analyzer = FeatureAnalyzer(store, detector)
-        logger.info(f"✓ FeatureAnalyzer: Initialized")
-
-        return True
-    except Exception as e:
-        logger.error(f"✗ Features test failed: {e}", exc_info=True)
-        return False
+    # Test analyzer
+    analyzer = FeatureAnalyzer(store, detector)
+    logger.info(f"✓ FeatureAnalyzer: Initialized")
 
-def test_execution():
+def test_execution(store, detector, groupby_processor):
     """Test 4: Test execution package with 4-case logic"""
     logger.info("=" * 60)
     logger.info("TEST 4: Execution Package (4-Case Logic)")
     logger.info("=" * 60)
 
-    try:
-        # Create test data
-        data_in = pd.DataFrame({
-            'product': ['A', 'A', 'B', 'B'],
-            'amount': [100, 150, 200, 250],
-            'quantity': [1, 2, 3, 4]
-        })
-
-        # Create test features
-        def price_per_unit(amount, quantity):
-            """Case 1: Standard filter - reads only from data_in"""
-            return amount / quantity
-
-        def product_total(amount):
-            """Case 3: Attribute with aggregation"""
-            return np.sum(amount)
-
-        def avg_price(amount, quantity):
-            """Case 3: Attribute with aggregation"""
-            return np.sum(amount) / np.sum(quantity)
-
-        # Setup
-        store = FeatureStore()
-        store.store_feature('price_per_unit', price_per_unit)
-        store.store_feature('product_total', product_total)
-        store.store_feature('avg_price', avg_price)
-
-        detector = FeatureTypeDetector()
-        calculator = FeatureCalculator()
-        groupby_processor = GroupByProcessor(calculator, detector)
-
-        # Analyze features
-        analyzer = FeatureAnalyzer(store, detector)
-        analysis = analyzer.analyze_features(
-            exec_seq=['price_per_unit', 'product_total', 'avg_price'],
-            data_in_columns=data_in.columns.tolist()
-        )
-
-        logger.info(f"✓ Analyzed {len(analysis['feature_funcs'])} features")
-
-        # Create config
-        cfg_model = {
-            'group_by': 'product',
-            'exec_seq': ['price_per_unit', 'product_total', 'avg_price'],
-            'feature_funcs': analysis['feature_funcs'],
-            'feature_args': analysis['feature_args'],
-            'feature_groupby_flg': analysis['feature_groupby_flg'],
-            'exec_fltrs': [],
-            'exec_attrs': []
-        }
+    # Create test data
+    data_in = pd.DataFrame({
+        'product': ['A', 'A', 'B', 'B'],
+        'amount': [100, 150, 200, 250],
+        'quantity': [1, 2, 3, 4]
+    })
+
+    # Create test features
+    def price_per_unit(amount, quantity):
+        """Case 1: Standard filter - reads only from data_in"""
+        return amount / quantity
+
+    def product_total(amount):
+        """Case 3: Attribute with aggregation"""
+        return np.sum(amount)
+
+    def avg_price(amount, quantity):
+        """Case 3: Attribute with aggregation"""
+        return np.sum(amount) / np.sum(quantity)
+
+    # Setup
+    store.store_feature('price_per_unit', price_per_unit)
+    store.store_feature('product_total', product_total)
+    store.store_feature('avg_price', avg_price)
+
+    # Analyze features
+    analyzer = FeatureAnalyzer(store, detector)
+    analysis = analyzer.analyze_features(
+        exec_seq=['price_per_unit', 'product_total', 'avg_price'],
+        data_in_columns=data_in.columns.tolist()
+    )
+
+    assert len(analysis['feature_funcs']) == 3
+    logger.info(f"✓ Analyzed {len(analysis['feature_funcs'])} features")
+
+    # Create config
+    cfg_model = {
+        'group_by': 'product',
+        'exec_seq': ['price_per_unit', 'product_total', 'avg_price'],
+        'feature_funcs': analysis['feature_funcs'],
+        'feature_args': analysis['feature_args'],
+        'feature_groupby_flg': analysis['feature_groupby_flg'],
+        'exec_fltrs': [],
+        'exec_attrs': []
+    }
 
-        # Execute
-        filters_df, attrs_df = groupby_processor.process_all_groups(data_in, cfg_model)
+    # Execute
+    filters_df, attrs_df = groupby_processor.process_all_groups(data_in, cfg_model)
+    assert len(attrs_df) == 2  # one row per product
 
-        logger.info(f"✓ Execution complete:")
-        logger.info(f"  - Filters: {len(filters_df)} rows, {len(filters_df.columns) if not filters_df.empty else 0} columns")
-        logger.info(f"  - Attributes: {len(attrs_df)} rows, {len(attrs_df.columns) if not attrs_df.empty else 0} columns")
+    logger.info(f"✓ Execution complete:")
+    logger.info(f"  - Filters: {len(filters_df)} rows, {len(filters_df.columns) if not filters_df.empty else 0} columns")
+    logger.info(f"  - Attributes: {len(attrs_df)} rows, {len(attrs_df.columns) if not attrs_df.empty else 0} columns")
 
-        # Verify results
-        if not filters_df.empty:
-            logger.info(f"  - Filter columns: {list(filters_df.columns)}")
-        if not attrs_df.empty:
-            logger.info(f"  - Attribute columns: {list(attrs_df.columns)}")
-
-        return True
-    except Exception as e:
-        logger.error(f"✗ Execution test failed: {e}", exc_info=True)
-        return False
+    # Verify results
+    if not filters_df.empty:
+        logger.info(f"  - Filter columns: {list(filters_df.columns)}")
+    if not attrs_df.empty:
+        logger.info(f"  - Attribute columns: {list(attrs_df.columns)}")
 
 def test_context_integration():
     """Test 5: Test context integration"""
@@ -227,42 +184,37 @@ def test_context_integration():
     logger.info("TEST 5: Context Integration")
     logger.info("=" * 60)
 
-    try:
-        # Create context
-        config = {'user_key': 'user_value'}
-        ctx = GabedaContext(config)
-        logger.info(f"✓ GabedaContext created")
-
-        # Test dataset storage
-        test_df = pd.DataFrame({'col': [1, 2, 3]})
-        ctx.set_dataset('test_data', test_df)
-        retrieved = ctx.get_dataset('test_data')
-        assert len(retrieved) == 3
-        logger.info(f"✓ Dataset storage/retrieval works")
-
-        # Test model output storage
-        output = {
-            'filters': pd.DataFrame({'filter_col': [1, 2]}),
-            'attrs': pd.DataFrame({'attr_col': [10, 20]}),
-            'input_dataset_name': 'test_data'
-        }
-        ctx.set_model_output('test_model', output)
-        logger.info(f"✓ Model output stored")
+    # Create context
+    config = {'user_key': 'user_value'}
+    ctx = GabedaContext(config)
+    logger.info(f"✓ GabedaContext created")
+
+    # Test dataset storage
+    test_df = pd.DataFrame({'col': [1, 2, 3]})
+    ctx.set_dataset('test_data', test_df)
+    retrieved = ctx.get_dataset('test_data')
+    assert len(retrieved) == 3
+    logger.info(f"✓ Dataset storage/retrieval works")
+
+    # Test model output storage (filters are only stored for new filter features)
+    output = {
+        'filters': pd.DataFrame({'filter_col': [1, 2]}),
+        'attrs': pd.DataFrame({'attr_col': [10, 20]}),
+        'exec_fltrs': ['filter_col'],
+        'input_dataset_name': 'test_data'
+    }
+    ctx.set_model_output('test_model', output)
+    logger.info(f"✓ Model output stored")
 
-        # Test retrieval
-        filters = ctx.get_model_filters('test_model')
-        attrs = ctx.get_model_attrs('test_model')
-        input_df = ctx.get_model_input('test_model')
+    # Test retrieval
+    filters = ctx.get_model_filters('test_model')
+    attrs = ctx.get_model_attrs('test_model')
+    input_df = ctx.get_model_input('test_model')
 
-        assert filters is not None
-        assert attrs is not None
-        assert input_df is not None
-        logger.info(f"✓ Model output retrieval works")
-
-        return True
-    except Exception as e:
-        logger.error(f"✗ Context integration test failed: {e}", exc_info=True)
-        return False
+    assert filters is not None
+    assert attrs is not None
+    assert input_df is not None
+    logger.info(f"✓ Model output retrieval works")
 
 def test_export():
     """Test 6: Test export functionality"""
@@ -270,58 +222,79 @@ def test_export():
     logger.info("TEST 6: Export Functionality")
     logger.info("=" * 60)
 
-    try:
-        # Create context with data
-        config = {}
-        ctx = GabedaContext(config)
+    # Create context with data
+    config = {}
+    ctx = GabedaContext(config)
 
-        # Add test data
-        ctx.set_dataset('test_input', pd.DataFrame({'col': [1, 2, 3]}))
+    # Add test data
+    ctx.set_dataset('test_input', pd.DataFrame({'col': [1, 2, 3]}))
 
-        output = {
-            'filters': pd.DataFrame({'product': ['A', 'B'], 'filter_val': [10, 20]}),
-            'attrs': pd.DataFrame({'product': ['A', 'B'], 'attr_val': [100, 200]}),
-            'input_dataset_name': 'test_input'
-        }
-        ctx.set_model_output('test_model', output)
+    output = {
+        'filters': pd.DataFrame({'product': ['A', 'B'], 'filter_val': [10, 20]}),
+        'attrs': pd.DataFrame({'product': ['A', 'B'], 'attr_val': [100, 200]}),
+        'input_dataset_name': 'test_input'
+    }
+    ctx.set_model_output('test_model', output)
 
-        # Test exporter
-        exporter = ExcelExporter(ctx)
+    # Test exporter
+    exporter = ExcelExporter(ctx)
 
-        # Create output directory
-        output_dir = Path('outputs/test')
-        output_dir.mkdir(parents=True, exist_ok=True)
+    # Create output directory
+    output_dir = Path('outputs/test')
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-        output_path = output_dir / 'test_export.xlsx'
-        result = exporter.export_model('test_model', str(output_path), include_input=True)
+    output_path = output_dir / 'test_export.xlsx'
+    result = exporter.export_model('test_model', str(output_path), include_input=True)
 
-        logger.info(f"✓ Excel export successful: {result}")
-        logger.info(f"✓ File created: {output_path.exists()}")
+    assert output_path.exists()
+    logger.info(f"✓ Excel export successful: {result}")
+    logger.info(f"✓ File created: {output_path.exists()}")
 
-        # Print absolute path to console
-        abs_path = output_path.absolute()
-        print(f"\nExcel file created at: {abs_path}")
-        logger.info(f"Absolute path: {abs_path}")
+    # Print absolute path to console
+    abs_path = output_path.absolute()
+    print(f"\nExcel file created at: {abs_path}")
+    logger.info(f"Absolute path: {abs_path}")
 
+def _run(test_func, *args):
+    """Run one test for the direct-execution summary, logging any failure"""
+    try:
+        test_func(*args)
         return True
     except Exception as e:
-        logger.error(f"✗ Export test failed: {e}", exc_info=True)
+        logger.error(f"✗ {test_func.__name__} failed: {e}", exc_info=True)
         return False
 
 def main():
     """Run all tests"""
+    # Setup logging to both console and file (creates logs/)
+    log_file_path = setup_logging(log_level='INFO', config={'client': 'test_refactored'})
+
+    # Print file locations at the start
+    print("=" * 60)
+    print("FILE LOCATIONS")
+    print("=" * 60)
+    print(f"Log file: {os.path.abspath(log_file_path)}")
+    print(f"Test outputs: {os.path.abspath('outputs/test')}")
+    print("=" * 60 + "\n")
+
     logger.info("=" * 60)
     logger.info("REFACTORED CODE INTEGRATION TEST")
     logger.info("=" * 60)
     logger.info("Testing src_new/ implementation")
 
+    # Build each component once and share it across tests (same as the
+    # session fixtures in conftest.py)
+    store = FeatureStore()
+    detector = FeatureTypeDetector()
+    groupby_processor = GroupByProcessor(FeatureCalculator(), detector)
+
     results = {
-        'Imports': test_basic_imports(),
-        'Preprocessing': test_preprocessing(),
-        'Features': test_features(),
-        'Execution (4-Case Logic)': test_execution(),
-        'Context Integration': test_context_integration(),
-        'Export': test_export()
+        'Imports': _run(test_basic_imports),
+        'Preprocessing': _run(test_preprocessing, DataLoader(), DataValidator(), SchemaProcessor()),
+        'Features': _run(test_features, store, detector),
+        'Execution (4-Case Logic)': _run(test_execution, store, detector, groupby_processor),
+        'Context Integration': _run(test_context_integration),
+        'Export': _run(test_export)
     }
 
     # Summary
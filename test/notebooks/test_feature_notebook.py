@@ -43,8 +43,7 @@ data_file = 'data/buenacarne/buenacarne_transactions.csv'
 
 if Path(data_file).exists():
     loader = DataLoader()
-    df_raw = loader.load_csv(data_file)
-    df_sample = df_raw.head(100).copy()
+    df_sample = loader.load_csv(data_file, nrows=100)
     print(f"[OK] Loaded sample data: {df_sample.shape}")
     print(f"  - Columns: {list(df_sample.columns)}")
 else:
@@ -105,11 +104,11 @@ def price_total_mean(in_price_total: float) -> float:
 
 def transaction_count(in_trans_id: str) -> int:
     """Count of unique transactions (COMMON)"""
-    return len(np.unique(in_trans_id))
+    return len(pd.unique(in_trans_id))
 
 def product_count(in_product_id: str) -> int:
     """Count of unique products (COMMON)"""
-    return len(np.unique(in_product_id))
+    return len(pd.unique(in_product_id))
 
 def avg_price_per_unit(quantity_sum: float, price_total_sum: float) -> float:
     """Average price per unit (COMMON)"""
@@ -170,6 +169,8 @@ print("\n" + "="*80)
 print("Validating Feature Signatures")
 print("="*80)
 
+# Inspect each feature once; the summary below reuses these results
+feature_info = {}  # name -> (args, feature_type)
 validation_results = []
 for name, func in new_features.items():
     try:
@@ -183,6 +184,7 @@ for name, func in new_features.items():
         is_agg = detector.is_aggregation(func)
         feature_type = 'Attribute (aggregation)' if is_agg else 'Filter or Attribute'
 
+        feature_info[name] = (args, feature_type)
         validation_results.append((name, 'PASS', f'{feature_type}, args={args}'))
     except Exception as e:
         validation_results.append((name, 'FAIL', str(e)))
@@ -201,22 +203,15 @@ print("\n" + "="*80)
 print("Feature Summary")
 print("="*80)
 
-feature_summary = []
-for name, func in new_features.items():
-    sig = inspect.signature(func)
-    args = list(sig.parameters.keys())
-    is_agg = detector.is_aggregation(func)
-    feature_type = 'Attribute (aggregation)' if is_agg else 'Filter or Attribute'
-    docstring = func.__doc__ or 'No description'
-
-    feature_summary.append({
-        'Feature': name,
-        'Type': feature_type,
-        'Args': ', '.join(args),
-        'Description': docstring.strip()
-    })
-
-summary_df = pd.DataFrame(feature_summary)
+# Build the summary column by column (one list per column)
+summary_df = pd.DataFrame({
+    'Feature': list(feature_info),
+    'Type': [feature_type for _, feature_type in feature_info.values()],
+    'Args': [', '.join(args) for args, _ in feature_info.values()],
+    'Description': [
+        (new_features[name].__doc__ or 'No description').strip() for name in feature_info
+    ],
+})
 print(summary_df.to_string())
 
 print(f"\n[INFO] Total features to save: {len(new_features)}")
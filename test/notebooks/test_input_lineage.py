@@ -35,9 +35,10 @@ preprocessed_df = pd.DataFrame({
 # Store preprocessed data in context
 ctx.set_dataset('preprocessed', preprocessed_df)
 
-# Create enriched data (simulating transaction enrichment output)
-enriched_df = preprocessed_df.copy()
-enriched_df['profit_margin'] = [0.2, 0.3, 0.25, 0.35, 0.28]
+# Create enriched data (simulating transaction enrichment output); under
+# copy-on-write the derived frame shares the base columns until modified
+with pd.option_context('mode.copy_on_write', True):
+    enriched_df = preprocessed_df.assign(profit_margin=[0.2, 0.3, 0.25, 0.35, 0.28])
 
 # Store enriched data in context
 ctx.set_dataset('transactions_enriched', enriched_df)
@@ -89,7 +90,7 @@ print("\n3. Test ctx.get_dataset('product_stats_input'):")
 input_via_pattern = ctx.get_dataset('product_stats_input')
 assert input_via_pattern is not None, "❌ get_dataset('{model}_input') returned None"
 print(f"   ✓ Retrieved input dataset: shape {input_via_pattern.shape}")
-assert input_via_pattern.equals(enriched_df), "❌ Wrong dataframe returned"
+assert input_via_pattern is enriched_df, "❌ Expected the stored dataframe, not a copy"
 print("   ✓ Correct dataframe (transactions_enriched)")
 
 # Test 4: Test convenience method ctx.get_model_input()
@@ -97,7 +98,7 @@ print("\n4. Test ctx.get_model_input('product_stats'):")
 input_via_method = ctx.get_model_input('product_stats')
 assert input_via_method is not None, "❌ get_model_input() returned None"
 print(f"   ✓ Retrieved input dataset: shape {input_via_method.shape}")
-assert input_via_method.equals(enriched_df), "❌ Wrong dataframe returned"
+assert input_via_method is enriched_df, "❌ Expected the stored dataframe, not a copy"
 print("   ✓ Correct dataframe (transactions_enriched)")
 
 # Test 5: Verify both methods return the same object
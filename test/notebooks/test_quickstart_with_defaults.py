@@ -25,6 +25,7 @@ base_cfg = {
     'client': 'quickstart_refactored',
     'analysis_dt': '2025-11-11',
     'log_level': 'INFO',
+    'quality_check': False,  # Full missing-value/duplicate scan of the raw data
     'fidx_config': {'type': 'local', 'path': 'feature_store'},
     
     # Default formats applied to all columns of each dtype (unless overridden)
@@ -104,9 +105,10 @@ print(f"[OK] Context initialized: {ctx.run_id}")
 
 # ### 4.1 Load
 
-# Load raw data
+# Load raw data (only the columns mapped in data_schema)
 loader = DataLoader()
-raw_data = loader.load_csv(base_cfg['input_file'])
+required_cols = [spec['source_column'] for spec in base_cfg['data_schema'].values()]
+raw_data = loader.load_csv(base_cfg['input_file'], usecols=required_cols)
 print(f"[OK] Loaded raw data: {raw_data.shape}")
 
 
@@ -114,7 +116,6 @@ print(f"[OK] Loaded raw data: {raw_data.shape}")
 
 # Validate required columns
 validator = DataValidator()
-required_cols = [spec['source_column'] for spec in base_cfg['data_schema'].values()]
 validation = validator.validate_required_columns(raw_data, required_cols)
 
 if validation.is_valid:
@@ -123,12 +124,13 @@ else:
     print(f"[X] Validation failed: {validation.errors}")
 
 
-# OPTIONAL Validate data quality
-quality_validation = validator.validate_data_quality(raw_data, base_cfg['data_schema'])
-if quality_validation.is_valid:
-    print(f"[OK] Quality validation passed")
-else:
-    print(f"[X] Quality validation issues: {quality_validation.issues}")
+# OPTIONAL Validate data quality (enable with base_cfg['quality_check'])
+if base_cfg.get('quality_check', False):
+    quality_validation = validator.validate_data_quality(raw_data, required_cols)
+    if not quality_validation.warnings:
+        print(f"[OK] Quality validation passed")
+    else:
+        print(f"[!] Quality validation warnings: {quality_validation.warnings}")
 
 
 # ### 4.3 Schema
@@ -315,6 +317,65 @@ print(f"  - Filter columns: {output['exec_fltrs']}")
 print(f"  - Attribute columns: {output['exec_attrs']}")
 
 
+# ### 8.1 Vectorized Cross-Check
+# 
+# The per-product attributes are plain group reductions, so they can also be
+# computed for all groups at once: factorize the group key into integer codes,
+# then `np.bincount` sums every group in a single pass over each column.
+
+codes, product_ids = pd.factorize(preprocessed_df['in_product_id'])
+has_group = codes >= 0  # NaN keys get code -1 and belong to no group
+group_codes = codes[has_group]
+group_rows = np.bincount(group_codes, minlength=len(product_ids))
+
+fast_attrs = pd.DataFrame({
+    'quantity_sum': np.bincount(group_codes, weights=preprocessed_df['in_quantity'].to_numpy(dtype=float)[has_group],
+                                minlength=len(product_ids)),
+    'price_sum': np.bincount(group_codes, weights=preprocessed_df['in_price_total'].to_numpy(dtype=float)[has_group],
+                             minlength=len(product_ids)),
+}, index=pd.Index(product_ids, name='in_product_id'))
+fast_attrs['price_avg'] = fast_attrs['price_sum'] / group_rows
+
+# Same products (and so the same shape) first, so a mismatch is reported
+# instead of np.allclose raising on incompatible shapes
+executor_attrs = output['attrs'].set_index('in_product_id')[fast_attrs.columns].sort_index()
+fast_attrs_sorted = fast_attrs.sort_index()
+attrs_match = (
+    executor_attrs.index.equals(fast_attrs_sorted.index)
+    and np.allclose(
+        executor_attrs.to_numpy(dtype=float),
+        fast_attrs_sorted.to_numpy(dtype=float),
+        equal_nan=True
+    )
+)
+print(f"[{'OK' if attrs_match else 'X'}] Vectorized attributes match executor output ({len(fast_attrs)} products)")
+assert attrs_match, (
+    f"Vectorized attributes differ from executor output "
+    f"({len(executor_attrs)} executor vs {len(fast_attrs_sorted)} vectorized products)"
+)
+
+# The Case 2 filter needs each row's group mean: index the per-product means
+# with each filter row's product code instead of running the UDF per group.
+filters = output['filters']
+row_codes = pd.Index(product_ids).get_indexer(filters['in_product_id'])
+in_group = row_codes >= 0
+fast_above_avg = (
+    filters['price_total'].to_numpy(dtype=float)[in_group]
+    > fast_attrs['price_avg'].to_numpy()[row_codes[in_group]]
+)
+# Every filter row with a product must belong to one of the input groups
+unknown_products = filters['in_product_id'].notna().to_numpy() & ~in_group
+filter_match = (
+    not unknown_products.any()
+    and np.array_equal(fast_above_avg, filters['price_above_avg'].to_numpy(dtype=bool)[in_group])
+)
+print(f"[{'OK' if filter_match else 'X'}] Vectorized price_above_avg matches executor output ({in_group.sum()} rows)")
+assert filter_match, (
+    f"Vectorized price_above_avg differs from executor output "
+    f"({unknown_products.sum()} rows with unknown products)"
+)
+
+
 # ## 9. View Results
 
 print("Available Datasets:")
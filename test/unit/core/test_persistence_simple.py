@@ -0,0 +1,99 @@
+"""
+Simple test script for persistence JSON files (no pytest required)
+
+Checks that config.json and execution_history.json are written exactly as
+stdlib json.dump wrote them, whether or not orjson is installed.
+"""
+
+import sys
+import json
+import math
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+import src.utils.file_utils as file_utils
+from src.core.context import GabedaContext
+from src.core.persistence import save_context_state
+
+
+def _save(tmpdir, cfg, history):
+    ctx = GabedaContext(cfg)
+    ctx.set_dataset('raw', pd.DataFrame({'a': [1, 2]}))
+    ctx.history = history
+    return Path(save_context_state(ctx, cfg, output_base=tmpdir, reuse_existing=False))
+
+
+def test_config_and_history_match_stdlib():
+    print("Testing config/history JSON output...")
+
+    cfg = {'client': 'test_persistence', 'threshold': float('nan'), 'label': 'café'}
+    history = [{'step': 'load', 'score': float('inf'), 'rows': 2}]
+
+    with_orjson = file_utils.orjson
+    try:
+        for orjson_module in (with_orjson, None):
+            file_utils.orjson = orjson_module
+            with tempfile.TemporaryDirectory() as tmpdir:
+                state_dir = _save(tmpdir, cfg, history)
+
+                config_bytes = (state_dir / 'config.json').read_bytes()
+                history_bytes = (state_dir / 'execution_history.json').read_bytes()
+                assert config_bytes == json.dumps(cfg, indent=2).encode('utf-8')
+                assert history_bytes == json.dumps(history, indent=2).encode('utf-8')
+
+                # NaN/Infinity are kept (not turned into null)
+                assert math.isnan(json.loads(config_bytes)['threshold'])
+                assert json.loads(history_bytes)[0]['score'] == float('inf')
+    finally:
+        file_utils.orjson = with_orjson
+
+    print("  [OK] config/history JSON output passed")
+
+
+def test_history_rejects_non_json_values():
+    print("Testing non-JSON history values...")
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            _save(tmpdir, {'client': 'test_persistence'}, [{'rows': np.int64(2)}])
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+
+    print("  [OK] non-JSON history values passed")
+
+
+def main():
+    print("=" * 60)
+    print("Running persistence tests...")
+    print("=" * 60)
+
+    try:
+        test_config_and_history_match_stdlib()
+        test_history_rejects_non_json_values()
+
+        print("=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n[ERROR] ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
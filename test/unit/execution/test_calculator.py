@@ -0,0 +1,93 @@
+"""
+Functional test for calculator.py filter calculation.
+
+Purpose: Verify that pass-through features (body is just `return <arg>`)
+skip the per-row call and still return the values np.vectorize would.
+"""
+
+import numpy as np
+
+from src.execution.calculator import FeatureCalculator, _passthrough_position
+
+
+def test_passthrough_detection():
+    """Test that only `return <positional arg>` bodies are pass-through."""
+    print("[TEST 1/2] Testing pass-through detection...")
+
+    def in_quantity(in_quantity: float) -> float:
+        """Input column as-is"""
+        return in_quantity
+
+    def second(price_total, price_avg):
+        return price_avg
+
+    def scaled(in_quantity):
+        return in_quantity * 2
+
+    def kw_only(in_quantity, *, factor=1):
+        return factor
+
+    assert _passthrough_position(in_quantity.__code__) == 0
+    assert _passthrough_position(second.__code__) == 1
+    assert _passthrough_position(scaled.__code__) is None
+    assert _passthrough_position(kw_only.__code__) is None
+
+    print("  ✓ Pass-through bodies detected, computed bodies ignored")
+    print("[OK] Pass-through detection works")
+
+
+def test_passthrough_filter_matches_vectorize():
+    """Test that pass-through filters return the same values without calling the function."""
+    print("[TEST 2/2] Testing pass-through filter results...")
+
+    calls = []
+
+    def in_quantity(in_quantity):
+        return in_quantity
+
+    def counted(in_quantity):
+        calls.append(in_quantity)
+        return in_quantity
+
+    calculator = FeatureCalculator()
+    values = np.array([1.5, 2.0, 3.25])
+
+    result = calculator.calculate_filter('in_quantity', in_quantity, [values])
+    assert np.array_equal(result, np.vectorize(in_quantity)(values))
+    assert not np.shares_memory(result, values)
+
+    # Scalar (attribute) arguments broadcast to the row count, as with np.vectorize
+    def price_avg_col(price_total, price_avg):
+        return price_avg
+
+    result = calculator.calculate_filter('price_avg_col', price_avg_col, [values, 2.5])
+    assert np.array_equal(result, np.full(3, 2.5))
+
+    # Non-pass-through functions are still called per row
+    calculator.calculate_filter('counted', counted, [values])
+    assert len(calls) >= len(values)
+
+    print("  ✓ Pass-through results match np.vectorize")
+    print("[OK] Pass-through filter calculation works")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Functional Tests for calculator.py")
+    print("=" * 60)
+    print()
+
+    try:
+        test_passthrough_detection()
+        print()
+        test_passthrough_filter_matches_vectorize()
+        print()
+        print("=" * 60)
+        print("✓ ALL FUNCTIONAL TESTS PASSED")
+        print("=" * 60)
+    except AssertionError as e:
+        print()
+        print("=" * 60)
+        print(f"✗ TEST FAILED: {e}")
+        print("=" * 60)
+        exit(1)
@@ -0,0 +1,117 @@
+"""
+Simple test script for DataLoader (no pytest required)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.preprocessing.loaders import DataLoader
+
+
+CSV_TEXT = (
+    "in_dt,in_product_id,in_quantity,in_price_total,in_description\n"
+    "2025-10-01,P1,2,100.5,first\n"
+    "2025-10-02,P2,1,20.0,second\n"
+    "2025-10-03,P1,3,75.25,third\n"
+    "2025-10-04,P3,5,10.0,fourth\n"
+)
+
+
+def write_test_csv(tmpdir):
+    """Write the sample transactions CSV and return its path"""
+    path = Path(tmpdir) / 'transactions.csv'
+    path.write_text(CSV_TEXT, encoding='utf-8')
+    return path
+
+
+def test_load_csv_full():
+    print("Testing load_csv without options...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        df = DataLoader().load_csv(write_test_csv(tmpdir))
+
+    assert df.shape == (4, 5)
+    assert list(df.columns) == ['in_dt', 'in_product_id', 'in_quantity', 'in_price_total', 'in_description']
+
+    print("  [OK] load_csv without options passed")
+
+
+def test_load_csv_usecols():
+    print("Testing load_csv usecols projection...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = write_test_csv(tmpdir)
+        loader = DataLoader()
+
+        # Only the requested columns are read, in file order
+        df = loader.load_csv(path, usecols=['in_price_total', 'in_product_id'])
+        assert list(df.columns) == ['in_product_id', 'in_price_total']
+        assert df['in_price_total'].tolist() == [100.5, 20.0, 75.25, 10.0]
+
+        # A requested column missing from the file is silently ignored
+        df = loader.load_csv(path, usecols=['in_product_id', 'in_cost_total'])
+        assert list(df.columns) == ['in_product_id']
+        assert len(df) == 4
+
+        # Any iterable of names works (e.g. a set of required columns)
+        df = loader.load_csv(path, usecols={'in_quantity'})
+        assert list(df.columns) == ['in_quantity']
+
+    print("  [OK] load_csv usecols projection passed")
+
+
+def test_load_csv_nrows():
+    print("Testing load_csv nrows limiting...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = write_test_csv(tmpdir)
+        loader = DataLoader()
+
+        df = loader.load_csv(path, nrows=2)
+        assert df.shape == (2, 5)
+        assert df['in_description'].tolist() == ['first', 'second']
+
+        # nrows combines with usecols
+        df = loader.load_csv(path, usecols=['in_quantity'], nrows=3)
+        assert df.shape == (3, 1)
+        assert df['in_quantity'].tolist() == [2, 1, 3]
+
+        # nrows past the end returns every row
+        assert len(loader.load_csv(path, nrows=100)) == 4
+
+    print("  [OK] load_csv nrows limiting passed")
+
+
+def main():
+    print("=" * 60)
+    print("Running loaders tests...")
+    print("=" * 60)
+
+    try:
+        test_load_csv_full()
+        test_load_csv_usecols()
+        test_load_csv_nrows()
+
+        print("=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n[ERROR] ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -65,6 +65,18 @@ def test_safe_get_no_warning_when_key_exists(caplog):
     assert len(caplog.records) == 0
 
 
+def test_safe_get_no_warning_when_value_is_none(caplog):
+    """Test safe_get doesn't log when key exists with an explicit None value"""
+    d = {'name': None}
+    logger = logging.getLogger('test_dict_utils')
+
+    with caplog.at_level(logging.WARNING):
+        result = safe_get(d, 'name', default='default', logger=logger, warn_missing=True)
+
+    assert result is None
+    assert len(caplog.records) == 0
+
+
 # ==================== normalize_to_list Tests ====================
 
 def test_normalize_to_list_none():
@@ -188,6 +200,20 @@ def test_merge_dicts_empty_updates():
     assert result == {'a': 1, 'b': 2}
 
 
+def test_merge_dicts_large_no_mutation():
+    """Test merge_dicts copy path for large dicts doesn't mutate base"""
+    base = {i: i for i in range(2000)}
+    updates = {0: 'updated', 5000: 'new'}
+
+    result = merge_dicts(base, updates, mutate=False)
+
+    assert result[0] == 'updated'
+    assert result[5000] == 'new'
+    assert len(result) == 2001
+    assert base[0] == 0  # Unchanged
+    assert result is not base
+
+
 # ==================== get_nested Tests ====================
 
 def test_get_nested_single_level():
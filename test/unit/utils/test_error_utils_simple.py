@@ -0,0 +1,244 @@
+"""
+Simple test script for error_utils (no pytest required)
+"""
+
+import sys
+import logging
+from pathlib import Path
+from io import StringIO
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.utils.error_utils import (
+    safe_execute_1arg,
+    make_safe,
+    SafeExecutor,
+    ErrorContext,
+    error_context,
+    try_or_none,
+    try_or_default,
+)
+
+
+def setup_test_logger():
+    """Create a logger that captures output"""
+    logger = logging.getLogger('test_error_utils')
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = []  # Clear existing handlers
+    logger.propagate = False
+
+    log_stream = StringIO()
+    handler = logging.StreamHandler(log_stream)
+    handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    logger.addHandler(handler)
+
+    return logger, log_stream
+
+
+def get_log_output(log_stream):
+    """Get current log output and reset"""
+    output = log_stream.getvalue()
+    log_stream.truncate(0)
+    log_stream.seek(0)
+    return output
+
+
+def test_safe_execute_1arg():
+    print("Testing safe_execute_1arg...")
+
+    logger, log_stream = setup_test_logger()
+
+    # Success path returns the result and logs nothing
+    assert safe_execute_1arg(int, '123', 0, logger=logger, context='Parsing') == 123
+    assert get_log_output(log_stream) == ''
+
+    # Exceptions return the default
+    assert safe_execute_1arg(int, 'abc') is None
+    assert safe_execute_1arg(int, 'abc', 0) == 0
+
+    # Errors are logged, with the context prefix when given
+    assert safe_execute_1arg(int, 'abc', -1, logger=logger, context='Parsing') == -1
+    output = get_log_output(log_stream)
+    assert output.startswith('ERROR: Parsing: ')
+    assert "'abc'" in output
+
+    assert safe_execute_1arg(int, 'abc', -1, logger=logger) == -1
+    assert get_log_output(log_stream).startswith('ERROR: invalid literal')
+
+    print("  [OK] safe_execute_1arg passed")
+
+
+def test_make_safe():
+    print("Testing make_safe...")
+
+    logger, log_stream = setup_test_logger()
+
+    parse_qty = make_safe(int, default=0, logger=logger, context='Parsing quantity')
+
+    # Success path keeps the wrapped function's arguments (positional and keyword)
+    assert parse_qty('5') == 5
+    assert parse_qty('ff', base=16) == 255
+    assert get_log_output(log_stream) == ''
+
+    # Exceptions return the default and are logged with the context
+    assert [parse_qty(v) for v in ['1', 'x', '3']] == [1, 0, 3]
+    output = get_log_output(log_stream)
+    assert output.count('ERROR: Parsing quantity: ') == 1
+
+    # Without a logger nothing is logged and the default is None
+    quiet = make_safe(lambda: 1 / 0)
+    assert quiet() is None
+    assert get_log_output(log_stream) == ''
+
+    print("  [OK] make_safe passed")
+
+
+def test_safe_executor():
+    print("Testing SafeExecutor...")
+
+    logger, log_stream = setup_test_logger()
+
+    run = SafeExecutor(logger=logger, context='Parsing rows', default=-1)
+
+    # __call__ and call_one success paths
+    assert run(int, '10', base=2) == 2
+    assert run.call_one(int, '7') == 7
+    assert run.call_one(str.upper, 'ab') == 'AB'
+    assert get_log_output(log_stream) == ''
+
+    # call_one returns the default on exceptions and logs with the context
+    assert run.call_one(int, 'x') == -1
+    output = get_log_output(log_stream)
+    assert output.startswith('ERROR: Parsing rows: ')
+
+    assert run(int, 'x') == -1
+    assert get_log_output(log_stream).startswith('ERROR: Parsing rows: ')
+
+    # Without context only the error text is logged; without logger nothing
+    assert SafeExecutor(logger=logger).call_one(int, 'x') is None
+    assert get_log_output(log_stream).startswith('ERROR: invalid literal')
+    assert SafeExecutor(default=0).call_one(int, 'x') == 0
+    assert get_log_output(log_stream) == ''
+
+    print("  [OK] SafeExecutor passed")
+
+
+def test_error_context():
+    print("Testing ErrorContext...")
+
+    logger, log_stream = setup_test_logger()
+
+    # The function-style name is the same class
+    assert error_context is ErrorContext
+
+    # Success path: no log, body runs
+    with error_context('Loading data', logger=logger) as value:
+        done = True
+    assert value is None
+    assert done
+    assert get_log_output(log_stream) == ''
+
+    # Errors are logged and re-raised by default
+    try:
+        with error_context('Loading data', logger=logger):
+            raise ValueError('bad file')
+        raise AssertionError('ValueError was not re-raised')
+    except ValueError as e:
+        assert str(e) == 'bad file'
+    assert get_log_output(log_stream) == 'ERROR: Error in Loading data: bad file\n'
+
+    # raise_on_error=False logs and suppresses
+    with ErrorContext('Optional operation', logger=logger, raise_on_error=False):
+        raise KeyError('missing')
+    assert 'Error in Optional operation: ' in get_log_output(log_stream)
+
+    # Without a logger errors are still suppressed
+    with ErrorContext('Quiet', raise_on_error=False):
+        1 / 0
+    assert get_log_output(log_stream) == ''
+
+    # Non-Exception errors always propagate and are not logged
+    try:
+        with error_context('Interrupted', logger=logger, raise_on_error=False):
+            raise KeyboardInterrupt
+        raise AssertionError('KeyboardInterrupt was suppressed')
+    except KeyboardInterrupt:
+        pass
+    assert get_log_output(log_stream) == ''
+
+    print("  [OK] ErrorContext passed")
+
+
+def test_try_or_default():
+    print("Testing try_or_default...")
+
+    # Plain decimal strings (int fast path)
+    assert try_or_default(int, 0, '123') == 123
+    assert try_or_default(int, 0, ' -42 ') == -42
+    assert try_or_default(int, 0, '+7') == 7
+
+    # Rejected strings return the default
+    assert try_or_default(int, 0, 'abc') == 0
+    assert try_or_default(int, 0, '') == 0
+    assert try_or_default(int, 0, '1.5') == 0
+
+    # Underscore grouping goes through int() itself
+    assert try_or_default(int, 0, '1_000') == 1000
+    assert try_or_default(int, 0, '1__000') == 0
+
+    # Digit strings over the int() conversion limit return the default
+    assert try_or_default(int, 0, '1' * 5000) == 0
+
+    # Other callables and argument types
+    assert try_or_default(float, -1.0, 'x') == -1.0
+    assert try_or_default(int, 0, 3.9) == 3
+    assert try_or_default(int, 0, '10', base=2) == 2
+
+    print("  [OK] try_or_default passed")
+
+
+def test_try_or_none():
+    print("Testing try_or_none...")
+
+    assert try_or_none(int, '123') == 123
+    assert try_or_none(int, 'abc') is None
+    assert try_or_none(int, '1' * 5000) is None
+    assert try_or_none(lambda: 1 / 0) is None
+    assert try_or_none(dict, a=1) == {'a': 1}
+
+    print("  [OK] try_or_none passed")
+
+
+def main():
+    print("=" * 60)
+    print("Running error_utils tests...")
+    print("=" * 60)
+
+    try:
+        test_safe_execute_1arg()
+        test_make_safe()
+        test_safe_executor()
+        test_error_context()
+        test_try_or_default()
+        test_try_or_none()
+
+        print("=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n[ERROR] ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
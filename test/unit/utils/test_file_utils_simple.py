@@ -11,15 +11,20 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import src.utils.file_utils as file_utils
 from src.utils.file_utils import (
     ensure_path_exists,
     ensure_directory,
     path_exists,
     find_matching_dirs,
     save_json,
+    save_json_many,
     load_json,
+    load_json_key,
+    peek_json_valid,
     get_file_size,
     normalize_path,
+    invalidate_path_cache,
 )
 
 
@@ -98,6 +103,70 @@ def test_path_exists():
     print("  [OK] path_exists passed")
 
 
+def test_path_cache_invalidation():
+    print("Testing path cache invalidation...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Misses are never cached, so writes through file_utils show up at once
+        json_file = Path(tmpdir) / 'cached.json'
+        assert path_exists(json_file) is False
+        save_json({'a': 1}, json_file)
+        assert path_exists(json_file, is_file=True) is True
+
+        new_dir = Path(tmpdir) / 'x' / 'y'
+        assert path_exists(new_dir) is False
+        ensure_directory(new_dir)
+        assert path_exists(new_dir, is_file=False) is True
+        assert path_exists(Path(tmpdir) / 'x') is True
+
+        # Explicit invalidation is still accepted for external writes
+        external = Path(tmpdir) / 'external.txt'
+        assert path_exists(external) is False
+        external.write_text('data')
+        invalidate_path_cache(external)
+        assert path_exists(external) is True
+
+    print("  [OK] path cache invalidation passed")
+
+
+def test_path_checks_not_stale():
+    print("Testing path checks after external changes...")
+
+    # Run with the (opt-in) cache enabled: results must still be current
+    cache_enabled = file_utils._PATH_CACHE_ENABLED
+    file_utils._PATH_CACHE_ENABLED = True
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Create after miss: a plain open() is seen without invalidation
+            created = Path(tmpdir) / 'created.txt'
+            assert path_exists(created) is False
+            with open(created, 'w') as f:
+                f.write('data')
+            assert path_exists(created, is_file=True) is True
+            assert ensure_path_exists(created, is_file=True) == created
+
+            # Delete after hit: ensure_directory recreates a removed directory
+            out_dir = Path(tmpdir) / 'out'
+            ensure_directory(out_dir)
+            assert path_exists(out_dir, is_file=False) is True
+            shutil.rmtree(out_dir)
+            ensure_directory(out_dir)
+            assert out_dir.is_dir()
+
+            # ...and ensure_path_exists raises for a removed file
+            created.unlink()
+            try:
+                ensure_path_exists(created, is_file=True)
+                assert False, "Should have raised FileNotFoundError"
+            except FileNotFoundError:
+                pass
+    finally:
+        file_utils._PATH_CACHE_ENABLED = cache_enabled
+        invalidate_path_cache()
+
+    print("  [OK] path checks after external changes passed")
+
+
 def test_find_matching_dirs():
     print("Testing find_matching_dirs...")
 
@@ -119,6 +188,13 @@ def test_find_matching_dirs():
         matches = find_matching_dirs(base, 'missing_*')
         assert len(matches) == 0
 
+        # Missing base or a file as base: no matches instead of an error
+        assert find_matching_dirs(base / 'missing', 'run_*') == []
+        base_file = base / 'notes.txt'
+        base_file.write_text('x')
+        assert find_matching_dirs(base_file, 'run_*') == []
+        assert find_matching_dirs(base_file, 'run_*/sub') == []
+
     print("  [OK] find_matching_dirs passed")
 
 
@@ -152,6 +228,26 @@ def test_save_and_load_json():
     print("  [OK] save_json and load_json passed")
 
 
+def test_load_json_key_and_peek():
+    print("Testing load_json_key and peek_json_valid...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_file = Path(tmpdir) / 'meta.json'
+        save_json({'run_id': 'r1', 'datasets': ['a']}, json_file)
+
+        assert load_json_key(json_file, 'run_id') == 'r1'
+        assert load_json_key(json_file, 'missing', default='x') == 'x'
+        assert load_json_key(Path(tmpdir) / 'missing.json', 'run_id', default='x') == 'x'
+
+        broken = Path(tmpdir) / 'broken.json'
+        broken.write_text('{"run_id": ')
+        assert peek_json_valid(json_file) is True
+        assert peek_json_valid(broken) is False
+        assert peek_json_valid(Path(tmpdir) / 'missing.json') is False
+
+    print("  [OK] load_json_key and peek_json_valid passed")
+
+
 def test_save_json_creates_parent_dirs():
     print("Testing save_json creates parent directories...")
 
@@ -170,6 +266,118 @@ def test_save_json_creates_parent_dirs():
     print("  [OK] save_json creates parent dirs passed")
 
 
+def test_save_json_many():
+    print("Testing save_json_many...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        items = [(base / 'model' / f'feature_{i}' / 'metadata.json', {'feature': i}) for i in range(5)]
+
+        # Parallel batch (creates parent directories)
+        save_json_many(items)
+        for path, data in items:
+            assert load_json(path) == data
+
+        # Small sequential batch (string paths)
+        save_json_many([(str(base / 'single.json'), {'a': 1})])
+        assert load_json(base / 'single.json') == {'a': 1}
+
+        # Unserializable payload writes nothing
+        try:
+            save_json_many([(base / 'ok.json', {'a': 1}), (base / 'bad.json', {'a': object()})])
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+        assert not (base / 'ok.json').exists()
+
+    print("  [OK] save_json_many passed")
+
+
+def test_json_stdlib_compatibility():
+    print("Testing save_json/load_json stdlib compatibility...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Files written by stdlib json (NaN literal) still load
+        nan_file = Path(tmpdir) / 'nan.json'
+        nan_file.write_text('{"value": NaN}')
+        loaded = load_json(nan_file)
+        assert loaded['value'] != loaded['value']  # NaN
+
+        # Non-default indent round-trips
+        indent_file = Path(tmpdir) / 'indent.json'
+        save_json({'a': [1, 2]}, indent_file, indent=4)
+        assert '    "a"' in indent_file.read_text()
+        assert load_json(indent_file) == {'a': [1, 2]}
+
+        # Memory-mapped load path returns the same data
+        assert load_json(nan_file, mmap_threshold_bytes=0)['value'] != 0
+        assert load_json(indent_file, mmap_threshold_bytes=0) == {'a': [1, 2]}
+
+        # Non-string keys are written as strings (stdlib behavior)
+        keys_file = Path(tmpdir) / 'keys.json'
+        save_json({1: 'one'}, keys_file)
+        assert load_json(keys_file) == {'1': 'one'}
+
+    print("  [OK] stdlib compatibility passed")
+
+
+def test_json_output_independent_of_orjson():
+    print("Testing JSON read/write parity with and without orjson...")
+
+    import enum
+    import json
+    import math
+    import uuid
+    import numpy as np
+
+    class Color(enum.Enum):
+        RED = 1
+
+    data = {
+        'nan': float('nan'),
+        'inf': float('inf'),
+        'text': 'caf\u00e9 \u2028 \x7f',
+        'floats': [1e16, 1e-05, 0.1, -0.0],
+        'wide_ints': [2 ** 70, -9809853295793400539],
+        1: 'int key',
+        'nested': {'a': [], 'b': {}, 'c': None},
+    }
+    expected = json.dumps(data, indent=2).encode('utf-8')
+
+    with_orjson = file_utils.orjson
+    try:
+        for orjson_module in (with_orjson, None):
+            file_utils.orjson = orjson_module
+            with tempfile.TemporaryDirectory() as tmpdir:
+                out = Path(tmpdir) / 'data.json'
+
+                # Writes are byte-identical to json.dumps
+                save_json(data, out)
+                assert out.read_bytes() == expected
+                save_json_many([(out, data)])
+                assert out.read_bytes() == expected
+
+                # Values json rejects still raise TypeError
+                for bad in (np.int64(1), Color.RED, uuid.uuid4()):
+                    try:
+                        save_json({'v': bad}, Path(tmpdir) / 'bad.json')
+                        assert False, f"Should have rejected {type(bad).__name__}"
+                    except TypeError:
+                        pass
+
+                # Reads equal json.loads (wide ints stay ints, NaN loads)
+                reference = json.loads(expected)
+                for threshold in (1024 * 1024, 0):
+                    loaded = load_json(out, mmap_threshold_bytes=threshold)
+                    assert math.isnan(loaded.pop('nan'))
+                    assert loaded == {k: v for k, v in reference.items() if k != 'nan'}
+                    assert loaded['wide_ints'] == [2 ** 70, -9809853295793400539]
+    finally:
+        file_utils.orjson = with_orjson
+
+    print("  [OK] JSON read/write parity passed")
+
+
 def test_get_file_size():
     print("Testing get_file_size...")
 
@@ -197,6 +405,11 @@ def test_normalize_path():
     assert isinstance(result, Path)
     assert result.is_absolute()
 
+    # Absolute path is normalized lexically
+    absolute = Path(tempfile.gettempdir()).resolve()
+    result = normalize_path(str(absolute / 'a' / '..' / 'file.csv'))
+    assert result == absolute / 'file.csv'
+
     print("  [OK] normalize_path passed")
 
 
@@ -271,9 +484,15 @@ def main():
         test_ensure_directory()
         test_ensure_path_exists()
         test_path_exists()
+        test_path_cache_invalidation()
+        test_path_checks_not_stale()
         test_find_matching_dirs()
         test_save_and_load_json()
         test_save_json_creates_parent_dirs()
+        test_load_json_key_and_peek()
+        test_save_json_many()
+        test_json_stdlib_compatibility()
+        test_json_output_independent_of_orjson()
         test_get_file_size()
         test_normalize_path()
         test_persistence_pattern()
@@ -23,6 +23,8 @@ from src.utils.log_utils import (
     log_count_summary,
     log_model_execution,
     log_progress,
+    snapshot_levels,
+    operation_scope,
     STATUS_SUCCESS,
     STATUS_WARNING,
     STATUS_ERROR,
@@ -117,6 +119,8 @@ def test_log_validation_result():
     assert 'validation failed' in output
     assert 'Error 1' in output
     assert 'Error 2' in output
+    # Errors share a single record (one level prefix for the group)
+    assert output.count('ERROR:') == 2
 
     # With warnings
     log_validation_result(logger, True, 'Optional fields', warnings=['Warning 1'])
@@ -162,6 +166,7 @@ def test_log_missing_column():
     output = get_log_output(log_stream)
     assert STATUS_WARNING in output
     assert 'Available columns' in output
+    assert output.count('WARNING:') == 1
 
     print("  [OK] log_missing_column passed")
 
@@ -276,9 +281,76 @@ def test_log_progress():
     output = get_log_output(log_stream)
     assert 'Processing row 100/100' in output
 
+    # Sampled: every 4th item plus the final one
+    for i in range(1, 11):
+        log_progress(logger, i, 10, sample_every=4)
+    output = get_log_output(log_stream)
+    assert output.count('Processing item') == 3
+    assert '4/10' in output and '8/10' in output and '10/10' in output
+
     print("  [OK] log_progress passed")
 
 
+def test_disabled_level_skips_output():
+    print("Testing helpers skip disabled levels...")
+
+    logger, log_stream = setup_test_logger()
+    logger.setLevel(logging.WARNING)
+
+    log_operation_start(logger, 'Loading data', file_path='/test.csv')
+    log_operation_complete(logger, 'Loading data', status='success', rows=10)
+    log_dependency_chain(logger, 'profit_margin', ['total_revenue'])
+    log_feature_execution(logger, 'margin_unit', 'filter', args_count=2)
+    log_progress(logger, 1, 10)
+    assert get_log_output(log_stream) == ''
+
+    # Enabled levels still emit
+    log_operation_complete(logger, 'Processing', status='warning')
+    assert STATUS_WARNING in get_log_output(log_stream)
+
+    print("  [OK] disabled level skip passed")
+
+
+def test_snapshot_levels():
+    print("Testing snapshot_levels...")
+
+    logger, _ = setup_test_logger()
+    assert logging.DEBUG in snapshot_levels(logger)
+
+    logger.setLevel(logging.WARNING)
+    levels = snapshot_levels(logger)
+    assert logging.DEBUG not in levels
+    assert logging.INFO not in levels
+    assert logging.WARNING in levels and logging.ERROR in levels
+
+    print("  [OK] snapshot_levels passed")
+
+
+def test_operation_scope():
+    print("Testing operation_scope...")
+
+    logger, log_stream = setup_test_logger()
+
+    with operation_scope(logger, 'Loading data', file_path='/test.csv'):
+        pass
+    output = get_log_output(log_stream)
+    assert 'Loading data... (file_path=/test.csv)' in output
+    assert f'{STATUS_SUCCESS} Loading data complete (file_path=/test.csv)' in output
+
+    try:
+        with operation_scope(logger, 'Saving'):
+            raise ValueError('boom')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('exception should propagate')
+    output = get_log_output(log_stream)
+    assert f'{STATUS_ERROR} Saving failed' in output
+    assert 'complete' not in output
+
+    print("  [OK] operation_scope passed")
+
+
 def test_status_constants():
     print("Testing status constants...")
 
@@ -371,6 +443,9 @@ def main():
         test_log_count_summary()
         test_log_model_execution()
         test_log_progress()
+        test_disabled_level_skips_output()
+        test_snapshot_levels()
+        test_operation_scope()
         test_status_constants()
         test_validators_pattern()
         test_loaders_pattern()
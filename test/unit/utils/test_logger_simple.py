@@ -0,0 +1,140 @@
+"""
+Simple test script for logger (no pytest required)
+"""
+
+import sys
+import time
+import logging
+import threading
+from pathlib import Path
+from io import StringIO
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.utils.logger import install_async_logging
+
+
+class _SlowHandler(logging.Handler):
+    """Handler that collects messages after a short delay (to fill the queue)"""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.messages = []
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.messages.append(record.getMessage())
+
+
+def setup_test_logger(name, handler):
+    """Create a logger with a single handler and no propagation"""
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = []
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def test_install_async_logging():
+    print("Testing install_async_logging...")
+
+    log_stream = StringIO()
+    handler = logging.StreamHandler(log_stream)
+    handler.setLevel(logging.INFO)
+    handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    logger = setup_test_logger('test_logger_async', handler)
+
+    listener = install_async_logging(logger)
+    assert handler not in logger.handlers
+
+    for i in range(50):
+        logger.info("record %d", i)
+    logger.debug("below handler level")
+    listener.stop()
+
+    # stop() flushes everything queued, in order, through the original formatter
+    lines = log_stream.getvalue().splitlines()
+    assert lines == [f"INFO: record {i}" for i in range(50)], lines[:3]
+
+    print("  [OK] install_async_logging passed")
+
+
+def test_async_logging_full_queue():
+    print("Testing async logging with a full queue...")
+
+    handler = _SlowHandler(delay=0.002)
+    logger = setup_test_logger('test_logger_async_full', handler)
+
+    # Callers wait for room while the listener runs; stop() tolerates a full queue
+    listener = install_async_logging(logger, maxsize=2)
+    for i in range(20):
+        logger.info("record %d", i)
+    listener.stop()
+    assert handler.messages == [f"record {i}" for i in range(20)]
+
+    print("  [OK] async logging with a full queue passed")
+
+
+def test_stop_restores_handlers():
+    print("Testing listener.stop() restores the original handlers...")
+
+    handler = _SlowHandler(delay=0)
+    logger = setup_test_logger('test_logger_async_restore', handler)
+
+    listener = install_async_logging(logger, maxsize=5)
+    logger.info("queued")
+    listener.stop()
+    assert logger.handlers == [handler]
+
+    # Logging after stop goes straight to the original handler, without blocking
+    done = threading.Event()
+
+    def log_after_stop():
+        for i in range(10):
+            logger.info("late %d", i)
+        done.set()
+
+    thread = threading.Thread(target=log_after_stop, daemon=True)
+    thread.start()
+    assert done.wait(timeout=5), "logging blocked after listener.stop()"
+    assert handler.messages == ["queued"] + [f"late {i}" for i in range(10)]
+
+    # A second stop (e.g. manual stop plus atexit) is a no-op
+    listener.stop()
+    assert logger.handlers == [handler]
+
+    print("  [OK] listener.stop() restores the original handlers passed")
+
+
+def main():
+    print("=" * 60)
+    print("Running logger tests...")
+    print("=" * 60)
+
+    try:
+        test_install_async_logging()
+        test_async_logging_full_queue()
+        test_stop_restores_handlers()
+
+        print("=" * 60)
+        print("[OK] ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    except Exception as e:
+        print(f"\n[ERROR] ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -44,6 +44,19 @@ def test_operation_result():
     assert 'success' in dict_result
     assert 'errors' in dict_result
 
+    # failure constructor
+    failed = OperationResult.failure('Load failed', {'path': 'a.csv'})
+    assert failed.success is False
+    assert failed.errors == ['Load failed']
+    assert failed.metadata == {'path': 'a.csv'}
+    assert OperationResult.failure('x').metadata == {}
+
+    # ok constructor returns independent instances
+    first, second = OperationResult.ok(), OperationResult.ok(data=5)
+    assert first.success and second.data == 5
+    first.add_warning('w')
+    assert second.warnings == []
+
     print("  [OK] OperationResult passed")
 
 